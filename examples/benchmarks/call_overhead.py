@@ -0,0 +1,93 @@
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Measure the Python overhead of stencil calls.
+
+For each backend, the overhead is the time spent in the stencil call outside of the computation
+itself, i.e. validating the arguments and computing the cache key of the domain and origin. The
+time of the generic cache key function is reported next to the one generated for the stencil
+class.
+
+Usage::
+
+    python examples/benchmarks/call_overhead.py --backend numpy --backend gt:cpu_ifirst
+"""
+
+import argparse
+import functools
+import statistics
+import timeit
+
+from gt4py import gtscript
+from gt4py import storage as gt_storage
+from gt4py.gtscript import PARALLEL, Field, computation, interval
+from gt4py.stencil_object import _compute_cache_key
+
+
+def copy_with_offset(
+    in_field: Field[float], out_field: Field[float], unused_field: Field[float], *, offset: float
+):
+    with computation(PARALLEL), interval(...):
+        out_field = in_field + offset  # noqa: F841 # local variable assigned to but never used
+
+
+def run_benchmark(backend: str, shape, calls: int) -> None:
+    stencil = gtscript.stencil(backend=backend, definition=copy_with_offset)
+    in_field, out_field, unused_field = (
+        gt_storage.ones(backend=backend, default_origin=(0, 0, 0), shape=shape, dtype=float)
+        for _ in range(3)
+    )
+
+    overheads = []
+    for _ in range(calls):
+        exec_info = {}
+        stencil(in_field, out_field, unused_field, offset=1.0, exec_info=exec_info)
+        call_time = exec_info["call_run_end_time"] - exec_info["call_run_start_time"]
+        run_time = exec_info["run_end_time"] - exec_info["run_start_time"]
+        overheads.append(call_time - run_time)
+
+    field_args = dict(in_field=in_field, out_field=out_field, unused_field=unused_field)
+    parameter_args = dict(offset=1.0)
+    generic_time, specialized_time = (
+        min(
+            timeit.repeat(
+                functools.partial(key_func, field_args, parameter_args, None, (0, 0, 0)),
+                number=1000,
+                repeat=5,
+            )
+        )
+        / 1000
+        for key_func in (_compute_cache_key, stencil._compute_cache_key)
+    )
+
+    print(
+        f"{backend:>16}: call overhead {statistics.median(overheads[1:]) * 1e6:8.1f} us, "
+        f"cache key generic {generic_time * 1e6:5.2f} us, "
+        f"specialized {specialized_time * 1e6:5.2f} us"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", "-b", action="append", dest="backends")
+    parser.add_argument("--shape", type=int, nargs=3, default=(4, 4, 4))
+    parser.add_argument("--calls", type=int, default=1000)
+    args = parser.parse_args()
+    for backend in args.backends or ["numpy", "gt:cpu_ifirst"]:
+        run_benchmark(backend, tuple(args.shape), args.calls)
+
+
+if __name__ == "__main__":
+    main()
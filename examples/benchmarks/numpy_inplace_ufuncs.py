@@ -0,0 +1,86 @@
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Compare the default and in-place ufunc lowering of the numpy backend.
+
+Each stencil is run with the `inplace_ufuncs` backend option off and on. The in-place mode
+writes intermediate results to reused scratch buffers instead of allocating a new array for
+each operation.
+
+Usage::
+
+    python examples/benchmarks/numpy_inplace_ufuncs.py --shape 192 192 80
+"""
+
+import argparse
+import functools
+import timeit
+
+import numpy as np
+
+from gt4py import gtscript
+from gt4py import storage as gt_storage
+from gt4py.gtscript import PARALLEL, Field, computation, exp, interval, log, sqrt
+
+
+def native_functions(in_field: Field[float], out_field: Field[float]):
+    with computation(PARALLEL), interval(...):
+        out_field = sqrt(  # noqa: F841 # local variable assigned to but never used
+            exp(in_field) + log(in_field + 1.0)
+        ) * (in_field - 0.5)
+
+
+def laplacian(in_field: Field[float], out_field: Field[float]):
+    with computation(PARALLEL), interval(...):
+        out_field = 4.0 * in_field[0, 0, 0] - (  # noqa: F841 # assigned, never used
+            in_field[1, 0, 0] + in_field[-1, 0, 0] + in_field[0, 1, 0] + in_field[0, -1, 0]
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--shape", type=int, nargs=3, default=(192, 192, 80))
+    parser.add_argument("--calls", type=int, default=3)
+    args = parser.parse_args()
+
+    halo = (1, 1, 0)
+    shape = tuple(size + 2 * h for size, h in zip(args.shape, halo))
+    rng = np.random.default_rng(0)
+    in_field, out_field = (
+        gt_storage.from_array(
+            rng.random(shape) + 0.5, backend="numpy", default_origin=halo, dtype=float
+        )
+        for _ in range(2)
+    )
+
+    for definition in (native_functions, laplacian):
+        times = []
+        for inplace_ufuncs in (False, True):
+            stencil = gtscript.stencil(
+                backend="numpy", definition=definition, inplace_ufuncs=inplace_ufuncs
+            )
+            call = functools.partial(
+                stencil, in_field, out_field, origin=halo, domain=tuple(args.shape)
+            )
+            call()
+            times.append(min(timeit.repeat(call, number=args.calls, repeat=3)) / args.calls)
+        print(
+            f"{definition.__name__:>16}: default {times[0] * 1e3:8.1f} ms, "
+            f"in-place {times[1] * 1e3:8.1f} ms per call"
+        )
+
+
+if __name__ == "__main__":
+    main()
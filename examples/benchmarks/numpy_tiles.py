@@ -0,0 +1,82 @@
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Measure the speedup of the thread-tiled execution mode of the numpy backend.
+
+A horizontal diffusion stencil is run with the `tiles` backend option set to each of the given
+values. NumPy releases the GIL in its ufunc loops, so the tiles scale with the number of cores.
+
+Usage::
+
+    python examples/benchmarks/numpy_tiles.py --tiles 1 2 4
+"""
+
+import argparse
+import functools
+import timeit
+
+import numpy as np
+
+from gt4py import gtscript
+from gt4py import storage as gt_storage
+from gt4py.gtscript import PARALLEL, Field, computation, interval
+
+
+def horizontal_diffusion(in_field: Field[float], out_field: Field[float], coeff: Field[float]):
+    with computation(PARALLEL), interval(...):
+        lap_field = 4.0 * in_field[0, 0, 0] - (
+            in_field[1, 0, 0] + in_field[-1, 0, 0] + in_field[0, 1, 0] + in_field[0, -1, 0]
+        )
+        res = lap_field[1, 0, 0] - lap_field[0, 0, 0]
+        flx_field = 0 if (res * (in_field[1, 0, 0] - in_field[0, 0, 0])) > 0 else res
+        res = lap_field[0, 1, 0] - lap_field[0, 0, 0]
+        fly_field = 0 if (res * (in_field[0, 1, 0] - in_field[0, 0, 0])) > 0 else res
+        out_field = in_field[0, 0, 0] - coeff[0, 0, 0] * (  # noqa: F841 # assigned, never used
+            flx_field[0, 0, 0] - flx_field[-1, 0, 0] + fly_field[0, 0, 0] - fly_field[0, -1, 0]
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tiles", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--shape", type=int, nargs=3, default=(192, 192, 80))
+    parser.add_argument("--calls", type=int, default=5)
+    args = parser.parse_args()
+
+    halo = (2, 2, 0)
+    shape = tuple(size + 2 * h for size, h in zip(args.shape, halo))
+    rng = np.random.default_rng(0)
+    in_field, out_field, coeff = (
+        gt_storage.from_array(rng.random(shape), backend="numpy", default_origin=halo, dtype=float)
+        for _ in range(3)
+    )
+
+    reference_time = None
+    for tiles in args.tiles:
+        stencil = gtscript.stencil(backend="numpy", definition=horizontal_diffusion, tiles=tiles)
+        call = functools.partial(
+            stencil, in_field, out_field, coeff, origin=halo, domain=tuple(args.shape)
+        )
+        call()
+        call_time = min(timeit.repeat(call, number=args.calls, repeat=3)) / args.calls
+        reference_time = reference_time or call_time
+        print(
+            f"tiles={tiles:<3}: {call_time * 1e3:8.1f} ms per call, "
+            f"speedup {reference_time / call_time:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
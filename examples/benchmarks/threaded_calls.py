@@ -0,0 +1,89 @@
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Measure the throughput of independent stencil calls from several Python threads.
+
+The same number of calls on independent storages is run sequentially and from a pool of
+threads. The C++ backends release the GIL during the computation, so the threaded calls scale
+with the number of cores.
+
+Usage::
+
+    python examples/benchmarks/threaded_calls.py --backend gt:cpu_ifirst --threads 4
+"""
+
+import argparse
+import concurrent.futures
+import timeit
+
+from gt4py import gtscript
+from gt4py import storage as gt_storage
+from gt4py.gtscript import PARALLEL, Field, computation, interval
+
+
+def smooth(in_field: Field[float], out_field: Field[float]):
+    with computation(PARALLEL), interval(...):
+        out_field = (  # noqa: F841 # local variable 'out_field' is assigned to but never used
+            in_field[-1, 0, 0] + in_field[1, 0, 0] + in_field[0, -1, 0] + in_field[0, 1, 0]
+        ) / 4.0
+
+
+def run_benchmark(backend: str, shape, n_threads: int, calls: int) -> None:
+    stencil = gtscript.stencil(backend=backend, definition=smooth)
+    storages = [
+        (
+            gt_storage.ones(backend=backend, default_origin=(1, 1, 0), shape=shape, dtype=float),
+            gt_storage.zeros(backend=backend, default_origin=(1, 1, 0), shape=shape, dtype=float),
+        )
+        for _ in range(n_threads)
+    ]
+
+    def run_calls(in_storage, out_storage):
+        for _ in range(calls):
+            stencil(in_storage, out_storage)
+
+    run_calls(*storages[0])
+
+    start = timeit.default_timer()
+    for in_storage, out_storage in storages:
+        run_calls(in_storage, out_storage)
+    sequential_time = timeit.default_timer() - start
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=n_threads) as pool:
+        start = timeit.default_timer()
+        for future in [pool.submit(run_calls, *args) for args in storages]:
+            future.result()
+        threaded_time = timeit.default_timer() - start
+
+    print(
+        f"{backend:>16}: {n_threads * calls} calls, sequential {sequential_time:.3f} s, "
+        f"{n_threads} threads {threaded_time:.3f} s, "
+        f"speedup {sequential_time / threaded_time:.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", "-b", action="append", dest="backends")
+    parser.add_argument("--shape", type=int, nargs=3, default=(66, 66, 80))
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+    for backend in args.backends or ["gt:cpu_ifirst"]:
+        run_benchmark(backend, tuple(args.shape), args.threads, args.calls)
+
+
+if __name__ == "__main__":
+    main()
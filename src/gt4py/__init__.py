@@ -33,4 +33,5 @@ __versioninfo__: Optional[Union[LegacyVersion, Version]] = parse(__version__)
 del DistributionNotFound, LegacyVersion, Version, get_distribution, parse
 
 from . import config, gtscript, storage
+from .batch_build import build_all
 from .stencil_object import StencilObject
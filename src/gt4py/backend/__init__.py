@@ -33,3 +33,9 @@ from .cuda_backend import CudaBackend  # noqa: F401
 from .gtcpp_backend import GTCpuIfirstBackend, GTCpuKfirstBackend, GTGpuBackend  # noqa: F401
 from .module_generator import BaseModuleGenerator
 from .numpy_backend import NumpyBackend  # noqa: F401
+
+
+try:
+    from .numba_backend import NumbaBackend  # noqa: F401
+except ImportError:
+    pass
@@ -15,11 +15,15 @@
 import abc
 import copy
 import hashlib
+import json
 import os
 import pathlib
+import re
+import shutil
 import time
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional, Tuple, Type, Union
 
+import gt4py
 from gt4py import definitions as gt_definitions
 from gt4py import utils as gt_utils
 
@@ -324,6 +328,14 @@ class PurePythonBackendCLIMixin(CLIBackendMixin):
         return super().generate_bindings(language_name)
 
 
+#: Prefixes of the symbol names and comments to which the gtcpp and cuir code generators append
+#: the `id()` of a node, followed by the id.
+_OBJECT_ID_PATTERN = re.compile(
+    r"(\b(?:GTComputationCall|HorizontalExecution|Loop|composite_|kernel_|loop_|m_|offset_)"
+    r"|// (?:HorizontalExecution|VerticalLoopSection|kernel|vertical loop) )(\d+)"
+)
+
+
 class BasePyExtBackend(BaseBackend):
     @property
     def pyext_module_name(self) -> str:
@@ -397,15 +409,125 @@ class BasePyExtBackend(BaseBackend):
             **pyext_build_opts,
         )
 
-        if uses_cuda:
-            module_name, file_path = pyext_builder.build_pybind_cuda_ext(**pyext_build_args)
-        else:
-            module_name, file_path = pyext_builder.build_pybind_ext(**pyext_build_args)
+        compiled_object_path = None
+        compiled_objects_path = self.builder.caching.compiled_objects_path
+        if compiled_objects_path and gt_utils.NOTHING not in pyext_sources.values():
+            compiled_object_path = compiled_objects_path / self.compiled_object_key(
+                pyext_sources, pyext_build_opts, uses_cuda=uses_cuda
+            )
 
-        assert module_name == qualified_pyext_name
+        cached = None
+        if compiled_object_path and not self.builder.options.rebuild:
+            cached = self._load_compiled_object(compiled_object_path, pyext_target_file_path)
+
+        if cached:
+            module_name, file_path = cached
+        else:
+            build_func = (
+                pyext_builder.build_pybind_cuda_ext if uses_cuda else pyext_builder.build_pybind_ext
+            )
+            start_time = time.perf_counter()
+            module_name, file_path = pyext_builder.run_build(build_func, **pyext_build_args)
+            build_info = self.builder.options.build_info
+            if build_info is not None:
+                build_info["compile_time"] = time.perf_counter() - start_time
+            assert module_name == qualified_pyext_name
+            if compiled_object_path:
+                self._store_compiled_object(compiled_object_path, pathlib.Path(file_path))
 
         self.builder.with_backend_data(
             {"pyext_module_name": module_name, "pyext_file_path": file_path}
         )
 
         return module_name, file_path
+
+    def compiled_object_key(
+        self,
+        pyext_sources: Dict[str, Any],
+        pyext_build_opts: Dict[str, Any],
+        *,
+        uses_cuda: bool = False,
+    ) -> str:
+        """
+        Compute the key of the extension module in the compiled objects cache.
+
+        The key is a hash of the sources, the build options and the compiler configuration. In
+        the sources, the stencil-specific module, class and stencil names are replaced by
+        placeholders and the object ids appended by the code generators to the names of some
+        symbols (see `_OBJECT_ID_PATTERN`) are numbered in order of appearance. The key is
+        therefore the same for all stencils generating the same code, while the stencil ID
+        depends on the definition function, the externals and the stencil name. Included headers
+        are only identified by their include paths, so after updating them in place a rebuild
+        has to be forced with the `rebuild` option.
+        """
+        placeholders = {
+            self.pyext_module_name: "__GT_PYEXT_MODULE_NAME__",
+            self.pyext_class_name: "__GT_PYEXT_CLASS_NAME__",
+        }
+        # the stencil name is used as name of the computation function and its namespace
+        stencil_name_pattern = re.compile(
+            rf"\b{re.escape(self.builder.options.name)}(?=\b|_impl_\b)"
+        )
+        object_ids: Dict[str, str] = {}
+        sources = {}
+        for file_name in sorted(pyext_sources):
+            source = pyext_sources[file_name]
+            for name in sorted(placeholders, key=len, reverse=True):
+                source = source.replace(name, placeholders[name])
+            source = stencil_name_pattern.sub("__GT_STENCIL_NAME__", source)
+            sources[file_name] = _OBJECT_ID_PATTERN.sub(
+                lambda match: match.group(1)
+                + object_ids.setdefault(match.group(2), f"__GT_ID{len(object_ids)}__"),
+                source,
+            )
+        build_opts = {
+            key: value
+            for key, value in pyext_build_opts.items()
+            if key not in ("verbose", "clean", "precompiled_header_dir")
+        }
+        key_data = {
+            "backend": self.name,
+            "gt4py_version": gt4py.__version__,
+            "sources": sources,
+            "build_opts": build_opts,
+            "compiler": pyext_builder.get_compiler_info(uses_cuda=uses_cuda),
+        }
+        return hashlib.sha256(
+            json.dumps(key_data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _load_compiled_object(
+        self, compiled_object_path: pathlib.Path, target_path: pathlib.Path
+    ) -> Optional[Tuple[str, str]]:
+        """Copy a cached extension module next to the stencil module and return its names."""
+        if not compiled_object_path.is_dir():
+            return None
+        cached_files = sorted(
+            path for path in compiled_object_path.iterdir() if not path.name.startswith(".")
+        )
+        if not cached_files:
+            return None
+        file_path = target_path / cached_files[0].name
+        if not file_path.exists():
+            target_path.mkdir(parents=True, exist_ok=True)
+            _copy_file_atomically(cached_files[0], file_path)
+        # The extension module keeps the name it was compiled with, as its init function is
+        # derived from it, and is imported as module of the stencil package under that name.
+        package_name = self.pyext_module_path.rpartition(".")[0]
+        module_name = file_path.name.split(".")[0]
+        return f"{package_name}.{module_name}" if package_name else module_name, str(file_path)
+
+    def _store_compiled_object(
+        self, compiled_object_path: pathlib.Path, file_path: pathlib.Path
+    ) -> None:
+        compiled_object_path.mkdir(parents=True, exist_ok=True)
+        cached_file_path = compiled_object_path / file_path.name
+        if not cached_file_path.exists():
+            _copy_file_atomically(file_path, cached_file_path)
+
+
+def _copy_file_atomically(src: pathlib.Path, dest: pathlib.Path) -> None:
+    """Copy a file such that concurrent readers never see a partially written destination."""
+    tmp_path = dest.parent / f".{dest.name}.{os.getpid()}.tmp"
+    shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dest)
@@ -0,0 +1,193 @@
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Build the extension modules of many stencils into a single shared library."""
+
+import os
+import pathlib
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+from eve.codegen import MakoTemplate as as_mako
+from gt4py import config as gt_config
+
+from . import pyext_builder
+from .gtc_common import BaseGTBackend
+
+
+if TYPE_CHECKING:
+    from gt4py.stencil_builder import StencilBuilder
+
+
+#: Compiles the bindings of one stencil into a function registering them in a submodule of the
+#: bundle, instead of the init function of an extension module of their own.
+ENTRY_TEMPLATE = as_mako(
+    """\
+// Bindings of the stencil "${stencil_name}", generated by gt4py.
+#include <pybind11/pybind11.h>
+#undef PYBIND11_MODULE
+#define PYBIND11_MODULE(name, variable) void ${entry_function}(::pybind11::module &variable)
+#include "${bindings_path}"
+"""
+)
+
+#: Init function of the bundle, registering each stencil in a submodule named after it.
+BUNDLE_TEMPLATE = as_mako(
+    """\
+// Extension module bundling the stencils ${", ".join(entries)}, generated by gt4py.
+#include <pybind11/pybind11.h>
+% for entry_function in entries.values():
+void ${entry_function}(::pybind11::module &);
+% endfor
+PYBIND11_MODULE(${module_name}, m) {
+% for stencil_name, entry_function in entries.items():
+    {
+        auto submodule = m.def_submodule("${stencil_name}");
+        ${entry_function}(submodule);
+    }
+% endfor
+}
+"""
+)
+
+#: Python module exposing the stencil objects bound to the bundle.
+LOADER_TEMPLATE = as_mako(
+    '''\
+"""Stencil objects compiled into the extension module bundle "${module_name}"."""
+import pathlib
+
+from gt4py import utils as gt_utils
+
+
+_root_path = pathlib.Path(__file__).parent.resolve()
+
+% for stencil_name, (module_qualname, module_path, class_name) in stencils.items():
+${stencil_name} = getattr(
+    gt_utils.make_module_from_file("${module_qualname}", f"{_root_path}/${module_path}"),
+    "${class_name}",
+)()
+% endfor
+'''
+)
+
+
+def _entry_function(stencil_name: str) -> str:
+    return f"gt4py_bundle_entry_{stencil_name}"
+
+
+def build_bundle(
+    builders: Sequence["StencilBuilder"], *, name: str, output_path: pathlib.Path
+) -> pathlib.Path:
+    """
+    Build the extension modules of stencils into a single one, and generate their stencil modules.
+
+    Each stencil is bound to a submodule of the bundle, named after the stencil. Besides the
+    stencil modules, which are written where the caching strategy of the builders places them,
+    a loader module instantiating all stencil objects is generated.
+
+    Parameters
+    ----------
+        builders : `sequence` of :class:`gt4py.stencil_builder.StencilBuilder`
+            Builders of the stencils, with a backend generating C++ extension modules. All of them
+            must use the same backend, and have different names.
+
+        name : `str`
+            Name of the loader module, the extension module is named `_{name}`.
+
+        output_path : `pathlib.Path`
+            Path where the loader and extension modules are written, and the bundle sources in
+            the `{name}_src` subdirectory.
+
+    Returns
+    -------
+        `pathlib.Path`
+            Path of the loader module.
+    """
+    backends = {builder.backend.name for builder in builders}
+    if len(backends) > 1:
+        raise ValueError(f"Stencils of different backends can not be bundled: {backends}")
+    names = [builder.options.name for builder in builders]
+    if len(set(names)) < len(names):
+        raise ValueError(f"Stencils with the same name can not be bundled: {names}")
+    for builder in builders:
+        if not isinstance(builder.backend, BaseGTBackend):
+            raise ValueError(f"Backend '{builder.backend.name}' does not generate extensions")
+
+    module_name = f"_{name}"
+    src_path = output_path / f"{name}_src"
+    src_path.mkdir(parents=True, exist_ok=True)
+    sources: List[str] = []
+    entries: Dict[str, str] = {}
+    uses_cuda = False
+    for builder in builders:
+        stencil_name = builder.options.name
+        stencil_src_path = src_path / stencil_name
+        stencil_src_path.mkdir(exist_ok=True)
+        stencil_sources = builder.backend.make_extension_sources(stencil_ir=builder.gtir)
+        for file_name, source in stencil_sources["computation"].items():
+            (stencil_src_path / file_name).write_text(source)
+            if pathlib.Path(file_name).suffix not in (".h", ".hpp"):
+                sources.append(str(stencil_src_path / file_name))
+        ((bindings_name, bindings_source),) = stencil_sources["bindings"].items()
+        (stencil_src_path / bindings_name).write_text(bindings_source)
+        bindings_suffix = pathlib.Path(bindings_name).suffix
+        uses_cuda = uses_cuda or bindings_suffix == ".cu"
+
+        entries[stencil_name] = _entry_function(stencil_name)
+        entry_path = src_path / f"{stencil_name}_entry{bindings_suffix}"
+        entry_path.write_text(
+            ENTRY_TEMPLATE.render(
+                stencil_name=stencil_name,
+                entry_function=entries[stencil_name],
+                bindings_path=f"{stencil_name}/{bindings_name}",
+            )
+        )
+        sources.append(str(entry_path))
+
+    bundle_path = src_path / "bundle.cpp"
+    bundle_path.write_text(BUNDLE_TEMPLATE.render(module_name=module_name, entries=entries))
+    sources.append(str(bundle_path))
+
+    build_func = (
+        pyext_builder.build_pybind_cuda_ext if uses_cuda else pyext_builder.build_pybind_ext
+    )
+    pyext_module_name = f"{gt_config.code_settings['root_package_name']}.{module_name}"
+    _, pyext_file_path = pyext_builder.run_build(
+        build_func,
+        name=pyext_module_name,
+        sources=sources,
+        build_path=str(src_path / "build"),
+        target_path=str(output_path),
+        **builders[0].backend.make_pyext_build_opts(uses_cuda=uses_cuda),
+    )
+
+    loader_path = output_path / f"{name}.py"
+    stencils: Dict[str, Tuple[str, str, str]] = {}
+    for builder in builders:
+        module_path = builder.module_path
+        module_path.parent.mkdir(parents=True, exist_ok=True)
+        module_path.write_text(
+            builder.backend.make_module_source(
+                pyext_module_name=pyext_module_name,
+                pyext_file_path=pyext_file_path,
+                pyext_bundle_entry=builder.options.name,
+            )
+        )
+        stencils[builder.options.name] = (
+            builder.module_qualname,
+            pathlib.PurePath(os.path.relpath(module_path, loader_path.parent)).as_posix(),
+            builder.class_name,
+        )
+    loader_path.write_text(LOADER_TEMPLATE.render(module_name=module_name, stencils=stencils))
+
+    return loader_path
@@ -115,10 +115,15 @@ class CudaBindingsCodegen(codegen.TemplatedGenerator):
         assert "module_name" in kwargs
         entry_params = self.visit(node.params, external_arg=True, **kwargs)
         sid_params = self.visit(node.params, external_arg=False, **kwargs)
+        sid_fields = [
+            param.name if isinstance(param, cuir.FieldDecl) else None for param in node.params
+        ]
         return self.generic_visit(
             node,
             entry_params=entry_params,
             sid_params=sid_params,
+            sid_fields=sid_fields,
+            cache_sids=self.backend.storage_info["device"] == "cpu",
             **kwargs,
         )
 
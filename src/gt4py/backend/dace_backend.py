@@ -13,7 +13,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 import os
 import re
-from typing import TYPE_CHECKING, Dict, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
 
 import dace
 import numpy as np
@@ -368,7 +368,9 @@ class DaCeBindingsCodegen:
         return list(res[node.name] for node in stencil_ir.params if node.name in res)
 
     def generate_sid_params(self, sdfg: dace.SDFG):
+        """Return the computation arguments and the field name (`None` for scalars) of each."""
         res = []
+        fields: List[Optional[str]] = []
         import dace.data
 
         for name, array in sdfg.arrays.items():
@@ -396,18 +398,22 @@ class DaCeBindingsCodegen:
             )
 
             res.append(sid_def)
+            fields.append(name)
         # pass scalar parameters as variables
         for name in (n for n in sdfg.symbols.keys() if not n.startswith("__")):
             res.append(name)
-        return res
+            fields.append(None)
+        return res, fields
 
     def generate_sdfg_bindings(self, stencil_ir: gtir.Stencil, sdfg, module_name):
-
+        sid_params, sid_fields = self.generate_sid_params(sdfg)
         return self.mako_template.render_values(
             name=sdfg.name,
             module_name=module_name,
             entry_params=self.generate_entry_params(stencil_ir, sdfg),
-            sid_params=self.generate_sid_params(sdfg),
+            sid_params=sid_params,
+            sid_fields=sid_fields,
+            cache_sids=self.backend.storage_info["device"] == "cpu",
         )
 
     @classmethod
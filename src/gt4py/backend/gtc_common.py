@@ -25,6 +25,7 @@ import numpy as np
 import gtc.utils as gtc_utils
 from eve.codegen import MakoTemplate as as_mako
 from gt4py import backend as gt_backend
+from gt4py import config as gt_config
 from gt4py import utils as gt_utils
 from gt4py.backend import Backend
 from gt4py.backend.module_generator import BaseModuleGenerator, ModuleData
@@ -92,10 +93,50 @@ def pybuffer_to_sid(
     return sid_def
 
 
+#: Headers included by the bindings of every stencil (see :func:`bindings_main_template`), which
+#: are compiled into a precompiled header shared by the extension modules.
+BINDINGS_INCLUDES = [
+    "chrono",
+    "cstdint",
+    "functional",
+    "memory",
+    "tuple",
+    "vector",
+    "pybind11/numpy.h",
+    "pybind11/pybind11.h",
+    "pybind11/stl.h",
+    "gridtools/storage/adapter/python_sid_adapter.hpp",
+    "gridtools/stencil/cartesian.hpp",
+    "gridtools/stencil/global_parameter.hpp",
+    "gridtools/sid/sid_shift_origin.hpp",
+    "gridtools/sid/rename_dimensions.hpp",
+]
+
+
 def bindings_main_template():
+    """Template of the pybind11 module wrapping the computation.
+
+    Expects the values:
+        - `sid_params`: C++ expressions building the computation arguments.
+        - `sid_fields`: field name of each expression in `sid_params`, or `None` for scalars.
+        - `cache_sids`: keep the field SIDs of the last call, keyed on the data pointer,
+          dtype kind and size, shape, strides and origin of the NumPy arrays, to skip
+          converting the buffers again when a stencil is called repeatedly with the same
+          storages.
+    """
     return as_mako(
         """
+        <%
+            cached_fields = [(i, field) for i, field in enumerate(sid_fields) if field is not None] if cache_sids else []
+            cached_index = {i: j for j, (i, _) in enumerate(cached_fields)}
+        %>
         #include <chrono>
+        #include <cstdint>
+        #include <functional>
+        #include <memory>
+        #include <tuple>
+        #include <vector>
+        #include <pybind11/numpy.h>
         #include <pybind11/pybind11.h>
         #include <pybind11/stl.h>
         #include <gridtools/storage/adapter/python_sid_adapter.hpp>
@@ -106,6 +147,51 @@ def bindings_main_template():
         #include "computation.hpp"
         namespace gt = gridtools;
         namespace py = ::pybind11;
+        namespace {
+            // Capsules of computations bound to their arguments hold a `std::function<void()>`,
+            // with the function running it as context. Only this function pointer is used by
+            // `run_bound_computations`, so capsules of all stencil modules can be run together.
+            constexpr char const* bound_computation_name = "gt4py.bound_computation";
+
+            void run_bound_computation(void* computation) {
+                (*static_cast<std::function<void()>*>(computation))();
+            }
+
+            py::capsule make_bound_computation(std::function<void()>&& computation) {
+                auto capsule = py::reinterpret_steal<py::capsule>(PyCapsule_New(
+                    new std::function<void()>(std::move(computation)),
+                    bound_computation_name,
+                    [](PyObject* capsule) {
+                        delete static_cast<std::function<void()>*>(
+                            PyCapsule_GetPointer(capsule, bound_computation_name));
+                    }));
+                if (!capsule || PyCapsule_SetContext(
+                        capsule.ptr(), reinterpret_cast<void*>(&run_bound_computation)) != 0)
+                    throw py::error_already_set();
+                return capsule;
+            }
+        }
+        % if cached_fields:
+        namespace {
+            // Append data pointer, dtype kind and size, shape, strides and origin of a NumPy
+            // array to the SID cache key. Other buffer types cannot be cached.
+            template <class Origin>
+            bool append_sid_key(std::vector<std::intptr_t>& key, py::handle buffer, Origin const& origin) {
+                if (!py::isinstance<py::array>(buffer))
+                    return false;
+                auto array = py::reinterpret_borrow<py::array>(buffer);
+                key.push_back(reinterpret_cast<std::intptr_t>(array.data()));
+                key.push_back(array.dtype().kind());
+                key.push_back(array.itemsize());
+                for (py::ssize_t i = 0; i < array.ndim(); ++i) {
+                    key.push_back(array.shape(i));
+                    key.push_back(array.strides(i));
+                }
+                key.insert(key.end(), origin.begin(), origin.end());
+                return true;
+            }
+        }
+        % endif
         PYBIND11_MODULE(${module_name}, m) {
             m.def("run_computation", [](
             ${','.join(["std::array<gt::uint_t, 3> domain", *entry_params, 'py::object exec_info'])}
@@ -118,7 +204,34 @@ def bindings_main_template():
                             std::chrono::high_resolution_clock::now().time_since_epoch()).count())/1e9;
                 }
 
-                ${name}(domain)(${','.join(sid_params)});
+                % if cached_fields:
+                using cached_sids_t = decltype(std::make_tuple(${','.join(sid_params[i] for i, _ in cached_fields)}));
+                static std::vector<std::intptr_t> cached_key;
+                static std::unique_ptr<cached_sids_t> cached_sids;
+                std::vector<std::intptr_t> key;
+                bool is_cacheable = true;
+                % for _, field in cached_fields:
+                is_cacheable = is_cacheable && append_sid_key(key, ${field}, ${field}_origin);
+                % endfor
+                if (!is_cacheable || !cached_sids || key != cached_key) {
+                    cached_sids.reset(new cached_sids_t(std::make_tuple(${','.join(sid_params[i] for i, _ in cached_fields)})));
+                    cached_key = is_cacheable ? std::move(key) : std::vector<std::intptr_t>();
+                }
+                % endif
+                % for i, param in enumerate(sid_params):
+                % if i in cached_index:
+                auto arg_${i} = std::get<${cached_index[i]}>(*cached_sids);
+                % else:
+                auto arg_${i} = ${param};
+                % endif
+                % endfor
+
+                {
+                    // The SIDs have been created from the Python buffers, so the computation
+                    // does not touch any Python object and other threads can run meanwhile
+                    py::gil_scoped_release release;
+                    ${name}(domain)(${','.join("arg_%d" % i for i in range(len(sid_params)))});
+                }
 
                 if (!exec_info.is(py::none()))
                 {
@@ -128,7 +241,31 @@ def bindings_main_template():
                             std::chrono::high_resolution_clock::now().time_since_epoch()).count()/1e9);
                 }
 
-            }, "Runs the given computation");}
+            }, "Runs the given computation");
+
+            m.def("bind_computation", [](
+            ${','.join(["std::array<gt::uint_t, 3> domain", *entry_params])}
+            ){
+                return make_bound_computation(
+                    [${','.join(["domain", *("arg_%d = %s" % (i, param) for i, param in enumerate(sid_params))])}]() mutable {
+                        ${name}(domain)(${','.join("arg_%d" % i for i in range(len(sid_params)))});
+                    });
+            }, "Binds the computation to the given arguments, without running it");
+
+            m.def("run_bound_computations", [](std::vector<py::capsule> computations) {
+                std::vector<std::pair<void (*)(void*), void*>> calls;
+                for (auto const& computation : computations) {
+                    void* function = PyCapsule_GetPointer(computation.ptr(), bound_computation_name);
+                    if (!function)
+                        throw py::error_already_set();
+                    calls.emplace_back(
+                        reinterpret_cast<void (*)(void*)>(PyCapsule_GetContext(computation.ptr())),
+                        function);
+                }
+                py::gil_scoped_release release;
+                for (auto const& call : calls)
+                    call.first(call.second);
+            }, "Runs computations bound by the bind_computation functions of any stencil modules");}
         """
     )
 
@@ -143,15 +280,23 @@ def gtir_has_effect(pipeline: GtirPipeline) -> bool:
 
 
 class PyExtModuleGenerator(BaseModuleGenerator):
-    """Module Generator for use with backends that generate c++ python extensions."""
+    """
+    Module Generator for use with backends that generate c++ python extensions.
+
+    If `pyext_bundle_entry` is passed, the extension module is a bundle of several stencils
+    (see :func:`gt4py.backend.bundle.build_bundle`), and the stencil uses its submodule of that
+    name.
+    """
 
     pyext_module_name: Optional[str]
     pyext_file_path: Optional[str]
+    pyext_bundle_entry: Optional[str]
 
     def __init__(self):
         super().__init__()
         self.pyext_module_name = None
         self.pyext_file_path = None
+        self.pyext_bundle_entry = None
 
     def __call__(
         self,
@@ -161,6 +306,7 @@ class PyExtModuleGenerator(BaseModuleGenerator):
     ) -> str:
         self.pyext_module_name = kwargs["pyext_module_name"]
         self.pyext_file_path = kwargs["pyext_file_path"]
+        self.pyext_bundle_entry = kwargs.get("pyext_bundle_entry", None)
         return super().__call__(args_data, builder, **kwargs)
 
     def _is_not_empty(self) -> bool:
@@ -172,15 +318,23 @@ class PyExtModuleGenerator(BaseModuleGenerator):
         source = [*super().generate_imports().splitlines(), "from gt4py import utils as gt_utils"]
         if self._is_not_empty():
             assert self.pyext_file_path is not None
+            if self.pyext_bundle_entry:
+                relative_path = os.path.relpath(
+                    self.pyext_file_path, self.builder.module_path.parent
+                )
+                entry = f".{self.pyext_bundle_entry}"
+            else:
+                relative_path = os.path.basename(self.pyext_file_path)
+                entry = ""
             file_path = 'f"{{pathlib.Path(__file__).parent.resolve()}}/{}"'.format(
-                os.path.basename(self.pyext_file_path)
+                pathlib.PurePath(relative_path).as_posix()
             )
             source.append(
                 textwrap.dedent(
                     f"""
                 pyext_module = gt_utils.make_module_from_file(
                     "{self.pyext_module_name}", {file_path}, public_import=True
-                )
+                ){entry}
                 """
                 )
             )
@@ -191,26 +345,47 @@ class PyExtModuleGenerator(BaseModuleGenerator):
             return False
         return gtir_has_effect(self.builder.gtir_pipeline)
 
-    def generate_implementation(self) -> str:
+    def _computation_args(self) -> List[str]:
         ir = self.builder.gtir
-        sources = gt_utils.text.TextBlock(indent_size=BaseModuleGenerator.TEMPLATE_INDENT_SIZE)
-
         params_decls = {decl.name: decl for decl in ir.params}
-        args: List[str] = []
+        args: List[str] = ["list(_domain_)"]
         for arg in ir.api_signature:
             if arg.name not in self.args_data.unreferenced:
                 args.append(arg.name)
                 if isinstance(params_decls.get(arg.name, None), gtir.FieldDecl):
                     args.append("list(_origin_['{}'])".format(arg.name))
+        return args
+
+    def _binds_computation(self) -> bool:
+        return self._has_effect()
+
+    def generate_class_members(self) -> str:
+        res = super().generate_class_members()
+        if self._binds_computation():
+            signature = ", ".join([*self.args_data.field_names, *self.args_data.parameter_names])
+            res += textwrap.dedent(
+                f"""
+                def _bind_run(self, _domain_, _origin_, *, {signature}):
+                    return (
+                        pyext_module.bind_computation({", ".join(self._computation_args())}),
+                        pyext_module.run_bound_computations,
+                    )
+                """
+            )
+        return res
+
+    def generate_implementation(self) -> str:
+        sources = gt_utils.text.TextBlock(indent_size=BaseModuleGenerator.TEMPLATE_INDENT_SIZE)
 
         # only generate implementation if any multi_stages are present. e.g. if no statement in the
         # stencil has any effect on the API fields, this may not be the case since they could be
         # pruned.
         if self._has_effect():
+            args = ",".join([*self._computation_args(), "exec_info"])
             source = textwrap.dedent(
                 f"""
                 # Load or generate a GTComputation object for the current domain size
-                pyext_module.run_computation({",".join(["list(_domain_)", *args, "exec_info"])})
+                pyext_module.run_computation({args})
                 """
             )
             sources.extend(source.splitlines())
@@ -253,6 +428,11 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
     def generate(self) -> Type["StencilObject"]:
         pass
 
+    @property
+    def precompiled_includes(self) -> List[str]:
+        """Headers included by the extension sources of all stencils of the backend."""
+        return [*BINDINGS_INCLUDES]
+
     def generate_computation(self) -> Dict[str, Union[str, Dict]]:
         dir_name = f"{self.builder.options.name}_src"
         src_files = self.make_extension_sources(stencil_ir=self.builder.gtir)
@@ -305,17 +485,7 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
             start_time = next_time
 
         # Build extension module
-        pyext_opts = dict(
-            verbose=self.builder.options.backend_opts.get("verbose", False),
-            clean=self.builder.options.backend_opts.get("clean", False),
-            **gt_backend.pyext_builder.get_gt_pyext_build_opts(
-                debug_mode=self.builder.options.backend_opts.get("debug_mode", False),
-                add_profile_info=self.builder.options.backend_opts.get("add_profile_info", False),
-                uses_cuda=uses_cuda,
-                gt_version=2,
-            ),
-        )
-
+        pyext_opts = self.make_pyext_build_opts(uses_cuda=uses_cuda)
         result = self.build_extension_module(gt_pyext_sources, pyext_opts, uses_cuda=uses_cuda)
 
         for filename, content in gt_pyext_files.get("info", {}).items():
@@ -329,6 +499,26 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
 
         return result
 
+    def make_pyext_build_opts(self, *, uses_cuda: bool = False) -> Dict[str, Any]:
+        """Collect the options to build the extension module from the backend options."""
+        pyext_opts = dict(
+            verbose=self.builder.options.backend_opts.get("verbose", False),
+            clean=self.builder.options.backend_opts.get("clean", False),
+            **gt_backend.pyext_builder.get_gt_pyext_build_opts(
+                debug_mode=self.builder.options.backend_opts.get("debug_mode", False),
+                add_profile_info=self.builder.options.backend_opts.get("add_profile_info", False),
+                uses_cuda=uses_cuda,
+                gt_version=2,
+            ),
+        )
+        precompiled_headers_path = self.builder.caching.precompiled_headers_path
+        if precompiled_headers_path and gt_config.build_settings["precompiled_headers"]:
+            pyext_opts.update(
+                precompiled_includes=self.precompiled_includes,
+                precompiled_header_dir=str(precompiled_headers_path),
+            )
+        return pyext_opts
+
     def make_extension_sources(self, *, stencil_ir: gtir.Stencil) -> Dict[str, Dict[str, str]]:
         """Generate the source for the stencil independently from use case."""
         if "computation_src" in self.builder.backend_data:
@@ -350,6 +540,12 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
 
 
 class CUDAPyExtModuleGenerator(PyExtModuleGenerator):
+    def _binds_computation(self) -> bool:
+        # replays in native code would skip the synchronization after each computation
+        return super()._binds_computation() and not self.builder.options.backend_opts.get(
+            "device_sync", True
+        )
+
     def generate_implementation(self) -> str:
         source = super().generate_implementation()
         if self.builder.options.backend_opts.get("device_sync", True):
@@ -12,7 +12,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
 from eve import codegen
 from gt4py import gt_src_manager
@@ -118,10 +118,15 @@ class GTCppBindingsCodegen(codegen.TemplatedGenerator):
         assert "module_name" in kwargs
         entry_params = self.visit(node.parameters, external_arg=True, **kwargs)
         sid_params = self.visit(node.parameters, external_arg=False, **kwargs)
+        sid_fields = [
+            param.name if isinstance(param, gtcpp.FieldDecl) else None for param in node.parameters
+        ]
         return self.generic_visit(
             node,
             entry_params=entry_params,
             sid_params=sid_params,
+            sid_fields=sid_fields,
+            cache_sids=kwargs["backend"].storage_info["device"] == "cpu",
             **kwargs,
         )
 
@@ -140,6 +145,14 @@ class GTBaseBackend(BaseGTBackend, CLIBackendMixin):
     options = BaseGTBackend.GT_BACKEND_OPTS
     PYEXT_GENERATOR_CLASS = GTExtGenerator  # type: ignore
 
+    @property
+    def precompiled_includes(self) -> List[str]:
+        return [
+            *super().precompiled_includes,
+            f"gridtools/stencil/{self.GT_BACKEND_T}.hpp",
+            "gridtools/stencil/positional.hpp",
+        ]
+
     def _generate_extension(self, uses_cuda: bool) -> Tuple[str, str]:
         return self.make_extension(stencil_ir=self.builder.gtir, uses_cuda=uses_cuda)
 
@@ -148,6 +148,7 @@ class BaseModuleGenerator(abc.ABC):
             gt_options=self.generate_options(),
             stencil_signature=self.generate_signature(),
             field_names=self.args_data.field_names,
+            cache_key_field_names=self.generate_cache_key_field_names(),
             param_names=self.args_data.parameter_names,
             pre_run=self.generate_pre_run(),
             post_run=self.generate_post_run(),
@@ -316,6 +317,19 @@ class BaseModuleGenerator(abc.ABC):
 
         return signature
 
+    def generate_cache_key_field_names(self) -> List[str]:
+        """
+        Return the names of the fields taking part in the call arguments cache key.
+
+        Must match the order used by :func:`gt4py.stencil_object._make_cache_key_function`
+        so that the generated ``__call__`` and ``StencilObject._call_run`` share cache entries.
+        """
+        return [
+            name
+            for name, info in self.args_data.field_info.items()
+            if info.access != AccessKind.NONE
+        ]
+
     def generate_pre_run(self) -> str:
         """Additional code to be run just before the run method (implementation) is called."""
         return ""
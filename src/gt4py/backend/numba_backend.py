@@ -0,0 +1,140 @@
+# GT4Py - GridTools Framework
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Type, Union, cast
+
+import numba  # noqa: F401  # the backend is only registered if numba is available
+
+from eve.codegen import format_source
+from gt4py.backend.base import BaseBackend, BaseModuleGenerator, CLIBackendMixin, register
+from gt4py.backend.gtc_common import (
+    debug_is_compatible_layout,
+    debug_is_compatible_type,
+    debug_layout,
+)
+from gt4py.backend.numpy_backend import recursive_write
+from gtc import oir
+from gtc.gtir_to_oir import GTIRToOIR
+from gtc.numba.numba_codegen import NumbaCodegen
+from gtc.passes.oir_optimizations.caches import (
+    IJCacheDetection,
+    KCacheDetection,
+    PruneKCacheFills,
+    PruneKCacheFlushes,
+)
+from gtc.passes.oir_pipeline import DefaultPipeline, OirPipeline
+
+
+if TYPE_CHECKING:
+    from gt4py.stencil_object import StencilObject
+
+
+class NumbaModuleGenerator(BaseModuleGenerator):
+    def generate_imports(self) -> str:
+        comp_pkg = (
+            self.builder.caching.module_prefix + "computation" + self.builder.caching.module_postfix
+        )
+        return "\n".join(
+            [
+                *super().generate_imports().splitlines(),
+                "import pathlib",
+                "from gt4py.utils import make_module_from_file",
+                # Numba imports the module by name to load the functions cached on disk
+                f'computation = make_module_from_file("{comp_pkg}", pathlib.Path(__file__).parent / "{comp_pkg}.py", public_import=True)',
+            ]
+        )
+
+    def generate_implementation(self) -> str:
+        params = [f"{p.name}={p.name}" for p in self.builder.gtir.params]
+        params.extend(["_domain_=_domain_", "_origin_=_origin_"])
+        return f"computation.run({', '.join(params)})"
+
+    @property
+    def backend(self) -> "NumbaBackend":
+        return cast(NumbaBackend, self.builder.backend)
+
+
+@register
+class NumbaBackend(BaseBackend, CLIBackendMixin):
+    """Numba backend using gtc.
+
+    The stencils are lowered from OIR to explicit loop nests, compiled by Numba at the first
+    call and cached on disk next to the generated module.
+    """
+
+    name = "numba"
+    options: ClassVar[Dict[str, Any]] = {
+        "oir_pipeline": {"versioning": True, "type": OirPipeline},
+        "parallel": {"versioning": True, "type": bool},
+    }
+    storage_info = {
+        "alignment": 1,
+        "device": "cpu",
+        "layout_map": debug_layout,
+        "is_compatible_layout": debug_is_compatible_layout,
+        "is_compatible_type": debug_is_compatible_type,
+    }
+    languages = {"computation": "python", "bindings": ["python"]}
+    MODULE_GENERATOR_CLASS = NumbaModuleGenerator
+    GTIR_KEY = "gtc:gtir"
+
+    def generate_computation(self) -> Dict[str, Union[str, Dict]]:
+        computation_name = (
+            self.builder.caching.module_prefix
+            + "computation"
+            + self.builder.caching.module_postfix
+            + ".py"
+        )
+
+        source = NumbaCodegen.apply(
+            self.oir, parallel=self.builder.options.backend_opts.get("parallel", True)
+        )
+        if self.builder.options.format_source:
+            source = format_source("python", source)
+
+        return {computation_name: source}
+
+    def generate_bindings(self, language_name: str) -> Dict[str, Union[str, Dict]]:
+        super().generate_bindings(language_name)
+        return {self.builder.module_path.name: self.make_module_source()}
+
+    def generate(self) -> Type["StencilObject"]:
+        self.check_options(self.builder.options)
+        src_dir = self.builder.module_path.parent
+        if not self.builder.options._impl_opts.get("disable-code-generation", False):
+            src_dir.mkdir(parents=True, exist_ok=True)
+            recursive_write(src_dir, self.generate_computation())
+        return self.make_module()
+
+    def _make_oir(self) -> oir.Stencil:
+        base_oir = GTIRToOIR().visit(self.builder.gtir)
+        oir_pipeline = self.builder.options.backend_opts.get(
+            "oir_pipeline",
+            DefaultPipeline(
+                skip=[
+                    IJCacheDetection,
+                    KCacheDetection,
+                    PruneKCacheFills,
+                    PruneKCacheFlushes,
+                ]
+            ),
+        )
+        return oir_pipeline.run(base_oir)
+
+    @property
+    def oir(self) -> oir.Stencil:
+        key = "gtcnumba:oir"
+        if key not in self.builder.backend_data:
+            self.builder.with_backend_data({key: self._make_oir()})
+        return self.builder.backend_data[key]
@@ -27,6 +27,7 @@ from gtc.numpy import npir
 from gtc.numpy.npir_codegen import NpirCodegen
 from gtc.numpy.oir_to_npir import OirToNpir
 from gtc.numpy.scalars_to_temps import ScalarsToTemporaries
+from gtc.numpy.serial_loop_fission import SerialLoopFission
 from gtc.passes.oir_optimizations.caches import (
     IJCacheDetection,
     KCacheDetection,
@@ -54,6 +55,15 @@ class ModuleGenerator(BaseModuleGenerator):
             ]
         )
 
+    def generate_class_members(self) -> str:
+        res = super().generate_class_members()
+        res += (
+            "\ndef clear_temporaries(self):\n"
+            '    """Free the temporary buffers kept between calls of the stencil."""\n'
+            "    computation.clear_temporaries()\n"
+        )
+        return res
+
     def generate_implementation(self) -> str:
         params = [f"{p.name}={p.name}" for p in self.builder.gtir.params]
         params.extend(["_domain_=_domain_", "_origin_=_origin_"])
@@ -83,6 +93,9 @@ class NumpyBackend(BaseBackend, CLIBackendMixin):
         "oir_pipeline": {"versioning": True, "type": OirPipeline},
         # TODO: Implement this option in source code
         "ignore_np_errstate": {"versioning": True, "type": bool},
+        "tiles": {"versioning": True, "type": int},
+        "inplace_ufuncs": {"versioning": True, "type": bool},
+        "sparse_mask_density": {"versioning": True, "type": float},
     }
     storage_info = {
         "alignment": 1,
@@ -104,7 +117,13 @@ class NumpyBackend(BaseBackend, CLIBackendMixin):
         )
 
         ignore_np_errstate = self.builder.options.backend_opts.get("ignore_np_errstate", True)
-        source = NpirCodegen.apply(self.npir, ignore_np_errstate=ignore_np_errstate)
+        source = NpirCodegen.apply(
+            self.npir,
+            ignore_np_errstate=ignore_np_errstate,
+            tiles=self.builder.options.backend_opts.get("tiles", 1),
+            inplace_ufuncs=self.builder.options.backend_opts.get("inplace_ufuncs", False),
+            sparse_mask_density=self.builder.options.backend_opts.get("sparse_mask_density"),
+        )
         if self.builder.options.format_source:
             source = format_source("python", source)
 
@@ -138,6 +157,7 @@ class NumpyBackend(BaseBackend, CLIBackendMixin):
         oir_node = oir_pipeline.run(base_oir)
         base_npir = OirToNpir().visit(oir_node)
         npir_node = ScalarsToTemporaries().visit(base_npir)
+        npir_node = SerialLoopFission().visit(npir_node)
         return npir_node
 
     @property
@@ -12,22 +12,51 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import concurrent.futures
 import contextlib
-import copy
-import distutils
-import distutils.sysconfig
-import io
+import contextvars
+import hashlib
+import json
 import os
+import shlex
 import shutil
-from typing import Any, Dict, List, Optional, Tuple, Type, Union, overload
+import subprocess
+import sysconfig
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union, overload
 
 import pybind11
-import setuptools
-from setuptools.command.build_ext import build_ext
 
 from gt4py import config as gt_config
 
 
+#: Runs the build functions of this module when set. :func:`gt4py.build_all` sets it to build the
+#: extension modules of concurrently built stencils in a pool of worker processes.
+build_runner: contextvars.ContextVar[Optional[Callable[..., Tuple[str, str]]]]
+build_runner = contextvars.ContextVar("build_runner", default=None)
+
+
+def run_build(build_func: Callable[..., Tuple[str, str]], **kwargs: Any) -> Tuple[str, str]:
+    """Call one of the extension build functions, through the current build runner if set."""
+    runner = build_runner.get()
+    if runner is None:
+        return build_func(**kwargs)
+    return runner(build_func, **kwargs)
+
+
+def get_compiler_info(*, uses_cuda: bool = False) -> Dict[str, Any]:
+    """Collect the compiler configuration which the built extension modules depend on."""
+    compiler, linker = _get_toolchain()
+    info: Dict[str, Any] = {
+        "compiler": compiler,
+        "linker": linker,
+        "ext_suffix": sysconfig.get_config_var("EXT_SUFFIX"),
+    }
+    if uses_cuda:
+        info["cuda_bin_path"] = gt_config.build_settings["cuda_bin_path"]
+    return info
+
+
 def get_dace_module_path() -> Optional[str]:
     try:
         import dace
@@ -109,7 +138,7 @@ def get_gt_pyext_build_opts(
             *extra_compile_args_from_config["nvcc"],
         ],
     )
-    extra_link_args = gt_config.build_settings["extra_link_args"]
+    extra_link_args = [*gt_config.build_settings["extra_link_args"]]
 
     mode_flags = ["-O0", "-ggdb"] if debug_mode else ["-O3", "-DNDEBUG"]
     extra_compile_args["cxx"].extend(mode_flags)
@@ -183,73 +212,111 @@ def build_pybind_ext(
     libraries: Optional[List[str]] = None,
     extra_compile_args: Optional[Union[List[str], Dict[str, List[str]]]] = None,
     extra_link_args: Optional[List[str]] = None,
-    build_ext_class: Type = None,
+    precompiled_includes: Optional[List[str]] = None,
+    precompiled_header_dir: Optional[str] = None,
     verbose: bool = False,
     clean: bool = False,
 ) -> Tuple[str, str]:
-
-    # Hack to remove warning about "-Wstrict-prototypes" not having effect in C++
-    replaced_flags_backup = copy.deepcopy(distutils.sysconfig._config_vars)
-    _clean_build_flags(distutils.sysconfig._config_vars)
-
+    """
+    Compile and link a pybind11 extension module by invoking the compiler directly.
+
+    The sources are compiled concurrently. The compiler and linker commands and flags are
+    taken from the configuration of the Python interpreter, as `setuptools` would, except for
+    optimization, debugging and profiling flags which are set by the build options. Nothing but
+    files in `build_path` and the extension module itself is written, which is replaced
+    atomically, so that extension modules can be built concurrently from several threads or
+    processes.
+
+    `extra_compile_args` can be a dict with `"cxx"` and `"nvcc"` arguments to compile CUDA
+    (`.cu`) sources with nvcc.
+
+    If `precompiled_includes` and `precompiled_header_dir` are given, the C++ sources are
+    compiled with a precompiled header of these includes, which is built once for each compiler
+    command and flags and stored in `precompiled_header_dir`. It is rebuilt if any of the headers
+    it depends on changes.
+
+    Returns the name and file path of the built extension module.
+    """
     include_dirs = include_dirs or []
     library_dirs = library_dirs or []
     libraries = libraries or []
     extra_compile_args = extra_compile_args or []
     extra_link_args = extra_link_args or []
-
-    # Build extension module
-    py_extension = setuptools.Extension(
-        name,
-        sources,
-        include_dirs=[pybind11.get_include(), pybind11.get_include(user=True), *include_dirs],
-        library_dirs=[*library_dirs],
-        libraries=[*libraries],
-        language="c++",
-        extra_compile_args=extra_compile_args,
-        extra_link_args=extra_link_args,
-    )
-
-    setuptools_args = dict(
-        name=name,
-        ext_modules=[py_extension],
-        script_args=[
-            "build_ext",
-            # "--parallel={}".format(gt_config.build_settings["parallel_jobs"]),
-            "--build-temp={}".format(build_path),
-            "--build-lib={}".format(build_path),
-            "--force",
-        ],
-    )
-    if build_ext_class is not None:
-        setuptools_args["cmdclass"] = {"build_ext": build_ext_class}
-
-    if verbose:
-        setuptools_args["script_args"].append("-v")
-        setuptools.setup(**setuptools_args)
+    if isinstance(extra_compile_args, dict):
+        cxx_args, nvcc_args = extra_compile_args["cxx"], extra_compile_args.get("nvcc", [])
     else:
-        setuptools_args["script_args"].append("-q")
-        io_out, io_err = io.StringIO(), io.StringIO()
-        with contextlib.redirect_stdout(io_out), contextlib.redirect_stderr(io_err):
-            setuptools.setup(**setuptools_args)
-
-    # Copy extension in target path
-    module_name = py_extension._full_name
-    file_path = py_extension._file_name
-    src_path = os.path.join(build_path, file_path)
-    dest_path = os.path.join(target_path, os.path.basename(file_path))
-    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    distutils.file_util.copy_file(src_path, dest_path, verbose=verbose)
+        cxx_args, nvcc_args = extra_compile_args, []
+
+    compiler_command, linker_command = _get_toolchain()
+    include_opts = [
+        f"-I{include_dir}"
+        for include_dir in dict.fromkeys(
+            [
+                pybind11.get_include(),
+                pybind11.get_include(user=True),
+                *include_dirs,
+                sysconfig.get_paths()["include"],
+                sysconfig.get_paths()["platinclude"],
+            ]
+        )
+    ]
+
+    cxx_include_opts = include_opts
+    if precompiled_includes and precompiled_header_dir:
+        if any(os.path.splitext(source)[-1] != ".cu" for source in sources):
+            precompiled_header = _get_precompiled_header(
+                [*compiler_command, *include_opts],
+                cxx_args,
+                precompiled_includes,
+                precompiled_header_dir,
+                verbose=verbose,
+            )
+            if precompiled_header:
+                cxx_include_opts = [*include_opts, "-include", precompiled_header]
+
+    os.makedirs(build_path, exist_ok=True)
+    commands = []
+    objects = []
+    for source in sources:
+        # mirror the source path, like setuptools, to support sources with the same name
+        source_path = os.path.splitdrive(os.path.abspath(source))[1].lstrip(os.sep)
+        obj = os.path.join(build_path, source_path + ".o")
+        os.makedirs(os.path.dirname(obj), exist_ok=True)
+        if os.path.splitext(source)[-1] == ".cu":
+            nvcc_exec = os.path.join(gt_config.build_settings["cuda_bin_path"], "nvcc")
+            compiler, args = [nvcc_exec, *include_opts], nvcc_args
+        else:
+            compiler, args = [*compiler_command, *cxx_include_opts], cxx_args
+        commands.append([*compiler, "-c", source, "-o", obj, *args])
+        objects.append(obj)
+    _run_commands(commands, verbose=verbose)
+
+    # Link into a temporary file next to the target, which is then moved in place
+    module_name = name
+    file_name = name.rpartition(".")[-1] + sysconfig.get_config_var("EXT_SUFFIX")
+    os.makedirs(target_path, exist_ok=True)
+    dest_path = os.path.join(target_path, file_name)
+    tmp_path = os.path.join(target_path, f".{file_name}.{os.getpid()}.{threading.get_ident()}")
+    link_command = [
+        *linker_command,
+        *objects,
+        *(f"-L{library_dir}" for library_dir in library_dirs),
+        *(f"-l{library}" for library in libraries),
+        "-o",
+        tmp_path,
+        *extra_link_args,
+    ]
+    try:
+        _run_commands([link_command], verbose=verbose)
+        os.replace(tmp_path, dest_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
     # Final cleaning
     if clean:
         shutil.rmtree(build_path)
 
-    # Restore original distutils flag config to not break functionality with "-Wstrict-prototypes"-hack for other
-    # tools using distutils.
-    for key, value in replaced_flags_backup.items():
-        distutils.sysconfig._config_vars[key] = value
-
     return module_name, dest_path
 
 
@@ -276,6 +343,8 @@ def build_pybind_cuda_ext(
     libraries: Optional[List[str]] = None,
     extra_compile_args: Optional[Union[List[str], Dict[str, List[str]]]] = None,
     extra_link_args: Optional[List[str]] = None,
+    precompiled_includes: Optional[List[str]] = None,
+    precompiled_header_dir: Optional[str] = None,
     verbose: bool = False,
     clean: bool = False,
 ) -> Tuple[str, str]:
@@ -300,54 +369,180 @@ def build_pybind_cuda_ext(
         libraries=libraries,
         extra_compile_args=extra_compile_args,
         extra_link_args=extra_link_args,
-        build_ext_class=CUDABuildExtension,
+        precompiled_includes=precompiled_includes,
+        precompiled_header_dir=precompiled_header_dir,
     )
 
 
-def _clean_build_flags(config_vars: Dict[str, str]) -> None:
-    for key, value in config_vars.items():
-        if type(value) == str:
-            value = " " + value + " "
-            for s in value.split(" "):
-                if (
-                    s in ["-Wstrict-prototypes", "-DNDEBUG", "-pg"]
-                    or s.startswith("-O")
-                    or s.startswith("-g")
-                ):
-                    value = value.replace(" " + s + " ", " ")
-            config_vars[key] = " ".join(value.split())
-
-
-class CUDABuildExtension(build_ext, object):
-    # Refs:
-    #   - https://github.com/pytorch/pytorch/torch/utils/cpp_extension.py
-    #   - https://github.com/rmcgibbo/npcuda-example/blob/master/cython/setup.py
-    #
-    def build_extensions(self) -> None:
-        # Register .cu  source extensions
-        self.compiler.src_extensions.append(".cu")
-
-        # Save references to the original methods
-        original_compile = self.compiler._compile
-
-        def nvcc_compile(obj, src, ext, cc_args, extra_postargs, pp_opts):
-            original_compiler_so = self.compiler.compiler_so
-            # Copy before we make any modifications.
-            cflags = copy.deepcopy(extra_postargs)
-            try:
-                if os.path.splitext(src)[-1] == ".cu":
-                    nvcc_exec = os.path.join(gt_config.build_settings["cuda_bin_path"], "nvcc")
-                    self.compiler.set_executable("compiler_so", [nvcc_exec])
-                    if isinstance(cflags, dict):
-                        cflags = cflags["nvcc"]
-                elif isinstance(cflags, dict):
-                    cflags = cflags["cxx"]
-
-                original_compile(obj, src, ext, cc_args, cflags, pp_opts)
-            finally:
-                # Put the original compiler back in place.
-                self.compiler.set_executable("compiler_so", original_compiler_so)
-
-        self.compiler._compile = nvcc_compile
-        build_ext.build_extensions(self)
-        self.compiler._compile = original_compile
+def _clean_build_flags(flags: str) -> List[str]:
+    """Split flags and remove those which are controlled by the build options."""
+    return [
+        flag
+        for flag in shlex.split(flags)
+        if not (
+            flag in ["-Wstrict-prototypes", "-DNDEBUG", "-pg"]
+            or flag.startswith("-O")
+            or flag.startswith("-g")
+        )
+    ]
+
+
+def _get_toolchain() -> Tuple[List[str], List[str]]:
+    """
+    Get the commands compiling objects and linking extension modules for this interpreter.
+
+    Follow :func:`distutils.sysconfig.customize_compiler`, including the overrides by the
+    `CC`, `CXX`, `LDSHARED`, `CFLAGS`, `CPPFLAGS` and `LDFLAGS` environment variables.
+    """
+    cc, cxx, cflags, ccshared, ldshared = sysconfig.get_config_vars(
+        "CC", "CXX", "CFLAGS", "CCSHARED", "LDSHARED"
+    )
+    if "CC" in os.environ:
+        if "LDSHARED" not in os.environ and ldshared.startswith(cc):
+            ldshared = os.environ["CC"] + ldshared[len(cc) :]
+        cc = os.environ["CC"]
+    cxx = os.environ.get("CXX", cxx)
+    ldshared = os.environ.get("LDSHARED", ldshared)
+    if "LDFLAGS" in os.environ:
+        ldshared += " " + os.environ["LDFLAGS"]
+    for var in ("CFLAGS", "CPPFLAGS"):
+        if var in os.environ:
+            cflags += " " + os.environ[var]
+            ldshared += " " + os.environ[var]
+
+    linker = _clean_build_flags(ldshared)
+    # C++ extensions are linked by the C++ compiler, as setuptools does
+    linker[0] = shlex.split(cxx)[0]
+    compiler = [*shlex.split(cc), *_clean_build_flags(cflags), *shlex.split(ccshared)]
+    return compiler, linker
+
+
+def _get_precompiled_header(
+    compiler: List[str],
+    args: List[str],
+    includes: List[str],
+    precompiled_header_dir: str,
+    *,
+    verbose: bool,
+) -> Optional[str]:
+    """
+    Get the header to include for using a precompiled header of the includes, building it if needed.
+
+    The precompiled header is stored in a subdirectory of `precompiled_header_dir` identified by
+    the compiler command, the flags and the includes, next to the header it is built from, so
+    that it is picked up by GCC and Clang when that header is included. The dependencies written
+    by the compiler are used to detect headers which changed since it was built. If it can not be
+    built, `None` is returned and the sources are compiled without.
+    """
+    key = hashlib.sha256(json.dumps([compiler, args, includes]).encode()).hexdigest()
+    pch_dir = os.path.join(precompiled_header_dir, key)
+    header_path = os.path.join(pch_dir, "gt4py_precompiled.hpp")
+    pch_path = header_path + ".gch"
+    dep_path = os.path.join(pch_dir, "gt4py_precompiled.d")
+    failed_path = os.path.join(pch_dir, "failed")
+
+    if os.path.exists(failed_path):
+        return None
+    if _is_up_to_date(pch_path, dep_path):
+        return header_path
+
+    os.makedirs(pch_dir, exist_ok=True)
+    suffix = f".{os.getpid()}.{threading.get_ident()}"
+    tmp_header_path = header_path + suffix
+    with open(tmp_header_path, "w") as header_file:
+        header_file.write("".join(f"#include <{include}>\n" for include in includes))
+    os.replace(tmp_header_path, header_path)
+    command = [
+        *compiler,
+        "-x",
+        "c++-header",
+        header_path,
+        "-o",
+        pch_path + suffix,
+        "-MD",
+        "-MF",
+        dep_path + suffix,
+        *args,
+    ]
+    try:
+        _run_commands([command], verbose=verbose)
+    except RuntimeError as error:
+        if verbose:
+            print(f"Compiling without precompiled header: {error}")
+        with open(failed_path, "w") as failed_file:
+            failed_file.write(str(error))
+        return None
+    finally:
+        if os.path.exists(tmp_header_path):
+            os.remove(tmp_header_path)
+    # the dependencies first, so that they are never older than the precompiled header
+    os.replace(dep_path + suffix, dep_path)
+    os.replace(pch_path + suffix, pch_path)
+    return header_path
+
+
+def _is_up_to_date(target_path: str, dep_path: str) -> bool:
+    """Check that the target exists and is newer than all dependencies listed in the depfile."""
+    try:
+        target_mtime = os.path.getmtime(target_path)
+        with open(dep_path) as dep_file:
+            dependencies = dep_file.read().replace("\\\n", " ").partition(": ")[2]
+        return all(os.path.getmtime(dep) <= target_mtime for dep in shlex.split(dependencies))
+    except OSError:
+        return False
+
+
+_running_commands = 0
+_running_commands_condition = threading.Condition()
+
+
+@contextlib.contextmanager
+def _command_slot() -> Iterator[None]:
+    """Wait until fewer than `"parallel_jobs"` commands are running in all threads."""
+    global _running_commands
+    with _running_commands_condition:
+        _running_commands_condition.wait_for(
+            lambda: _running_commands < max(gt_config.build_settings["parallel_jobs"], 1)
+        )
+        _running_commands += 1
+    try:
+        yield
+    finally:
+        with _running_commands_condition:
+            _running_commands -= 1
+            _running_commands_condition.notify()
+
+
+def _run_command(command: List[str], *, verbose: bool) -> Optional[str]:
+    """Run the command and return the command line and output if it fails."""
+    with _command_slot():
+        if verbose:
+            print(" ".join(shlex.quote(arg) for arg in command))
+        result = subprocess.run(
+            command,
+            stdout=None if verbose else subprocess.PIPE,
+            stderr=None if verbose else subprocess.STDOUT,
+            text=True,
+        )
+    if result.returncode != 0:
+        return f"{' '.join(command)}\n{result.stdout or ''}"
+    return None
+
+
+def _run_commands(commands: List[List[str]], *, verbose: bool) -> None:
+    """
+    Run the commands concurrently and raise if any of them fails.
+
+    As extension modules can be built from several threads, the number of running commands is
+    limited by the `"parallel_jobs"` build setting for the whole process.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(commands), 1)) as executor:
+        failed = [
+            failure
+            for failure in executor.map(
+                lambda command: _run_command(command, verbose=verbose), commands
+            )
+            if failure is not None
+        ]
+    if failed:
+        raise RuntimeError("Building the extension module failed:\n" + "\n".join(failed))
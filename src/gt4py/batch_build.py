@@ -0,0 +1,139 @@
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Build many stencils at once, compiling their extension modules in parallel."""
+import concurrent.futures
+import contextvars
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from gt4py import config as gt_config
+from gt4py import gtscript
+from gt4py.backend import pyext_builder
+from gt4py.backend.base import BasePyExtBackend
+from gt4py.lazy_stencil import LazyStencil
+from gt4py.stencil_builder import StencilBuilder
+
+
+if TYPE_CHECKING:
+    from gt4py.stencil_object import StencilObject
+    from gt4py.type_hints import StencilFunc
+
+
+class _ParallelBuildRunner:
+    """
+    Build extension modules in worker processes.
+
+    Each stencil is built in its own thread, which holds `lock` for everything but waiting on
+    the compilation. Frontend, code generation and loading of the different stencils are
+    therefore never run concurrently, while their compilations are.
+    """
+
+    def __init__(self, executor: concurrent.futures.Executor, lock: threading.Lock):
+        self.executor = executor
+        self.lock = lock
+
+    def __call__(
+        self, build_func: Callable[..., Tuple[str, str]], **kwargs: Any
+    ) -> Tuple[str, str]:
+        future = self.executor.submit(build_func, **kwargs)
+        self.lock.release()
+        try:
+            return future.result()
+        finally:
+            self.lock.acquire()
+
+
+def _as_lazy_stencil(
+    stencil: Union[LazyStencil, StencilBuilder, "StencilFunc"],
+    backend: Optional[str],
+    **kwargs: Any,
+) -> LazyStencil:
+    if isinstance(stencil, LazyStencil):
+        return stencil
+    if isinstance(stencil, StencilBuilder):
+        return LazyStencil(stencil)
+    return gtscript.lazy_stencil(backend, stencil, check_syntax=False, **kwargs)
+
+
+def _build(stencil: LazyStencil, lock: threading.Lock) -> "StencilObject":
+    with lock:
+        return stencil.implementation
+
+
+def build_all(
+    stencils: Iterable[Union[LazyStencil, StencilBuilder, "StencilFunc"]],
+    *,
+    backend: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    **kwargs: Any,
+) -> List["StencilObject"]:
+    """
+    Build many stencils, compiling the extension modules of C++ and CUDA backends in parallel.
+
+    The frontend and code generation run for one stencil after the other, while the
+    compilations are run in a pool of worker processes as soon as their sources are generated.
+    Stencils found in the cache are loaded without being rebuilt, the others are stored there.
+
+    Parameters
+    ----------
+        stencils : `iterable`
+            :class:`gt4py.lazy_stencil.LazyStencil` or :class:`gt4py.stencil_builder.StencilBuilder`
+            instances, or definition functions.
+
+        backend : `str`, optional
+            Name of the implementation backend of the definition functions.
+
+        max_workers : `int`, optional
+            Maximum number of concurrent compilations. Defaults to the `"parallel_jobs"` build
+            setting, which is the number of CPUs if not configured otherwise.
+
+        **kwargs: `dict`, optional
+            Passed to :func:`gt4py.gtscript.lazy_stencil` for the definition functions.
+
+    Returns
+    -------
+        `list` of :class:`gt4py.StencilObject`
+            The stencil objects in the same order as the given stencils. For the
+            :class:`gt4py.lazy_stencil.LazyStencil` instances, these are also their
+            `implementation`.
+
+    Notes
+    -----
+    The worker processes are started using the default method of :py:mod:`multiprocessing`. On
+    platforms where this is `"spawn"`, `build_all` must therefore not be called when the main
+    module is imported, i.e. it has to be guarded by ``if __name__ == "__main__":`` in scripts.
+    """
+    lazy_stencils = [_as_lazy_stencil(stencil, backend, **kwargs) for stencil in stencils]
+    max_workers = max_workers or gt_config.build_settings["parallel_jobs"]
+    lock = threading.Lock()
+    if not any(isinstance(stencil.backend, BasePyExtBackend) for stencil in lazy_stencils):
+        return [_build(stencil, lock) for stencil in lazy_stencils]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as processes:
+        # Start the worker processes before any other thread, since forking a process with
+        # multiple threads could deadlock the workers.
+        processes.submit(os.getpid).result()
+        token = pyext_builder.build_runner.set(_ParallelBuildRunner(processes, lock))
+        try:
+            # one more thread than processes to generate code while all of them are compiling
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers + 1) as threads:
+                futures = [
+                    threads.submit(contextvars.copy_context().run, _build, stencil, lock)
+                    for stencil in lazy_stencils
+                ]
+                return [future.result() for future in futures]
+        finally:
+            pyext_builder.build_runner.reset(token)
@@ -58,6 +58,22 @@ class CachingStrategy(abc.ABC):
         """Calculate the file path where caching info for the current process should be stored."""
         raise NotImplementedError
 
+    @property
+    def compiled_objects_path(self) -> Optional[pathlib.Path]:
+        """
+        Get the path where compiled extension modules are stored by content, if any.
+
+        Extension modules in this location are identified by their sources and build options
+        rather than by the stencil ID, and can therefore be reused by any stencil which generates
+        the same code, independently of its name, module or definition function.
+        """
+        return None
+
+    @property
+    def precompiled_headers_path(self) -> Optional[pathlib.Path]:
+        """Get the path where precompiled headers for the extension modules are stored, if any."""
+        return None
+
     @abc.abstractmethod
     def generate_cache_info(self) -> Dict[str, Any]:
         """
@@ -198,6 +214,20 @@ class JITCachingStrategy(CachingStrategy):
         """Get the cache info file path from the stencil module path."""
         return self.builder.module_path.parent / f"{self.builder.module_path.stem}.cacheinfo"
 
+    @property
+    def compiled_objects_path(self) -> Optional[pathlib.Path]:
+        """Share the compiled extension modules among all backends of the Python version."""
+        compiled_objects = self.backend_root_path.parent / "compiled_objects"
+        compiled_objects.mkdir(exist_ok=True)
+        return compiled_objects
+
+    @property
+    def precompiled_headers_path(self) -> Optional[pathlib.Path]:
+        """Share the precompiled headers, identified by compiler and flags, in the cache root."""
+        precompiled_headers = self.root_path / "precompiled_headers"
+        precompiled_headers.mkdir(exist_ok=True)
+        return precompiled_headers
+
     def generate_cache_info(self) -> Dict[str, Any]:
         return {
             "backend": self.builder.backend.name,
@@ -24,8 +24,12 @@ import click
 import tabulate
 
 from gt4py import backend as gt_backend
+from gt4py import config as gt_config
 from gt4py import gtscript_imports
 from gt4py.backend.base import CLIBackendMixin
+from gt4py.backend.bundle import build_bundle
+from gt4py.backend.gtc_common import BaseGTBackend
+from gt4py.batch_build import build_all
 from gt4py.lazy_stencil import LazyStencil
 
 
@@ -168,7 +172,7 @@ def get_param_by_name(ctx: click.Context, name: str) -> click.Parameter:
 
 class GTScriptBuilder:
     """
-    Generate stencil source code from a GTScript module.
+    Generate stencil source code from a GTScript module or build its stencils.
 
     Parameters
     ----------
@@ -176,7 +180,8 @@ class GTScriptBuilder:
         path (string or Pathlike) to the GTScript module.
 
     output_path :
-        path (string or Pathlike) to where the generated source files should be written.
+        path (string or Pathlike) to where the generated source files should be written,
+        defaults to the current directory.
 
     backend :
         class of the backend that should be used.
@@ -190,7 +195,7 @@ class GTScriptBuilder:
         self,
         input_path: Union[str, pathlib.Path],
         *,
-        output_path: Union[str, pathlib.Path],
+        output_path: Union[str, pathlib.Path] = ".",
         backend: Type[CLIBackendMixin],
         silent: bool = False,
     ):
@@ -239,6 +244,43 @@ class GTScriptBuilder:
             computation_src = builder.generate_computation()
             self.write_computation_src(builder.caching.root_path, computation_src)
 
+    def build_stencils(
+        self,
+        build_options: Optional[Dict[str, Any]] = None,
+        *,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Build the stencils into the JIT cache, compiling them in parallel."""
+        stencils = []
+        for proto_stencil in self.iterate_stencils():
+            builder = proto_stencil.builder.with_backend(self.backend_cls.name)
+            if build_options:
+                builder.with_changed_options(
+                    backend_opts={**builder.options.backend_opts, **build_options}
+                )
+            stencils.append(proto_stencil)
+        self.reporter.echo(f"Building {len(stencils)} stencils")
+        build_all(stencils, max_workers=max_workers)
+        self.reporter.echo(f"Stencils stored in {gt_config.cache_settings['root_path']}")
+
+    def generate_bundle(self, build_options: Optional[Dict[str, Any]] = None) -> None:
+        """Build the stencils into a single extension module, with a loader module for them."""
+        builders = []
+        for proto_stencil in self.iterate_stencils():
+            self.reporter.echo(f"Generating stencil {proto_stencil.builder.options.name}")
+            builder = proto_stencil.builder.with_backend(self.backend_cls.name)
+            if build_options:
+                builder.with_changed_options(
+                    backend_opts={**builder.options.backend_opts, **build_options}
+                )
+            builder.with_caching("nocaching", output_path=self.output_path)
+            builders.append(builder)
+        self.reporter.echo(f"Building {len(builders)} stencils into one extension module")
+        loader_path = build_bundle(
+            builders, name=f"{self.input_module.__name__}_bundle", output_path=self.output_path
+        )
+        self.reporter.echo(f"Stencils can be imported from {loader_path}")
+
     def report_stencil_names(self) -> None:
         stencils = list(self.iterate_stencils())
         stencils_msg = "No stencils found."
@@ -288,6 +330,11 @@ def list_backends() -> None:
     type=BackendOption(),
     help="Backend option (multiple allowed), format: -O key=value",
 )
+@click.option(
+    "--bundle",
+    is_flag=True,
+    help="Build all stencils into one extension module, importable from a generated loader.",
+)
 @click.option("--silent", "-s", is_flag=True, help="suppress console output")
 @click.argument(
     "input_path", required=True, type=click.Path(file_okay=True, dir_okay=True, exists=True)
@@ -296,13 +343,61 @@ def gen(
     backend: Type[CLIBackendMixin],
     output_path: str,
     options: Dict[str, Any],
+    bundle: bool,
     input_path: str,
     silent: bool,
 ) -> None:
     """Generate stencils from gtscript modules or packages."""
-    GTScriptBuilder(
+    if bundle and not issubclass(backend, BaseGTBackend):
+        raise click.UsageError(f"Backend '{backend.name}' can not bundle stencils.")
+    builder = GTScriptBuilder(
         input_path=input_path,
         output_path=output_path,
         backend=backend,
         silent=silent,
-    ).generate_stencils(build_options=dict(options))
+    )
+    if bundle:
+        builder.generate_bundle(build_options=dict(options))
+    else:
+        builder.generate_stencils(build_options=dict(options))
+
+
+@gtpyc.command()
+@click.option(
+    "--backend",
+    "-b",
+    type=BackendChoice(BackendChoice.get_backend_names()),
+    required=True,
+    help="Choose a backend",
+    is_eager=True,
+)
+@click.option(
+    "--option",
+    "-O",
+    "options",
+    multiple=True,
+    type=BackendOption(),
+    help="Backend option (multiple allowed), format: -O key=value",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of concurrent compilations, defaults to the number of CPUs.",
+)
+@click.option("--silent", "-s", is_flag=True, help="suppress console output")
+@click.argument(
+    "input_path", required=True, type=click.Path(file_okay=True, dir_okay=True, exists=True)
+)
+def build(
+    backend: Type[CLIBackendMixin],
+    options: Dict[str, Any],
+    jobs: Optional[int],
+    input_path: str,
+    silent: bool,
+) -> None:
+    """Build stencils from gtscript modules or packages into the cache, in parallel."""
+    GTScriptBuilder(input_path=input_path, backend=backend, silent=silent).build_stencils(
+        build_options=dict(options), max_workers=jobs
+    )
@@ -64,6 +64,8 @@ build_settings: Dict[str, Any] = {
     "extra_link_args": [],
     "parallel_jobs": multiprocessing.cpu_count(),
     "cpp_template_depth": os.environ.get("GT_CPP_TEMPLATE_DEPTH", GT_CPP_TEMPLATE_DEPTH),
+    # compile C++ extension modules with precompiled headers of the common includes
+    "precompiled_headers": os.environ.get("GT_PRECOMPILED_HEADERS", "1") not in ("0", "false"),
 }
 
 cache_settings: Dict[str, Any] = {
@@ -71,6 +73,10 @@ cache_settings: Dict[str, Any] = {
     "root_path": os.environ.get("GT_CACHE_ROOT", os.path.abspath(".")),
     "load_retries": int(os.environ.get("GT_CACHE_LOAD_RETRIES", 3)),
     "load_retry_delay": int(os.environ.get("GT_CACHE_LOAD_RETRY_DELAY", 100)),  # unit miliseconds
+    # maximum number of domain/origin pairs cached by each stencil class at call time
+    "call_args_cache_size": int(os.environ.get("GT_CALL_ARGS_CACHE_SIZE", 256)),
+    # maximum number of sets of temporary buffers kept by each numpy computation between calls
+    "temporary_arena_size": int(os.environ.get("GT_TEMPORARY_ARENA_SIZE", 4)),
 }
 
 code_settings: Dict[str, Any] = {"root_package_name": "_GT_"}
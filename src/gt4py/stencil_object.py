@@ -14,25 +14,31 @@
 
 import abc
 import collections.abc
+import concurrent.futures
+import contextlib
+import functools
 import sys
+import threading
 import time
 import typing
 import warnings
 from dataclasses import dataclass
 from pickle import dumps
-from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Union
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 
 import gt4py.backend as gt_backend
 import gt4py.storage as gt_storage
 import gtc.utils as gtc_utils
+from gt4py import config as gt_config
 from gt4py.definitions import AccessKind, DomainInfo, FieldInfo, ParameterInfo
 from gtc.definitions import Index, Shape
 
 
 FieldType = Union[gt_storage.storage.Storage, np.ndarray]
 OriginType = Union[Tuple[int, int, int], Dict[str, Tuple[int, ...]]]
+DomainOriginType = Tuple[Tuple[int, ...], Dict[str, Tuple[int, ...]]]
 
 
 def _compute_cache_key(field_args, parameter_args, domain, origin) -> int:
@@ -45,6 +51,103 @@ def _compute_cache_key(field_args, parameter_args, domain, origin) -> int:
     return hash((field_data, *parameter_args.keys(), dumps(domain), dumps(origin)))
 
 
+def _make_cache_key_function(field_info: Dict[str, FieldInfo]) -> Callable[..., int]:
+    """Generate a cache key function specialized for the fields of a stencil.
+
+    Only the fields which are actually accessed by the stencil take part in the
+    computation of the origin and the domain, so the generated function reads their
+    shape and default origin directly and hashes them together with the `domain` and
+    `origin` arguments in a single flat tuple. Unhashable arguments (e.g. a `dict`
+    origin or a `list` domain) fall back to the generic :func:`_compute_cache_key`.
+    """
+    names = [name for name, info in field_info.items() if info.access != AccessKind.NONE]
+    lines = [f"    f{i} = field_args[{name!r}]" for i, name in enumerate(names)]
+    key_items = [f"f{i}.shape, getattr(f{i}, 'default_origin', None)" for i in range(len(names))]
+    source = "\n".join(
+        [
+            "def _cache_key(field_args, parameter_args, domain, origin):",
+            "    try:",
+            *(f"    {line}" for line in lines),
+            f"        return hash(({', '.join([*key_items, 'domain', 'origin'])},))",
+            "    except (AttributeError, KeyError, TypeError):",
+            "        return _compute_cache_key(field_args, parameter_args, domain, origin)",
+        ]
+    )
+    namespace: Dict[str, Any] = {"_compute_cache_key": _compute_cache_key}
+    exec(source, namespace)
+    cache_key_func = namespace["_cache_key"]
+    cache_key_func.__exec_source__ = source
+    return cache_key_func
+
+
+class CallArgsCacheInfo(NamedTuple):
+    """Statistics of the domain/origin cache of a stencil class."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _DomainOriginCache:
+    """Least-recently-used cache of normalized domain/origin pairs.
+
+    The capacity is read from ``gt4py.config.cache_settings["call_args_cache_size"]``
+    when new entries are inserted, so it can be changed at run-time. Accesses are
+    serialized by a lock, since stencils can be called from several threads.
+    """
+
+    __slots__ = ("_data", "_lock", "hits", "misses", "evictions")
+
+    def __init__(self) -> None:
+        self._data: "collections.OrderedDict[int, DomainOriginType]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._data
+
+    def get(self, key: int) -> Optional[DomainOriginType]:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: int, value: DomainOriginType) -> None:
+        with self._lock:
+            self._data[key] = value
+            maxsize = gt_config.cache_settings["call_args_cache_size"]
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CallArgsCacheInfo:
+        with self._lock:
+            return CallArgsCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                maxsize=gt_config.cache_settings["call_args_cache_size"],
+                currsize=len(self._data),
+            )
+
+
 @dataclass(frozen=True)
 class FrozenStencil:
     """Stencil with pre-computed domain and origin for each field argument."""
@@ -60,7 +163,7 @@ class FrozenStencil:
                     f"'{name}' origin {self.origin.get(name)} is not a {field_info.ndim}-dimensional integer tuple"
                 )
 
-    def __call__(self, **kwargs) -> None:
+    def __call__(self, **kwargs) -> Optional[concurrent.futures.Future]:
         assert "origin" not in kwargs and "domain" not in kwargs
         exec_info = kwargs.get("exec_info")
 
@@ -70,17 +173,34 @@ class FrozenStencil:
         field_args = {name: kwargs[name] for name in self.stencil_object.field_info.keys()}
         parameter_args = {name: kwargs[name] for name in self.stencil_object.parameter_info.keys()}
 
-        self.stencil_object.run(
-            _domain_=self.domain,
-            _origin_=self.origin,
-            exec_info=exec_info,
-            **field_args,
-            **parameter_args,
-        )
+        if (recorder := StencilObject._call_recorder) is not None:
+            recorder.record(
+                self.stencil_object, self.domain, self.origin, {**field_args, **parameter_args}
+            )
+
+        future = None
+        if (executor := StencilObject._call_executor) is not None:
+            future = executor.submit(
+                self.stencil_object,
+                self.domain,
+                self.origin,
+                {**field_args, **parameter_args},
+                exec_info=exec_info,
+            )
+        else:
+            self.stencil_object.run(
+                _domain_=self.domain,
+                _origin_=self.origin,
+                exec_info=exec_info,
+                **field_args,
+                **parameter_args,
+            )
 
         if exec_info is not None:
             exec_info["call_run_end_time"] = time.perf_counter()
 
+        return future
+
     def __sdfg__(self, **kwargs):
         raise TypeError(
             f'Only dace backends are supported in DaCe-orchestrated programs. (found "{self.stencil_object.backend}")'
@@ -143,13 +263,25 @@ class StencilObject(abc.ABC):
     _gt_id_: str
     definition_func: Callable[..., Any]
 
-    _domain_origin_cache: ClassVar[Dict[int, Tuple[Tuple[int, ...], Dict[str, Tuple[int, ...]]]]]
-    """Stores domain/origin pairs that have been used by hash."""
+    _domain_origin_cache: ClassVar[_DomainOriginCache]
+    """Stores domain/origin pairs that have been used by hash (bounded LRU)."""
+
+    _compute_cache_key: ClassVar[Callable[..., int]]
+    """Computes the `_domain_origin_cache` key of the call arguments (specialized per class)."""
+
+    _call_recorder: ClassVar[Optional["StencilProgram"]] = None
+    """Program recording the stencil calls (see :func:`record_stencil_calls`)."""
+
+    _call_executor: ClassVar[Optional["AsyncStencilExecutor"]] = None
+    """Executor running the stencil calls asynchronously (see :func:`async_stencil_calls`)."""
 
     def __new__(cls, *args, **kwargs):
         if getattr(cls, "_instance", None) is None:
             cls._instance = object.__new__(cls)
-            cls._domain_origin_cache = {}
+            cls._domain_origin_cache = _DomainOriginCache()
+            cls._compute_cache_key = staticmethod(
+                _make_cache_key_function(cls._instance.field_info)
+            )
         return cls._instance
 
     def __setattr__(self, key, value) -> None:
@@ -229,6 +361,16 @@ class StencilObject(abc.ABC):
     def __call__(self, *args, **kwargs) -> None:
         pass
 
+    def _bind_run(
+        self, _domain_: Tuple[int, ...], _origin_: Dict[str, Tuple[int, ...]], **kwargs: Any
+    ) -> Optional[Tuple[Any, Callable[[List[Any]], None]]]:
+        """Bind the computation to the arguments of `run` in native code, without running it.
+
+        Returns the bound computation and a function running a list of bound computations
+        in order, or `None` if the backend does not support it.
+        """
+        return None
+
     @staticmethod
     def _make_origin_dict(origin: Any) -> Dict[str, Index]:
         try:
@@ -460,6 +602,40 @@ class StencilObject(abc.ABC):
 
         return origin
 
+    def _prepare_call_args(
+        self,
+        field_args: Dict[str, FieldType],
+        parameter_args: Dict[str, Any],
+        domain: Optional[Tuple[int, ...]],
+        origin: Optional[OriginType],
+        *,
+        validate_args: bool = True,
+        cache_key: Optional[int] = None,
+    ) -> DomainOriginType:
+        """Return the normalized domain and origins of a call, going through the argument cache.
+
+        The generated ``__call__`` methods compute the cache key directly from their
+        arguments and only call this function if the lookup failed, passing the
+        key along. Otherwise the key is computed and looked up here.
+        """
+        if cache_key is None:
+            cache_key = self._compute_cache_key(field_args, parameter_args, domain, origin)
+            cached_args = self._domain_origin_cache.get(cache_key)
+            if cached_args is not None:
+                return cached_args
+
+        origin = self._normalize_origins(field_args, origin)
+
+        if domain is None:
+            domain = self._get_max_domain(field_args, origin)
+
+        if validate_args:
+            self._validate_args(field_args, parameter_args, domain, origin)
+
+        self._domain_origin_cache.put(cache_key, (domain, origin))
+
+        return domain, origin
+
     def _call_run(
         self,
         field_args: Dict[str, FieldType],
@@ -469,7 +645,7 @@ class StencilObject(abc.ABC):
         *,
         validate_args: bool = True,
         exec_info: Optional[Dict[str, Any]] = None,
-    ) -> None:
+    ) -> Optional[concurrent.futures.Future]:
         """Check and preprocess the provided arguments (called by :class:`StencilObject` subclasses).
 
         Note that this function will always try to expand simple parameter values to complete
@@ -492,7 +668,8 @@ class StencilObject(abc.ABC):
 
         Returns
         -------
-            `None`
+            `None`, or a `concurrent.futures.Future` if the call was submitted to an
+            :class:`AsyncStencilExecutor`.
 
         Raises
         -------
@@ -502,27 +679,32 @@ class StencilObject(abc.ABC):
         if exec_info is not None:
             exec_info["call_run_start_time"] = time.perf_counter()
 
-        cache_key = _compute_cache_key(field_args, parameter_args, domain, origin)
-        if cache_key not in self._domain_origin_cache:
-            origin = self._normalize_origins(field_args, origin)
-
-            if domain is None:
-                domain = self._get_max_domain(field_args, origin)
+        domain, origin = self._prepare_call_args(
+            field_args, parameter_args, domain, origin, validate_args=validate_args
+        )
 
-            if validate_args:
-                self._validate_args(field_args, parameter_args, domain, origin)
+        if self._call_recorder is not None:
+            self._call_recorder.record(self, domain, origin, {**field_args, **parameter_args})
 
-            type(self)._domain_origin_cache[cache_key] = (domain, origin)
+        future = None
+        if self._call_executor is not None:
+            future = self._call_executor.submit(
+                self, domain, origin, {**field_args, **parameter_args}, exec_info=exec_info
+            )
         else:
-            domain, origin = type(self)._domain_origin_cache[cache_key]
-
-        self.run(
-            _domain_=domain, _origin_=origin, exec_info=exec_info, **field_args, **parameter_args
-        )
+            self.run(
+                _domain_=domain,
+                _origin_=origin,
+                exec_info=exec_info,
+                **field_args,
+                **parameter_args,
+            )
 
         if exec_info is not None:
             exec_info["call_run_end_time"] = time.perf_counter()
 
+        return future
+
     def freeze(
         self: "StencilObject", *, origin: Dict[str, Tuple[int, ...]], domain: Tuple[int, ...]
     ) -> FrozenStencil:
@@ -552,7 +734,7 @@ class StencilObject(abc.ABC):
         return FrozenStencil(self, origin, domain)
 
     def clean_call_args_cache(self: "StencilObject") -> None:
-        """Clean the argument cache.
+        """Clean the argument cache and reset its statistics.
 
         Returns
         -------
@@ -560,6 +742,20 @@ class StencilObject(abc.ABC):
         """
         type(self)._domain_origin_cache.clear()
 
+    def call_args_cache_info(self: "StencilObject") -> CallArgsCacheInfo:
+        """Return the statistics of the argument cache of this stencil class.
+
+        The capacity of the cache is controlled by the ``call_args_cache_size``
+        entry of :data:`gt4py.config.cache_settings`.
+
+        Returns
+        -------
+            `CallArgsCacheInfo`
+                Number of cache hits, misses and evictions since the last
+                :meth:`clean_call_args_cache` call, maximum and current size.
+        """
+        return type(self)._domain_origin_cache.info()
+
     def __sdfg__(self, **kwargs):
         raise TypeError(
             f'Only dace backends are supported in DaCe-orchestrated programs. (found "{self.backend}")'
@@ -574,3 +770,222 @@ class StencilObject(abc.ABC):
         raise TypeError(
             f'Only dace backends are supported in DaCe-orchestrated programs. (found "{self.backend}")'
         )
+
+
+class StencilProgram:
+    """Replayable sequence of stencil calls with bound arguments.
+
+    Programs are created by :func:`record_stencil_calls`. Calling the program runs
+    again all the recorded stencil calls in order, with the same domain, origins,
+    fields and parameters, skipping the argument processing of the stencil
+    ``__call__`` methods. Fields are bound by reference, so changes in the contents
+    of the storages between replays are visible to the stencils, while scalar
+    parameters keep the value they had at recording time.
+
+    Consecutive calls of stencils whose backend binds computations in native code
+    (the C++ backends) are replayed in a single native loop, without returning to
+    Python between them.
+    """
+
+    _steps: List[Callable[[], None]]
+    _arguments: List[Dict[str, Any]]
+    _native_computations: Optional[List[Any]]
+
+    def __init__(self) -> None:
+        self._steps = []
+        self._arguments = []
+        self._native_computations = None
+
+    def __len__(self) -> int:
+        return len(self._arguments)
+
+    def __call__(self) -> None:
+        for step in self._steps:
+            step()
+
+    def record(
+        self,
+        stencil_object: StencilObject,
+        domain: Tuple[int, ...],
+        origin: Dict[str, Tuple[int, ...]],
+        arguments: Dict[str, Any],
+    ) -> None:
+        """Append a stencil call with normalized domain and origins to the program."""
+        # native computations only keep pointers to the fields, which must be kept alive
+        self._arguments.append(arguments)
+        bound_run = stencil_object._bind_run(domain, origin, **arguments)
+        if bound_run is None:
+            self._steps.append(
+                functools.partial(stencil_object.run, domain, origin, None, **arguments)
+            )
+            self._native_computations = None
+        else:
+            computation, run_computations = bound_run
+            if self._native_computations is None:
+                self._native_computations = []
+                self._steps.append(functools.partial(run_computations, self._native_computations))
+            self._native_computations.append(computation)
+
+
+@contextlib.contextmanager
+def record_stencil_calls() -> Iterator[StencilProgram]:
+    """Record all the `StencilObject` and `FrozenStencil` calls into a `StencilProgram`.
+
+    The stencils are still executed while recording. Recording is global and cannot
+    be nested, so stencils called from other threads in the meantime are recorded too.
+
+    Example
+    -------
+    .. code-block:: python
+
+        with record_stencil_calls() as timestep:
+            stencil_a(u, v, dt=dt)
+            stencil_b(v, w)
+        for _ in range(n_steps):
+            timestep()
+    """
+    if StencilObject._call_recorder is not None:
+        raise RuntimeError("Stencil calls are already being recorded")
+
+    program = StencilProgram()
+    StencilObject._call_recorder = program
+    try:
+        yield program
+    finally:
+        StencilObject._call_recorder = None
+
+
+def _storage_buffer(field: Any) -> Any:
+    """Return the array owning the memory of a (possibly view) field."""
+    while isinstance(getattr(field, "base", None), np.ndarray):
+        field = field.base
+    return field
+
+
+class AsyncStencilExecutor:
+    """Run stencil calls asynchronously on a pool of worker threads.
+
+    Calls are ordered according to the access kinds of their field arguments
+    (see :attr:`FieldInfo.access`): a call reading a storage waits for the last
+    call writing it, and a call writing a storage also waits for all the calls
+    reading it since then. Calls without conflicting accesses run concurrently.
+    Storages are identified by the array owning their memory, so different views
+    of the same buffer are treated as the same storage.
+
+    Created by :func:`async_stencil_calls`.
+    """
+
+    _pool: concurrent.futures.ThreadPoolExecutor
+    _lock: threading.Lock
+    _futures: List[concurrent.futures.Future]
+    _last_writers: Dict[int, Tuple[Any, concurrent.futures.Future]]
+    _readers: Dict[int, List[concurrent.futures.Future]]
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gt4py-stencil"
+        )
+        self._lock = threading.Lock()
+        self._futures = []
+        self._last_writers = {}
+        self._readers = {}
+
+    def submit(
+        self,
+        stencil_object: StencilObject,
+        domain: Tuple[int, ...],
+        origin: Dict[str, Tuple[int, ...]],
+        arguments: Dict[str, Any],
+        *,
+        exec_info: Optional[Dict[str, Any]] = None,
+    ) -> concurrent.futures.Future:
+        """Schedule a stencil call with normalized domain and origins."""
+        if exec_info is not None:
+            raise ValueError("'exec_info' is not supported for asynchronous stencil calls")
+
+        with self._lock:
+            dependencies: Dict[int, concurrent.futures.Future] = {}
+            reads, writes = [], []
+            for name, field_info in stencil_object.field_info.items():
+                if field_info.access == AccessKind.NONE:
+                    continue
+                buffer = _storage_buffer(arguments[name])
+                key = id(buffer)
+                if key in self._last_writers:
+                    last_writer = self._last_writers[key][1]
+                    dependencies[id(last_writer)] = last_writer
+                if field_info.access & AccessKind.WRITE:
+                    for reader in self._readers.get(key, []):
+                        dependencies[id(reader)] = reader
+                    writes.append((key, buffer))
+                else:
+                    reads.append(key)
+
+            future = self._pool.submit(
+                self._run_after,
+                list(dependencies.values()),
+                functools.partial(stencil_object.run, domain, origin, None, **arguments),
+            )
+
+            for key in reads:
+                self._readers.setdefault(key, []).append(future)
+            for key, buffer in writes:
+                # Keep a reference to the buffer so its id cannot be reused while tracked
+                self._last_writers[key] = (buffer, future)
+                self._readers[key] = []
+            self._futures.append(future)
+
+        return future
+
+    @staticmethod
+    def _run_after(dependencies: List[concurrent.futures.Future], call: Callable[[], None]) -> None:
+        # Dependencies were submitted before to the same FIFO pool, so they are
+        # already running or finished and waiting here cannot deadlock.
+        for dependency in dependencies:
+            dependency.result()
+        call()
+
+    def wait(self) -> None:
+        """Wait for all the submitted calls and raise the first exception, if any."""
+        with self._lock:
+            futures, self._futures = self._futures, []
+            self._last_writers.clear()
+            self._readers.clear()
+        for future in futures:
+            future.result()
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+@contextlib.contextmanager
+def async_stencil_calls(max_workers: Optional[int] = None) -> Iterator[AsyncStencilExecutor]:
+    """Run all the `StencilObject` and `FrozenStencil` calls asynchronously.
+
+    Inside the context, stencil calls return a `concurrent.futures.Future` right
+    after their arguments are checked, and run on a pool of `max_workers` threads
+    as soon as the calls they depend on are finished (see :class:`AsyncStencilExecutor`).
+    All the calls are finished when leaving the context. Speed-ups depend on the
+    backend releasing the GIL while running the computation.
+
+    Example
+    -------
+    .. code-block:: python
+
+        with async_stencil_calls(max_workers=4):
+            physics_stencil(q, tendencies)
+            dynamics_stencil(u, v, w)
+    """
+    if StencilObject._call_executor is not None:
+        raise RuntimeError("Stencil calls are already being run asynchronously")
+
+    executor = AsyncStencilExecutor(max_workers=max_workers)
+    StencilObject._call_executor = executor
+    try:
+        yield executor
+    finally:
+        StencilObject._call_executor = None
+        try:
+            executor.wait()
+        finally:
+            executor.shutdown()
@@ -0,0 +1,339 @@
+# GridTools Compiler Toolchain (GTC) - GridTools Framework
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GTC project and the GridTools framework.
+# GTC is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Lower OIR to explicit loop nests compiled with Numba."""
+
+import textwrap
+from typing import Any, Collection, Dict, List, Optional, Tuple, Union
+
+from eve import SymbolTableTrait
+from eve.codegen import FormatTemplate, JinjaTemplate, TemplatedGenerator
+from gtc import common, oir
+from gtc.definitions import Extent
+from gtc.passes.oir_optimizations.utils import AccessCollector, compute_extents
+
+
+__all__ = ["NumbaCodegen"]
+
+
+def _offset_to_str(offset: int) -> str:
+    if offset > 0:
+        return f" + {offset}"
+    elif offset < 0:
+        return f" - {-offset}"
+    else:
+        return ""
+
+
+def _origin_names(name: str) -> Tuple[str, str, str]:
+    return (f"_{name}_i_", f"_{name}_j_", f"_{name}_k_")
+
+
+def _axis_bound(bound: common.AxisBound, axis: str) -> str:
+    if bound.level == common.LevelMarker.END:
+        return f"_d{axis.upper()}_{_offset_to_str(bound.offset)}"
+    return str(bound.offset)
+
+
+def _indent(code: str, level: int = 1) -> str:
+    return textwrap.indent(code, "    " * level)
+
+
+def _is_column_independent(node: oir.VerticalLoop, block_extents: Dict[int, Extent]) -> bool:
+    """Return whether the columns of a serial loop can be computed one after the other.
+
+    This is the case if all horizontal executions have the same extent and no field written
+    in the loop is read with a horizontal offset.
+    """
+    horizontal_executions = node.iter_tree().if_isinstance(oir.HorizontalExecution).to_list()
+    if len({block_extents[id(he)] for he in horizontal_executions}) > 1:
+        return False
+    accesses = AccessCollector.apply(node)
+    return not any(
+        offset[0] != 0 or offset[1] != 0
+        for name in accesses.write_fields()
+        for offset in accesses.read_offsets().get(name, set())
+    )
+
+
+class NumbaCodegen(TemplatedGenerator):
+    """Generate a Python module computing a stencil with Numba-compiled loop nests.
+
+    Horizontal executions of parallel vertical loops are computed in `i, j, k` loop nests,
+    serial vertical loops loop over the levels around the horizontal loops, or inside them
+    if the columns are independent. The outermost horizontal loop is a `numba.prange`.
+    """
+
+    contexts = (SymbolTableTrait.symtable_merger,)
+
+    # --- Expressions ---
+    def visit_DataType(self, node: common.DataType, **kwargs: Any) -> str:
+        if node == common.DataType.BOOL:
+            return "np.bool_"
+        return f"np.{node.name.lower()}"
+
+    def visit_BuiltInLiteral(self, node: common.BuiltInLiteral, **kwargs: Any) -> str:
+        if node is common.BuiltInLiteral.TRUE:
+            return "True"
+        elif node is common.BuiltInLiteral.FALSE:
+            return "False"
+        raise NotImplementedError(f"Not implemented BuiltInLiteral encountered: {node}")
+
+    def visit_Literal(self, node: oir.Literal, **kwargs: Any) -> str:
+        value = self.visit(node.value, **kwargs)
+        if node.dtype == common.DataType.BOOL:
+            return value
+        return f"{self.visit(node.dtype, **kwargs)}({value})"
+
+    ScalarAccess = FormatTemplate("{name}")
+
+    def visit_CartesianOffset(
+        self, node: common.CartesianOffset, **kwargs: Any
+    ) -> Tuple[int, int, int]:
+        return (node.i, node.j, node.k)
+
+    def visit_FieldAccess(
+        self,
+        node: oir.FieldAccess,
+        *,
+        field_origins: Dict[str, Tuple[Optional[str], Optional[str], Optional[str]]],
+        **kwargs: Any,
+    ) -> str:
+        origins = field_origins[node.name]
+        if isinstance(node.offset, oir.VariableKOffset):
+            offsets: Tuple[Any, ...] = (0, 0, None)
+        else:
+            offsets = self.visit(node.offset, **kwargs)
+
+        indices = []
+        for axis, origin, offset in zip("ijk", origins, offsets):
+            if origin is None:
+                continue
+            if offset is None:
+                # Variable offsets reading outside of the field are clipped to its bounds
+                k_offset = self.visit(node.offset.k, field_origins=field_origins, **kwargs)
+                k_index = f"k + {origin} + {k_offset}"
+                indices.append(f"min(max({k_index}, 0), {node.name}.shape[{len(indices)}] - 1)")
+            else:
+                indices.append(f"{axis} + {origin}{_offset_to_str(offset)}")
+        indices.extend(
+            self.visit(index, field_origins=field_origins, **kwargs) for index in node.data_index
+        )
+        return f"{node.name}[{', '.join(indices)}]"
+
+    UnaryOp = FormatTemplate("({op} {expr})")
+
+    BinaryOp = FormatTemplate("({left} {op} {right})")
+
+    TernaryOp = FormatTemplate("({true_expr} if {cond} else {false_expr})")
+
+    def visit_Cast(self, node: oir.Cast, **kwargs: Any) -> str:
+        return f"{self.visit(node.dtype, **kwargs)}({self.visit(node.expr, **kwargs)})"
+
+    NATIVE_FUNCTIONS = {
+        common.NativeFunction.ABS: "abs",
+        common.NativeFunction.MIN: "min",
+        common.NativeFunction.MAX: "max",
+        common.NativeFunction.MOD: "np.mod",
+        common.NativeFunction.POW: "np.power",
+        common.NativeFunction.GAMMA: "math.gamma",
+    }
+
+    def visit_NativeFunction(self, node: common.NativeFunction, **kwargs: Any) -> str:
+        return self.NATIVE_FUNCTIONS.get(node, f"np.{node.value}")
+
+    NativeFuncCall = FormatTemplate("{func}({', '.join(args)})")
+
+    # --- Statements ---
+    def visit_AssignStmt(self, node: oir.AssignStmt, **kwargs: Any) -> str:
+        left = self.visit(node.left, **kwargs)
+        right = self.visit(node.right, **kwargs)
+        if isinstance(node.left, oir.ScalarAccess):
+            # Keep the declared type of local scalars
+            right = f"{self.visit(kwargs['symtable'][node.left.name].dtype)}({right})"
+        return f"{left} = {right}"
+
+    def _block(self, header: str, body: List[oir.Stmt], **kwargs: Any) -> str:
+        stmts = [self.visit(stmt, **kwargs) for stmt in body] or ["pass"]
+        return "\n".join([header, *(_indent(stmt) for stmt in stmts)])
+
+    def visit_MaskStmt(self, node: oir.MaskStmt, **kwargs: Any) -> str:
+        return self._block(f"if {self.visit(node.mask, **kwargs)}:", node.body, **kwargs)
+
+    def visit_While(self, node: oir.While, **kwargs: Any) -> str:
+        return self._block(f"while {self.visit(node.cond, **kwargs)}:", node.body, **kwargs)
+
+    def visit_HorizontalRestriction(self, node: oir.HorizontalRestriction, **kwargs: Any) -> str:
+        conditions = []
+        for axis, interval in zip("ij", node.mask.intervals):
+            if interval.start is not None:
+                conditions.append(f"{axis} >= {_axis_bound(interval.start, axis)}")
+            if interval.end is not None:
+                conditions.append(f"{axis} < {_axis_bound(interval.end, axis)}")
+        return self._block(f"if {' and '.join(conditions) or 'True'}:", node.body, **kwargs)
+
+    # --- Control Flow ---
+    def visit_HorizontalExecution(self, node: oir.HorizontalExecution, **kwargs: Any) -> str:
+        declarations = [f"{decl.name} = {self.visit(decl.dtype)}(0)" for decl in node.declarations]
+        stmts = [self.visit(stmt, **kwargs) for stmt in node.body]
+        return "\n".join([*declarations, *stmts]) or "pass"
+
+    def _k_loop(self, node: oir.VerticalLoopSection, loop_order: common.LoopOrder) -> str:
+        start = _axis_bound(node.interval.start, "k")
+        end = _axis_bound(node.interval.end, "k")
+        if loop_order == common.LoopOrder.BACKWARD:
+            return f"for k in range({end} - 1, {start} - 1, -1):"
+        return f"for k in range({start}, {end}):"
+
+    def _horizontal_loops(self, extent: Extent, body: str) -> str:
+        return "\n".join(
+            [
+                f"for i in numba.prange({extent[0][0]}, _dI_{_offset_to_str(extent[0][1])}):",
+                _indent(f"for j in range({extent[1][0]}, _dJ_{_offset_to_str(extent[1][1])}):"),
+                _indent(body, 2),
+            ]
+        )
+
+    def visit_VerticalLoop(
+        self, node: oir.VerticalLoop, *, block_extents: Dict[int, Extent], **kwargs: Any
+    ) -> str:
+        loops = []
+        if node.loop_order == common.LoopOrder.PARALLEL:
+            for section in node.sections:
+                k_loop = self._k_loop(section, node.loop_order)
+                for he in section.horizontal_executions:
+                    body = "\n".join([k_loop, _indent(self.visit(he, **kwargs))])
+                    loops.append(self._horizontal_loops(block_extents[id(he)], body))
+        elif _is_column_independent(node, block_extents):
+            sections = []
+            for section in node.sections:
+                body = "\n".join(self.visit(he, **kwargs) for he in section.horizontal_executions)
+                sections.append(
+                    "\n".join([self._k_loop(section, node.loop_order), _indent(body or "pass")])
+                )
+            # All horizontal executions have the same extent
+            he = node.iter_tree().if_isinstance(oir.HorizontalExecution).to_list()[0]
+            loops.append(self._horizontal_loops(block_extents[id(he)], "\n".join(sections)))
+        else:
+            for section in node.sections:
+                horizontal_loops = [
+                    self._horizontal_loops(block_extents[id(he)], self.visit(he, **kwargs))
+                    for he in section.horizontal_executions
+                ]
+                loops.append(
+                    "\n".join(
+                        [
+                            self._k_loop(section, node.loop_order),
+                            _indent("\n".join(horizontal_loops) or "pass"),
+                        ]
+                    )
+                )
+        return "\n".join(loops)
+
+    def visit_Stencil(
+        self, node: oir.Stencil, *, parallel: bool = True, **kwargs: Any
+    ) -> Union[str, Collection[str]]:
+        field_extents, block_extents = compute_extents(node)
+
+        field_origins: Dict[str, Tuple[Optional[str], Optional[str], Optional[str]]] = {}
+        origin_args = []
+        call_args = []
+        for decl in node.params:
+            if isinstance(decl, oir.FieldDecl):
+                field_origins[decl.name] = tuple(  # type: ignore
+                    name if has_dim else None
+                    for name, has_dim in zip(_origin_names(decl.name), decl.dimensions)
+                )
+                call_args.append(f"np.asarray({decl.name})")
+                origin_args.extend(
+                    (name, f"_origin_['{decl.name}'][{index}]")
+                    for index, name in enumerate(
+                        name for name in field_origins[decl.name] if name is not None
+                    )
+                )
+            else:
+                call_args.append(f"_scalar_({self.visit(decl.dtype)}, {decl.name})")
+
+        temp_decls = []
+        for decl in node.declarations:
+            extent = field_extents[decl.name]
+            field_origins[decl.name] = (str(-extent[0][0]), str(-extent[1][0]), "0")
+            shape = [
+                f"_dI_ + {extent[0][1] - extent[0][0]}",
+                f"_dJ_ + {extent[1][1] - extent[1][0]}",
+                "_dK_",
+                *(str(dim) for dim in decl.data_dims),
+            ]
+            temp_decls.append(
+                f"{decl.name} = np.empty(({', '.join(shape)}), dtype={self.visit(decl.dtype)})"
+            )
+
+        vertical_loops = [
+            self.visit(
+                vertical_loop,
+                block_extents=block_extents,
+                field_origins=field_origins,
+                **kwargs,
+            )
+            for vertical_loop in node.vertical_loops
+        ]
+
+        return self.Stencil.render(
+            parallel=parallel,
+            arguments=[decl.name for decl in node.params],
+            run_args=[
+                *(decl.name for decl in node.params),
+                "_dI_",
+                "_dJ_",
+                "_dK_",
+                *(name for name, _ in origin_args),
+            ],
+            call_args=[
+                *call_args,
+                *(f"int(_domain_[{index}])" for index in range(3)),
+                *(value for _, value in origin_args),
+            ],
+            temp_decls=temp_decls,
+            vertical_loops=vertical_loops,
+        )
+
+    Stencil = JinjaTemplate(
+        textwrap.dedent(
+            """\
+            import math
+
+            import numba
+            import numpy as np
+
+
+            @numba.njit(parallel={{ parallel }}, cache=True)
+            def _run_({{ run_args | join(", ") }}):
+                {% for decl in temp_decls %}{{ decl }}
+                {% endfor %}
+                {% for vertical_loop in vertical_loops %}{{ vertical_loop | indent(4) }}
+                {% endfor %}
+                return
+
+
+            def _scalar_(dtype, value):
+                if value is None:
+                    raise TypeError("unsupported scalar argument of type 'NoneType'")
+                return dtype(value)
+
+
+            def run(*, {{ (arguments + ["_domain_", "_origin_"]) | join(", ") }}):
+                _run_({{ call_args | join(", ") }})
+            """
+        )
+    )
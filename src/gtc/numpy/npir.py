@@ -187,7 +187,7 @@ class VectorAssign(common.AssignStmt[VectorLValue, Expr], Stmt):
 
 
 class While(common.While[Stmt, Expr], Stmt):
-    pass
+    horizontal_mask: Optional[common.HorizontalMask] = None
 
 
 # --- Control Flow ---
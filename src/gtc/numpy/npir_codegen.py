@@ -12,10 +12,9 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-import numbers
 import textwrap
 from dataclasses import dataclass, field
-from typing import Any, Collection, List, Optional, Set, Tuple, Union, cast
+from typing import Any, Collection, Dict, List, Optional, Set, Tuple, Union, cast
 
 from eve import SymbolTableTrait
 from eve.codegen import FormatTemplate, JinjaTemplate, TemplatedGenerator
@@ -39,22 +38,46 @@ def _offset_to_str(offset: int) -> str:
         return ""
 
 
-def _slice_string(ch: str, offset: int, interval: Tuple[common.AxisBound, common.AxisBound]) -> str:
+def _axis_bounds(
+    ch: str,
+    offset: int,
+    interval: Tuple[common.AxisBound, common.AxisBound],
+    origin: Optional[str] = None,
+) -> Tuple[str, str]:
     start_ch = ch if interval[0].level == common.LevelMarker.START else ch.upper()
     end_ch = ch if interval[1].level == common.LevelMarker.START else ch.upper()
+    origin_str = f" + {origin}" if origin else ""
 
     return (
-        f"{start_ch}{_offset_to_str(interval[0].offset + offset)}"
-        ":"
-        f"{end_ch}{_offset_to_str(interval[1].offset + offset)}"
+        f"{start_ch}{origin_str}{_offset_to_str(interval[0].offset + offset)}",
+        f"{end_ch}{origin_str}{_offset_to_str(interval[1].offset + offset)}",
     )
 
 
+def _slice_string(
+    ch: str,
+    offset: int,
+    interval: Tuple[common.AxisBound, common.AxisBound],
+    origin: Optional[str] = None,
+) -> str:
+    return ":".join(_axis_bounds(ch, offset, interval, origin))
+
+
+def _origin_names(name: str) -> Tuple[str, str, str]:
+    return (f"_{name}_i_", f"_{name}_j_", f"_{name}_k_")
+
+
 def _make_slice_access(
-    offset: Tuple[Optional[int], Optional[int], Union[str, Optional[int]]],
+    offset: Tuple[Optional[int], Optional[int], Optional[int]],
     is_serial: bool,
     interval: Optional[common.HorizontalMask] = None,
+    origin: Tuple[Optional[str], Optional[str], Optional[str]] = (None, None, None),
 ) -> List[str]:
+    """Return the slices of an access, with `:` for the axes missing in the field.
+
+    `origin` contains the names of the variables holding the origin of the field
+    in each axis, if the offsets are not relative to the start of the array.
+    """
     axes: List[str] = []
 
     if interval is None:
@@ -63,85 +86,170 @@ def _make_slice_access(
             j=common.HorizontalInterval.compute_domain(),
         )
 
-    if offset[0] is not None:
-        axes.append(_slice_string("i", offset[0], (interval.i.start, interval.i.end)))
-    if offset[1] is not None:
-        axes.append(_slice_string("j", offset[1], (interval.j.start, interval.j.end)))
+    for ch, axis_offset, axis_interval, axis_origin in zip(
+        "ij", offset[:2], (interval.i, interval.j), origin[:2]
+    ):
+        if axis_offset is None:
+            axes.append(":")
+        else:
+            axes.append(
+                _slice_string(
+                    ch, axis_offset, (axis_interval.start, axis_interval.end), axis_origin
+                )
+            )
 
-    if isinstance(offset[2], numbers.Number):
+    if offset[2] is None:
+        axes.append(":")
+    else:
         bounds = (
             (common.AxisBound.start(), common.AxisBound.start(offset=1))
             if is_serial
             else (common.AxisBound.start(), common.AxisBound.end())
         )
         k_str = "k_" if is_serial else "k"
-        axes.append(_slice_string(k_str, offset[2], bounds))
-    elif isinstance(offset[2], str):
-        axes.append(offset[2])
+        axes.append(_slice_string(k_str, offset[2], bounds, origin[2]))
 
     return axes
 
 
-ORIGIN_CORRECTED_VIEW_CLASS = textwrap.dedent(
+def _reads_fields(node: Any) -> bool:
+    return bool(node.iter_tree().if_isinstance(npir.FieldSlice, npir.LocalScalarAccess).to_list())
+
+
+def _is_column_uniform_k_read(node: npir.FieldSlice) -> bool:
+    """Return whether a read with variable K offset reads the same levels in all columns."""
+    return not _reads_fields(node.k_offset) and not any(
+        _reads_fields(index) for index in node.data_index
+    )
+
+
+FIELD_VIEW_HELPERS = textwrap.dedent(
     """\
-    class Field:
-        def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
-            ii = iter(range(3))
-            self.idx_to_data = tuple(
-                [next(ii) if has_dim else None for has_dim in dimensions]
-                + list(range(sum(dimensions), len(field.shape)))
-            )
+    def _field_view_(field, origin, dimensions: Tuple[bool, bool, bool]):
+        # Return a view with the three spatial axes (length 1 if missing) and the origin
+        # in each of the axes (0 if missing)
+        shape_iter = iter(field.shape)
+        origin_iter = iter(origin)
+        shape = [next(shape_iter) if has_dim else 1 for has_dim in dimensions]
+        shape.extend(shape_iter)
+        view = np.reshape(field.data, shape).view(np.ndarray)
+        return view, tuple(next(origin_iter) if has_dim else 0 for has_dim in dimensions)
+
+    def _clip_k_(field, k):
+        # The levels read in `field` by an offset equal in all columns, clipped to its bounds
+        return np.clip(np.ravel(k), 0, field.shape[2] - 1)
+
+    def _gather_k_(view, i, j, k, *data_index):
+        # Read `view`, sliced to the horizontal bounds of the access, at the levels `k`.
+        # `i` and `j` are the index grids of the horizontal block, built here if None.
+        if np.max(k) >= view.shape[2] or np.min(k) < 0:
+            k = np.clip(k, 0, view.shape[2] - 1)
+        if i is None:
+            i = np.arange(view.shape[0])[:, np.newaxis, np.newaxis]
+            j = np.arange(view.shape[1])[np.newaxis, :, np.newaxis]
+        return view[(i, j, k, *data_index)]
+    """
+)
 
-            shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
-            self.field_view = np.reshape(field.data, shape).view(np.ndarray)
-
-            self.offsets = offsets
-
-        @classmethod
-        def empty(cls, shape, dtype, offset):
-            return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
-
-        def shim_key(self, key):
-            new_args = []
-            if not isinstance(key, tuple):
-                key = (key, )
-            for index in self.idx_to_data:
-                if index is None:
-                    new_args.append(slice(None, None))
-                else:
-                    idx = key[index]
-                    offset = self.offsets[index]
-                    if isinstance(idx, slice):
-                        new_args.append(
-                            slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
-                        )
-                    else:
-                        new_args.append(idx + offset)
-            if not isinstance(new_args[2], (numbers.Integral, slice)):
-                new_args = self.broadcast_and_clip_variable_k(new_args)
-            return tuple(new_args)
-
-        def broadcast_and_clip_variable_k(self, new_args: tuple):
-            assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
-            if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
-                new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
-            new_args[:2] = np.broadcast_arrays(
-                np.expand_dims(
-                    np.arange(new_args[0].start, new_args[0].stop),
-                    axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
-                ),
-                np.expand_dims(
-                    np.arange(new_args[1].start, new_args[1].stop),
-                    axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
-                ),
-            )
-            return new_args
 
-        def __getitem__(self, key):
-            return self.field_view.__getitem__(self.shim_key(key))
+TEMPORARY_ARENA_HELPERS = textwrap.dedent(
+    """\
+    class _TemporaryArena:
+        # Sets of temporary buffers kept across calls, keyed by the domain. A set is taken out
+        # of the arena for the duration of a call, so concurrent calls never share buffers.
+
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.free = collections.OrderedDict()
+
+        def acquire(self, domain):
+            domain = tuple(domain)
+            with self.lock:
+                buffer_sets = self.free.get(domain)
+                if buffer_sets:
+                    self.free.move_to_end(domain)
+                    return buffer_sets.pop()
+            return {}
+
+        def release(self, domain, buffers):
+            domain = tuple(domain)
+            capacity = gt_config.cache_settings["temporary_arena_size"]
+            with self.lock:
+                self.free.setdefault(domain, []).append(buffers)
+                self.free.move_to_end(domain)
+                size = sum(len(buffer_sets) for buffer_sets in self.free.values())
+                while size > capacity:
+                    oldest_domain, buffer_sets = next(iter(self.free.items()))
+                    buffer_sets.pop(0)
+                    if not buffer_sets:
+                        del self.free[oldest_domain]
+                    size -= 1
+
+        def clear(self):
+            with self.lock:
+                self.free.clear()
+
+    _arena_ = _TemporaryArena()
+
+    def _empty_(buffers, name, shape, dtype):
+        buffer = buffers.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = buffers[name] = np.empty(shape, dtype=dtype)
+        return buffer
+
+    def clear_temporaries():
+        _arena_.clear()
+    """
+)
+
+
+INPLACE_UFUNC_HELPERS = textwrap.dedent(
+    """\
+    def _ufunc_(buffers, slot, ufunc, dtype, *args):
+        # Evaluate `ufunc(*args)` into the scratch buffer `slot` of the current call
+        shape = np.broadcast_shapes(*(np.shape(arg) for arg in args))
+        key = ("scratch", slot)
+        out = buffers.get(key)
+        if out is None or out.shape != shape or out.dtype != dtype:
+            out = buffers[key] = np.empty(shape, dtype=dtype)
+        return ufunc(*args, out=out)
+    """
+)
+
+
+SPARSE_MASK_HELPERS = textwrap.dedent(
+    """\
+    def _compress_(value, mask, indices):
+        # The values of `value`, broadcast to the shape of `mask`, at the `indices` of the mask
+        return np.broadcast_to(value, mask.shape)[indices]
+    """
+)
+
 
-        def __setitem__(self, key, value):
-            return self.field_view.__setitem__(self.shim_key(key), value)
+TILED_EXECUTION_HELPERS = textwrap.dedent(
+    """\
+    _tile_executor_ = concurrent.futures.ThreadPoolExecutor(max_workers=_TILES_ - 1)
+
+    def _run_tiled_(block, start: int, stop: int):
+        n_tiles = min(_TILES_, stop - start)
+        if n_tiles < 2:
+            block(start, stop)
+            return
+
+        # np.errstate is thread-local: forward the current settings to the worker threads
+        errstate = np.geterr()
+
+        def run_tile(j, J):
+            with np.errstate(**errstate):
+                block(j, J)
+
+        bounds = [start + (stop - start) * tile // n_tiles for tile in range(n_tiles + 1)]
+        futures = [
+            _tile_executor_.submit(run_tile, j, J) for j, J in zip(bounds[1:-1], bounds[2:])
+        ]
+        block(bounds[0], bounds[1])
+        for future in futures:
+            future.result()
     """
 )
 
@@ -156,40 +264,85 @@ class NpirCodegen(TemplatedGenerator):
 
     contexts = (SymbolTableTrait.symtable_merger,)
 
+    def visit_FieldDecl(self, node: npir.FieldDecl, **kwargs: Any) -> Union[str, Collection[str]]:
+        return self.generic_visit(node, origin=", ".join(_origin_names(node.name)), **kwargs)
+
     FieldDecl = FormatTemplate(
-        "{name} = Field({name}, _origin_['{name}'], ({', '.join(dimensions)}))"
+        "{name}, ({origin}) = _field_view_({name}, _origin_['{name}'], ({', '.join(dimensions)}))"
     )
 
     TemporaryDecl = FormatTemplate(
-        "{name} = Field.empty((_dI_ + {padding[0]}, _dJ_ + {padding[1]}, _dK_), {dtype}, ({', '.join(offset)}, 0))"
+        "{name} = _empty_(_temporaries_, '{name}', (_dI_ + {padding[0]}, _dJ_ + {padding[1]}, _dK_), {dtype})"
     )
 
     LocalScalarDecl = FormatTemplate(
-        "{name} = Field.empty((_dI_ + {upper[0] + lower[0]}, _dJ_ + {upper[1] + lower[1]}, {ksize}), {dtype}, ({', '.join(str(l) for l in lower)}, 0))"
+        "{name} = np.empty((_dI_ + {upper[0] + lower[0]}, _dJ_ + {upper[1] + lower[1]}, {ksize}), dtype={dtype})"
     )
 
     VarKOffset = FormatTemplate("lk + {k}")
 
-    def visit_FieldSlice(self, node: npir.FieldSlice, **kwargs: Any) -> Union[str, Collection[str]]:
-        k_offset = (
-            self.visit(node.k_offset, **kwargs)
-            if isinstance(node.k_offset, npir.VarKOffset)
-            else node.k_offset
+    def visit_FieldSlice(
+        self, node: npir.FieldSlice, *, compress_to_mask: bool = False, **kwargs: Any
+    ) -> Union[str, Collection[str]]:
+        access = self._field_slice_access(node, **kwargs)
+        return f"_compress_({access}, _mask_, _idx_)" if compress_to_mask else access
+
+    def _field_slice_access(self, node: npir.FieldSlice, **kwargs: Any) -> str:
+        offsets: Tuple[Optional[int], Optional[int], Optional[int]] = (
+            node.i_offset,
+            node.j_offset,
+            node.k_offset if isinstance(node.k_offset, int) else 0,
         )
-        offsets = (node.i_offset, node.j_offset, k_offset)
+        origin: Tuple[Optional[str], Optional[str], Optional[str]] = (None, None, None)
 
         # To determine: when is the symbol name not in the symtable?
         if node.name in kwargs.get("symtable", {}):
             decl = kwargs["symtable"][node.name]
-            dimensions = decl.dimensions if isinstance(decl, npir.FieldDecl) else [True] * 3
-            offsets = cast(
-                Tuple[Optional[int], Optional[int], Optional[Union[str, int]]],
-                tuple(off if has_dim else None for has_dim, off in zip(dimensions, offsets)),
-            )
+            if isinstance(decl, npir.FieldDecl):
+                # API fields are indexed relative to their origin, set at the top of `run`
+                origin = _origin_names(node.name)
+                offsets = cast(
+                    Tuple[Optional[int], Optional[int], Optional[int]],
+                    tuple(
+                        off if has_dim else None for has_dim, off in zip(decl.dimensions, offsets)
+                    ),
+                )
+            elif isinstance(decl, npir.TemporaryDecl):
+                offsets = (offsets[0] + decl.offset[0], offsets[1] + decl.offset[1], offsets[2])
 
-        args = _make_slice_access(offsets, kwargs["is_serial"], kwargs.get("horizontal_mask"))
         data_index = self.visit(node.data_index, inside_slice=True, **kwargs)
 
+        if isinstance(node.k_offset, npir.VarKOffset):
+            horizontal_mask = kwargs.get("horizontal_mask")
+            view = "{}[{}]".format(
+                node.name,
+                ", ".join(
+                    _make_slice_access(offsets, kwargs["is_serial"], horizontal_mask, origin)[:2]
+                ),
+            )
+            k_index = self.visit(node.k_offset, **kwargs)
+            if origin[2]:
+                k_index = f"{k_index} + {origin[2]}"
+            clipped_k = kwargs.get("clipped_k_indices", {}).get((node.name, k_index))
+            if clipped_k is not None:
+                field_view = f"{view[:-1]}, :, {', '.join(data_index)}]" if data_index else view
+                return f"np.take({field_view}, {clipped_k}, axis=2)"
+            has_grids = (
+                kwargs.get("has_var_k_grids", False)
+                and horizontal_mask is None
+                and None not in offsets[:2]
+            )
+            key_args = [
+                view,
+                *(("_vk_i_", "_vk_j_") if has_grids else ("None", "None")),
+                k_index,
+                *data_index,
+            ]
+            return f"_gather_k_({', '.join(key_args)})"
+
+        args = _make_slice_access(
+            offsets, kwargs["is_serial"], kwargs.get("horizontal_mask"), origin
+        )
         access_slice = ", ".join(args + list(data_index))
 
         return f"{node.name}[{access_slice}]"
@@ -200,12 +353,15 @@ class NpirCodegen(TemplatedGenerator):
         *,
         is_serial: bool,
         horizontal_mask: Optional[common.HorizontalMask] = None,
+        lower: Tuple[int, int] = (0, 0),
+        compress_to_mask: bool = False,
         **kwargs: Any,
     ) -> Union[str, Collection[str]]:
-        args = _make_slice_access((0, 0, 0), is_serial, horizontal_mask)
+        args = _make_slice_access((lower[0], lower[1], 0), is_serial, horizontal_mask)
         if is_serial:
             args[2] = ":"
-        return f"{node.name}[{', '.join(args)}]"
+        access = f"{node.name}[{', '.join(args)}]"
+        return f"_compress_({access}, _mask_, _idx_)" if compress_to_mask else access
 
     ParamAccess = FormatTemplate("{name}")
 
@@ -259,13 +415,146 @@ class NpirCodegen(TemplatedGenerator):
 
     NativeFuncCall = FormatTemplate("{func}({', '.join(arg for arg in args)}{mask_arg})")
 
+    @dataclass
+    class ScratchSlots:
+        free: List[int] = field(default_factory=list)
+        count: int = 0
+
+        def acquire(self) -> int:
+            if self.free:
+                return self.free.pop()
+            self.count += 1
+            return self.count - 1
+
+    _INPLACE_UFUNC_NODES = (npir.VectorArithmetic, npir.VectorUnaryOp, npir.NativeFuncCall)
+
+    def _lower_to_ufuncs(
+        self,
+        node: npir.Expr,
+        *,
+        stmts: List[str],
+        slots: "ScratchSlots",
+        out: Optional[str] = None,
+        is_tiled: bool = False,
+        **kwargs: Any,
+    ) -> Tuple[str, Optional[int]]:
+        """Lower `node` to ufunc calls writing to scratch buffers, returned in `stmts`.
+
+        Returns the expression of the result and its scratch slot, if any. If `out` is given
+        and `node` is lowered, the result is written to `out` and the returned expression is
+        empty. Only floating point vector operations are lowered, the others are rendered
+        as usual.
+        """
+        if isinstance(node, npir.VectorTernaryOp):
+            cond, true_expr, false_expr = (
+                self._lower_to_ufuncs(expr, stmts=stmts, slots=slots, is_tiled=is_tiled, **kwargs)
+                for expr in (node.cond, node.true_expr, node.false_expr)
+            )
+            return f"np.where({cond[0]}, {true_expr[0]}, {false_expr[0]})", None
+
+        if (
+            not isinstance(node, self._INPLACE_UFUNC_NODES)
+            or node.kind != common.ExprKind.FIELD
+            or node.dtype not in (common.DataType.FLOAT32, common.DataType.FLOAT64)
+            or (
+                isinstance(node, npir.VectorArithmetic)
+                and not isinstance(node.op, common.ArithmeticOperator)
+            )
+            or (isinstance(node, npir.VectorUnaryOp) and node.op != common.UnaryOperator.NEG)
+        ):
+            return self.visit(node, is_tiled=is_tiled, **kwargs), None
+
+        if isinstance(node, npir.VectorArithmetic):
+            func = {
+                common.ArithmeticOperator.ADD: "np.add",
+                common.ArithmeticOperator.SUB: "np.subtract",
+                common.ArithmeticOperator.MUL: "np.multiply",
+                common.ArithmeticOperator.DIV: "np.true_divide",
+            }[node.op]
+            operands = [node.left, node.right]
+        elif isinstance(node, npir.VectorUnaryOp):
+            func = "np.negative"
+            operands = [node.expr]
+        else:
+            func = self.visit(node.func, **kwargs)
+            operands = node.args
+
+        args = []
+        operand_slots = []
+        for operand in operands:
+            arg, slot = self._lower_to_ufuncs(
+                operand, stmts=stmts, slots=slots, is_tiled=is_tiled, **kwargs
+            )
+            args.append(arg)
+            if slot is not None:
+                operand_slots.append(slot)
+
+        if out is not None:
+            stmts.append(f"{func}({', '.join(args)}, out={out})")
+            return "", None
+
+        # The buffers of the operands can be reused for the result
+        slots.free.extend(reversed(operand_slots))
+        slot = slots.acquire()
+        # Tiles of the same block run concurrently and need their own buffers
+        slot_key = f"({slot}, j)" if is_tiled else str(slot)
+        dtype = self.visit(node.dtype, **kwargs)
+        stmts.append(
+            f"_s{slot}_ = _ufunc_(_temporaries_, {slot_key}, {func}, {dtype}, {', '.join(args)})"
+        )
+        return f"_s{slot}_", slot
+
     def visit_VectorAssign(
-        self, node: npir.VectorAssign, *, ctx: "BlockContext", **kwargs: Any
+        self,
+        node: npir.VectorAssign,
+        *,
+        ctx: "BlockContext",
+        inplace_ufuncs: bool = False,
+        sparse_mask_density: Optional[float] = None,
+        **kwargs: Any,
     ) -> Union[str, Collection[str]]:
         left = self.visit(node.left, horizontal_mask=node.horizontal_mask, **kwargs)
+        if sparse_mask_density is not None and isinstance(node.right, npir.VectorTernaryOp):
+            expr_kwargs = {**kwargs, "horizontal_mask": node.horizontal_mask}
+            # Masked assignments are lowered by `OirToNpir` to `left = where(mask, expr, left)`
+            if self.visit(node.right.false_expr, **expr_kwargs) == left:
+                return self.SparseMaskedAssign.render(
+                    left=left,
+                    cond=self.visit(node.right.cond, **expr_kwargs),
+                    true_expr=self.visit(node.right.true_expr, **expr_kwargs),
+                    compressed_true_expr=self.visit(
+                        node.right.true_expr, compress_to_mask=True, **expr_kwargs
+                    ),
+                    density=sparse_mask_density,
+                )
+        if inplace_ufuncs:
+            stmts: List[str] = []
+            # The last ufunc writes directly to the assigned slice
+            right, _ = self._lower_to_ufuncs(
+                node.right,
+                stmts=stmts,
+                slots=self.ScratchSlots(),
+                out=left,
+                horizontal_mask=node.horizontal_mask,
+                **kwargs,
+            )
+            return "\n".join([*stmts, f"{left} = {right}"] if right else stmts)
         right = self.visit(node.right, horizontal_mask=node.horizontal_mask, **kwargs)
         return f"{left} = {right}"
 
+    SparseMaskedAssign = JinjaTemplate(
+        textwrap.dedent(
+            """\
+            _target_ = {{ left }}
+            _mask_ = np.broadcast_to({{ cond }}, _target_.shape)
+            if np.count_nonzero(_mask_) <= {{ density }} * _mask_.size:
+                _idx_ = np.nonzero(_mask_)
+                _target_[_idx_] = {{ compressed_true_expr }}
+            else:
+                np.copyto(_target_, {{ true_expr }}, where=_mask_, casting="unsafe")"""
+        )
+    )
+
     VectorArithmetic = FormatTemplate("({left} {op} {right})")
 
     VectorLogic = FormatTemplate("np.bitwise_{op}({left}, {right})")
@@ -317,19 +606,42 @@ class NpirCodegen(TemplatedGenerator):
     )
 
     def visit_While(self, node: npir.While, **kwargs: Any) -> str:
-        cond = self.visit(node.cond, **kwargs)
+        cond = self.visit(node.cond, horizontal_mask=node.horizontal_mask, **kwargs)
         body = []
         for stmt in self.visit(node.body, **kwargs):
             body.extend(stmt.split("\n"))
         return self.While.render(cond=cond, body=body)
 
-    def visit_VerticalPass(self, node: npir.VerticalPass, **kwargs):
+    def visit_VerticalPass(self, node: npir.VerticalPass, *, tiles: int = 1, **kwargs):
         is_serial = node.direction != common.LoopOrder.PARALLEL
         has_variable_k = bool(node.iter_tree().if_isinstance(npir.VarKOffset).to_list())
+
+        # Reads with a variable K offset equal in all columns share the clipped levels
+        clipped_k_indices: Dict[Tuple[str, str], str] = {}
+        clip_stmts: List[str] = []
+        for field_slice in node.iter_tree().if_isinstance(npir.FieldSlice):
+            if not isinstance(field_slice.k_offset, npir.VarKOffset):
+                continue
+            if not _is_column_uniform_k_read(field_slice):
+                continue
+            k_index = self.visit(field_slice.k_offset, is_serial=is_serial, **kwargs)
+            decl = kwargs.get("symtable", {}).get(field_slice.name)
+            if isinstance(decl, npir.FieldDecl):
+                k_index = f"{k_index} + {_origin_names(field_slice.name)[2]}"
+            key = (field_slice.name, k_index)
+            if key not in clipped_k_indices:
+                clipped_k_indices[key] = f"_vk{len(clip_stmts)}_"
+                clip_stmts.append(
+                    f"{clipped_k_indices[key]} = _clip_k_({field_slice.name}, {k_index})"
+                )
+
         return self.generic_visit(
             node,
             is_serial=is_serial,
+            is_tiled=tiles > 1 and not is_serial,
             has_variable_k=has_variable_k,
+            clipped_k_indices=clipped_k_indices,
+            clip_stmts=clip_stmts,
             ksize="_dK_" if not is_serial else "1",
             lk_stmt="lk = " + ("k_" if is_serial else "np.arange(k, K)[np.newaxis, np.newaxis, :]"),
             **kwargs,
@@ -344,6 +656,8 @@ class NpirCodegen(TemplatedGenerator):
             {{ direction }}{% set body_indent = 4 %}{% endif %}
             {% if has_variable_k %}
             {{ lk_stmt | indent(body_indent, first=True) }}
+            {% for stmt in clip_stmts %}{{ stmt | indent(body_indent, first=True) }}
+            {% endfor -%}
             {% endif -%}
             {% for hblock in body %}
             {{ hblock | indent(body_indent, first=True) }}
@@ -353,11 +667,49 @@ class NpirCodegen(TemplatedGenerator):
     )
 
     def visit_HorizontalBlock(
-        self, node: npir.HorizontalBlock, **kwargs: Any
+        self, node: npir.HorizontalBlock, *, is_tiled: bool = False, **kwargs: Any
     ) -> Union[str, Collection[str]]:
         lower = (-node.extent[0][0], -node.extent[1][0])
         upper = (node.extent[0][1], node.extent[1][1])
-        return self.generic_visit(node, lower=lower, upper=upper, ctx=self.BlockContext(), **kwargs)
+        # Index grids shared by the reads with a variable K offset differing between columns
+        has_var_k_grids = any(
+            not _is_column_uniform_k_read(field_slice)
+            for stmt in node.iter_tree().if_isinstance(npir.VectorAssign)
+            if stmt.horizontal_mask is None
+            for field_slice in stmt.iter_tree().if_isinstance(npir.FieldSlice)
+            if isinstance(field_slice.k_offset, npir.VarKOffset)
+        )
+
+        # Horizontal masks are relative to the bounds of the whole block: statements restricted
+        # to a horizontal region run once on the slice of the region, between the tiled
+        # segments of the other statements.
+        ctx = self.BlockContext()
+        segments: List[Tuple[bool, List[str]]] = []
+        for stmt in node.body:
+            is_stmt_tiled = is_tiled and not any(
+                child.horizontal_mask is not None
+                for child in stmt.iter_tree().if_isinstance(npir.VectorAssign, npir.While)
+            )
+            rendered = self.visit(
+                stmt,
+                lower=lower,
+                upper=upper,
+                is_tiled=is_stmt_tiled,
+                ctx=ctx,
+                has_var_k_grids=has_var_k_grids,
+                **kwargs,
+            )
+            if not segments or segments[-1][0] != is_stmt_tiled:
+                segments.append((is_stmt_tiled, []))
+            segments[-1][1].append(rendered)
+
+        return self.HorizontalBlock.render(
+            lower=lower,
+            upper=upper,
+            segments=segments,
+            has_var_k_grids=has_var_k_grids,
+            is_tiled=is_tiled,
+        )
 
     HorizontalBlock = JinjaTemplate(
         textwrap.dedent(
@@ -366,7 +718,24 @@ class NpirCodegen(TemplatedGenerator):
             i, I = _di_ - {{ lower[0] }}, _dI_ + {{ upper[0] }}
             j, J = _dj_ - {{ lower[1] }}, _dJ_ + {{ upper[1] }}
 
-            {% for stmt in body %}{{ stmt }}
+            {% if has_var_k_grids and not is_tiled -%}
+            _vk_i_ = np.arange(I - i)[:, np.newaxis, np.newaxis]
+            _vk_j_ = np.arange(J - j)[np.newaxis, :, np.newaxis]
+            {% endif -%}
+            {% for segment_is_tiled, segment in segments -%}
+            {% if segment_is_tiled -%}
+            def _horizontal_block_(j, J):
+                {% if has_var_k_grids -%}
+                _vk_i_ = np.arange(I - i)[:, np.newaxis, np.newaxis]
+                _vk_j_ = np.arange(J - j)[np.newaxis, :, np.newaxis]
+                {% endif -%}
+                {% for stmt in segment %}{{ stmt | indent(4) }}
+                {% endfor %}
+            _run_tiled_(_horizontal_block_, j, J)
+            {% else -%}
+            {% for stmt in segment %}{{ stmt }}
+            {% endfor -%}
+            {% endif -%}
             {% endfor -%}
             # --- end horizontal block --
 
@@ -375,27 +744,78 @@ class NpirCodegen(TemplatedGenerator):
     )
 
     def visit_Computation(
-        self, node: npir.Computation, *, ignore_np_errstate: bool = True, **kwargs: Any
+        self,
+        node: npir.Computation,
+        *,
+        ignore_np_errstate: bool = True,
+        tiles: int = 1,
+        inplace_ufuncs: bool = False,
+        sparse_mask_density: Optional[float] = None,
+        **kwargs: Any,
     ) -> Union[str, Collection[str]]:
+        """Generate the module of the computation.
+
+        With `inplace_ufuncs`, floating point vector expressions are evaluated with ufunc calls
+        writing to scratch buffers reused across statements and calls, instead of allocating
+        a new array for every intermediate result.
+
+        The buffers of the temporaries are taken from an arena of the module, which keeps them
+        across calls with the same domain (see `cache_settings["temporary_arena_size"]`).
+
+        With `tiles > 1`, the horizontal blocks of parallel vertical passes are split into
+        `tiles` blocks of J rows run in a thread pool (NumPy releases the GIL in the ufunc
+        loops). Serial vertical passes always run in the calling thread.
+
+        With `sparse_mask_density`, masked assignments check at run time the fraction of points
+        where the mask is set. Up to this fraction, the assigned expression is only evaluated
+        at these points, gathered with `np.nonzero`, and scattered back to the target.
+        """
+        if tiles < 1:
+            raise ValueError(f"The number of tiles must be positive, got {tiles}")
+        if sparse_mask_density is not None and not 0 <= sparse_mask_density <= 1:
+            raise ValueError(
+                f"The sparse mask density must be between 0 and 1, got {sparse_mask_density}"
+            )
         signature = ["*", *node.arguments, "_domain_", "_origin_"]
         return self.generic_visit(
             node,
             signature=", ".join(signature),
-            data_view_class=ORIGIN_CORRECTED_VIEW_CLASS,
+            field_view_helpers=FIELD_VIEW_HELPERS,
+            temporary_arena_helpers=TEMPORARY_ARENA_HELPERS,
+            tiled_execution_helpers=TILED_EXECUTION_HELPERS if tiles > 1 else "",
+            inplace_ufunc_helpers=INPLACE_UFUNC_HELPERS if inplace_ufuncs else "",
+            sparse_mask_helpers=SPARSE_MASK_HELPERS if sparse_mask_density is not None else "",
             ignore_np_errstate=ignore_np_errstate,
+            tiles=tiles,
+            inplace_ufuncs=inplace_ufuncs,
+            sparse_mask_density=sparse_mask_density,
             **kwargs,
         )
 
     Computation = JinjaTemplate(
         textwrap.dedent(
             """\
-            import numbers
+            {% if tiles > 1 -%}
+            import concurrent.futures
+            {% endif -%}
+            import collections
+            import threading
             from typing import Tuple
 
             import numpy as np
             import scipy.special
 
-            {{ data_view_class }}
+            from gt4py import config as gt_config
+
+            {{ field_view_helpers }}
+            {{ temporary_arena_helpers }}
+            {{ inplace_ufunc_helpers }}
+            {{ sparse_mask_helpers }}
+            {% if tiles > 1 %}
+            _TILES_ = {{ tiles }}
+
+            {{ tiled_execution_helpers }}
+            {% endif %}
 
             def run({{ signature }}):
 
@@ -406,20 +826,26 @@ class NpirCodegen(TemplatedGenerator):
 
                 {% for decl in api_field_decls %}{{ decl | indent(4) }}
                 {% endfor %}
-                {% for decl in temp_decls %}{{ decl | indent(4) }}
-                {% endfor %}
-
-                {% if ignore_np_errstate -%}
-                with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
-                {%- else -%}
-                with np.errstate():
-                {%- endif %}
-
-                {% for pass in vertical_passes %}
-                {{ pass | indent(8) }}
-                {% else %}
-                    pass
-                {% endfor %}
+                _temporaries_ = _arena_.acquire(_domain_)
+                try:
+                    {% for decl in temp_decls %}{{ decl | indent(8) }}
+                    {% endfor %}
+
+                    {% if ignore_np_errstate -%}
+                    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+                    {%- else -%}
+                    with np.errstate():
+                    {%- endif %}
+
+                    {% for pass in vertical_passes %}
+                    {{ pass | indent(12) }}
+                    {% else %}
+                        pass
+                    {% endfor %}
+
+                finally:
+                    # the temporaries go back to the arena also if the computation fails
+                    _arena_.release(_domain_, _temporaries_)
             """
         )
     )
@@ -172,7 +172,12 @@ class OirToNpir(NodeTranslator):
         return npir.VectorAssign(left=left, right=right, horizontal_mask=horizontal_mask)
 
     def visit_While(
-        self, node: oir.While, *, mask: Optional[npir.Expr] = None, **kwargs: Any
+        self,
+        node: oir.While,
+        *,
+        mask: Optional[npir.Expr] = None,
+        horizontal_mask: Optional[common.HorizontalMask] = None,
+        **kwargs: Any,
     ) -> npir.While:
         cond = self.visit(node.cond, mask=mask, **kwargs)
         if mask:
@@ -180,7 +185,11 @@ class OirToNpir(NodeTranslator):
         else:
             mask = cond
         return npir.While(
-            cond=cond, body=utils.flatten_list(self.visit(node.body, mask=mask, **kwargs))
+            cond=cond,
+            body=utils.flatten_list(
+                self.visit(node.body, mask=mask, horizontal_mask=horizontal_mask, **kwargs)
+            ),
+            horizontal_mask=horizontal_mask,
         )
 
     def visit_HorizontalRestriction(
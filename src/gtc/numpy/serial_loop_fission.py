@@ -0,0 +1,157 @@
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""An optimization to move statements not carrying values across levels out of serial loops."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Set, Union
+
+from eve import NodeTranslator
+from gtc import common
+from gtc.numpy import npir
+
+
+@dataclass
+class _StmtAccesses:
+    stmt: npir.Stmt
+    reads: Set[str]
+    writes: Set[str]
+
+
+def _accessed_names(node: Any) -> Set[str]:
+    return set(
+        node.iter_tree().if_isinstance(npir.FieldSlice, npir.LocalScalarAccess).getattr("name")
+    )
+
+
+def _stmt_accesses(stmt: npir.Stmt) -> _StmtAccesses:
+    if isinstance(stmt, npir.VectorAssign):
+        # Only the indices of the left hand side are read
+        reads = _accessed_names(stmt.right)
+        for index_expr in getattr(stmt.left, "data_index", []):
+            reads |= _accessed_names(index_expr)
+        if isinstance(getattr(stmt.left, "k_offset", None), npir.VarKOffset):
+            reads |= _accessed_names(stmt.left.k_offset)
+        return _StmtAccesses(stmt=stmt, reads=reads, writes={stmt.left.name})
+
+    # Conservatively treat everything accessed in other statements as read and written
+    writes = {assign.left.name for assign in stmt.iter_tree().if_isinstance(npir.VectorAssign)}
+    return _StmtAccesses(stmt=stmt, reads=_accessed_names(stmt), writes=writes)
+
+
+def _level_local_fields(vertical_pass: npir.VerticalPass) -> Set[str]:
+    """Return the fields only read at the current level (k offset 0) in the pass."""
+    non_local = {
+        field_slice.name
+        for field_slice in vertical_pass.iter_tree().if_isinstance(npir.FieldSlice)
+        if not isinstance(field_slice.k_offset, int) or field_slice.k_offset != 0
+    }
+    all_names = set(
+        vertical_pass.iter_tree()
+        .if_isinstance(npir.FieldSlice, npir.LocalScalarAccess)
+        .getattr("name")
+    )
+    return all_names - non_local
+
+
+def _hoistable_statements(vertical_pass: npir.VerticalPass) -> Set[int]:
+    """Return the ids of the statements of the pass not depending on other levels.
+
+    Starts from all vector assignments and removes the ones that, moved before the whole
+    serial loop (keeping their relative order), could observe or produce different values:
+
+    - the statement reads a field written in the pass by a statement staying in the loop,
+      by a later statement, or read at another level than the current one;
+    - the statement writes a field also written by a statement staying in the loop,
+      read at another level than the current one, or read by an earlier statement
+      staying in the loop.
+    """
+    stmts = [_stmt_accesses(stmt) for block in vertical_pass.body for stmt in block.body]
+    level_local = _level_local_fields(vertical_pass)
+    writers: Dict[str, List[int]] = {}
+    for index, accesses in enumerate(stmts):
+        for name in accesses.writes:
+            writers.setdefault(name, []).append(index)
+
+    hoisted = {
+        index
+        for index, accesses in enumerate(stmts)
+        if isinstance(accesses.stmt, npir.VectorAssign)
+    }
+    changed = True
+    while changed:
+        changed = False
+        for index in sorted(hoisted):
+            accesses = stmts[index]
+            is_hoistable = all(
+                name in level_local
+                and all(writer in hoisted and writer <= index for writer in writers[name])
+                for name in accesses.reads
+                if name in writers
+            ) and all(
+                name in level_local
+                and all(writer in hoisted for writer in writers[name])
+                and not any(
+                    name in stmts[other].reads for other in range(index) if other not in hoisted
+                )
+                for name in accesses.writes
+            )
+            if not is_hoistable:
+                hoisted.remove(index)
+                changed = True
+
+    return {id(stmts[index].stmt) for index in hoisted}
+
+
+class SerialLoopFission(NodeTranslator):
+    """Split serial vertical passes into a parallel pass and the serial loop.
+
+    Statements of FORWARD and BACKWARD passes that do not depend on values carried
+    from other levels are computed for all levels at once in a parallel pass before
+    the serial loop, which keeps only the remaining statements.
+    """
+
+    def visit_VerticalPass(
+        self, node: npir.VerticalPass, **kwargs: Any
+    ) -> Union[npir.VerticalPass, List[npir.VerticalPass]]:
+        if node.direction == common.LoopOrder.PARALLEL:
+            return node
+
+        hoisted = _hoistable_statements(node)
+        if not hoisted:
+            return node
+
+        parallel_blocks = []
+        serial_blocks = []
+        for block in node.body:
+            parallel_body = [stmt for stmt in block.body if id(stmt) in hoisted]
+            serial_body = [stmt for stmt in block.body if id(stmt) not in hoisted]
+            if parallel_body:
+                parallel_blocks.append(block.copy(update={"body": parallel_body}))
+            if serial_body:
+                serial_blocks.append(block.copy(update={"body": serial_body}))
+
+        passes = [
+            node.copy(update={"body": parallel_blocks, "direction": common.LoopOrder.PARALLEL})
+        ]
+        if serial_blocks:
+            passes.append(node.copy(update={"body": serial_blocks}))
+        return passes
+
+    def visit_Computation(self, node: npir.Computation, **kwargs: Any) -> npir.Computation:
+        vertical_passes: List[npir.VerticalPass] = []
+        for vertical_pass in node.vertical_passes:
+            result = self.visit(vertical_pass, **kwargs)
+            vertical_passes.extend(result if isinstance(result, list) else [result])
+        return node.copy(update={"vertical_passes": vertical_passes})
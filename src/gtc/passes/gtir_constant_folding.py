@@ -0,0 +1,274 @@
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from eve import NodeTranslator
+from gtc import gtir
+from gtc.common import (
+    ArithmeticOperator,
+    BuiltInLiteral,
+    DataType,
+    LogicalOperator,
+    NativeFunction,
+    UnaryOperator,
+    data_type_to_typestr,
+    op_to_ufunc,
+    typestr_to_data_type,
+)
+
+
+# Native functions whose result is exactly defined by IEEE 754, so that evaluating them at
+# compile time gives the same result as any backend would at run time.
+_EXACT_NATIVE_FUNCTIONS = {
+    NativeFunction.ABS,
+    NativeFunction.MIN,
+    NativeFunction.MAX,
+    NativeFunction.SQRT,
+    NativeFunction.FLOOR,
+    NativeFunction.CEIL,
+    NativeFunction.TRUNC,
+    NativeFunction.ISFINITE,
+    NativeFunction.ISINF,
+    NativeFunction.ISNAN,
+}
+
+
+def _literal_value(node: gtir.Expr) -> Optional[np.generic]:
+    """Return the value of a literal as NumPy scalar of its dtype, or `None` if not constant."""
+    if not isinstance(node, gtir.Literal):
+        return None
+    if node.dtype == DataType.BOOL:
+        value = str(node.value).lower()
+        return np.bool_(value == "true") if value in ("true", "false") else None
+    if isinstance(node.value, BuiltInLiteral):
+        return None
+    try:
+        return np.dtype(data_type_to_typestr(node.dtype)).type(node.value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _make_literal(value: np.generic, dtype: DataType) -> Optional[gtir.Literal]:
+    if typestr_to_data_type(np.asarray(value).dtype.str) != dtype:
+        return None
+    if dtype == DataType.BOOL:
+        literal: Union[BuiltInLiteral, str] = BuiltInLiteral.TRUE if value else BuiltInLiteral.FALSE
+    elif np.issubdtype(value.dtype, np.floating):
+        if not np.isfinite(value):
+            return None
+        # the exact value of the scalar, as the shortest string parses to the same double
+        literal = repr(float(value))
+    else:
+        literal = str(int(value))
+    return gtir.Literal(value=literal, dtype=dtype)
+
+
+def _evaluate(
+    func: Callable[..., Any], args: Sequence[gtir.Expr], dtype: DataType
+) -> Optional[gtir.Literal]:
+    values = [_literal_value(arg) for arg in args]
+    if any(value is None for value in values):
+        return None
+    if any(np.issubdtype(value.dtype, np.floating) and not np.isfinite(value) for value in values):
+        return None
+    with np.errstate(all="raise"):
+        try:
+            result = func(*values)
+        except (ArithmeticError, TypeError, ValueError):
+            return None
+    if np.issubdtype(np.asarray(result).dtype, np.integer):
+        # NumPy scalars silently wrap around on integer overflow, which is undefined in C++
+        exact = func(*(np.asarray(value.item(), dtype=object) for value in values))
+        if exact != int(result):
+            return None
+    return _make_literal(result, dtype)
+
+
+def _is_zero(value: Optional[np.generic], *, negative: bool) -> bool:
+    if value is None or value != 0:
+        return False
+    return not np.issubdtype(value.dtype, np.floating) or bool(np.signbit(value)) == negative
+
+
+def _simplify_binary_op(
+    op: Union[ArithmeticOperator, LogicalOperator], left: gtir.Expr, right: gtir.Expr
+) -> Optional[gtir.Expr]:
+    """Return an expression equivalent to the binary operation if it is an identity."""
+    left_value, right_value = _literal_value(left), _literal_value(right)
+    if op == ArithmeticOperator.MUL:
+        if right_value is not None and right_value == 1:
+            return left
+        if left_value is not None and left_value == 1:
+            return right
+    elif op == ArithmeticOperator.DIV:
+        if right_value is not None and right_value == 1:
+            return left
+    elif op == ArithmeticOperator.ADD:
+        # `x + 0.0` is not `x` for `x = -0.0`, but `x + (-0.0)` always is
+        if _is_zero(right_value, negative=True):
+            return left
+        if _is_zero(left_value, negative=True):
+            return right
+    elif op == ArithmeticOperator.SUB:
+        if _is_zero(right_value, negative=False):
+            return left
+    elif op in (LogicalOperator.AND, LogicalOperator.OR):
+        # `True` is absorbing for `or` and neutral for `and`, the other way round for `False`
+        absorbing = op == LogicalOperator.OR
+        for value, other in ((left_value, right), (right_value, left)):
+            if value is None:
+                continue
+            if bool(value) != absorbing:
+                return other
+            return gtir.Literal(
+                value=BuiltInLiteral.TRUE if absorbing else BuiltInLiteral.FALSE,
+                dtype=DataType.BOOL,
+            )
+    return None
+
+
+class _GTIRConstantFolding(NodeTranslator):
+    """
+    Evaluates constant expressions and removes statically decided branches.
+
+    Externals are inlined as literals by the frontend, so this evaluates expressions built from
+    them with the semantics of their data types, simplifies arithmetic and logical identities,
+    and replaces conditionals with constant conditions by the statements of the taken branch.
+    Floating point expressions are only rewritten where the result is exactly the one computed
+    at run time.
+
+    Precondition: all dtype transitions are explicit via a `Cast` node
+    Postcondition: no operation with only literal operands is left, except for operations that
+    overflow or are not exactly defined (e.g. transcendental functions)
+    """
+
+    def visit_UnaryOp(self, node: gtir.UnaryOp, **kwargs: Any) -> gtir.Expr:
+        expr = self.visit(node.expr, **kwargs)
+        if node.op == UnaryOperator.POS and expr.dtype == node.dtype:
+            return expr
+        folded = _evaluate(op_to_ufunc(node.op), [expr], node.dtype)
+        return folded or node.copy(update={"expr": expr})
+
+    def visit_BinaryOp(self, node: gtir.BinaryOp, **kwargs: Any) -> gtir.Expr:
+        left = self.visit(node.left, **kwargs)
+        right = self.visit(node.right, **kwargs)
+        folded = _evaluate(op_to_ufunc(node.op), [left, right], node.dtype)
+        if folded:
+            return folded
+        simplified = _simplify_binary_op(node.op, left, right)
+        if simplified and simplified.dtype == node.dtype:
+            return simplified
+        return node.copy(update={"left": left, "right": right})
+
+    def visit_TernaryOp(self, node: gtir.TernaryOp, **kwargs: Any) -> gtir.Expr:
+        cond = self.visit(node.cond, **kwargs)
+        true_expr = self.visit(node.true_expr, **kwargs)
+        false_expr = self.visit(node.false_expr, **kwargs)
+        cond_value = _literal_value(cond)
+        if cond_value is not None:
+            selected = true_expr if cond_value else false_expr
+            if selected.dtype == node.dtype:
+                return selected
+        return node.copy(update={"cond": cond, "true_expr": true_expr, "false_expr": false_expr})
+
+    def visit_Cast(self, node: gtir.Cast, **kwargs: Any) -> gtir.Expr:
+        expr = self.visit(node.expr, **kwargs)
+        if expr.dtype == node.dtype:
+            return expr
+        value = _literal_value(expr)
+        if value is not None and np.isfinite(value):
+            target = np.dtype(data_type_to_typestr(node.dtype))
+            # out-of-range conversions to integers are undefined behavior in C++
+            if not np.issubdtype(target, np.integer) or (
+                np.iinfo(target).min <= value <= np.iinfo(target).max
+            ):
+                folded = _make_literal(target.type(value), node.dtype)
+                if folded:
+                    return folded
+        return node.copy(update={"expr": expr})
+
+    def visit_NativeFuncCall(self, node: gtir.NativeFuncCall, **kwargs: Any) -> gtir.Expr:
+        args = self.visit(node.args, **kwargs)
+        if node.func in _EXACT_NATIVE_FUNCTIONS:
+            folded = _evaluate(op_to_ufunc(node.func), args, node.dtype)
+            if folded:
+                return folded
+        return node.copy(update={"args": args})
+
+    def _visit_body(self, body: List[gtir.Stmt], **kwargs: Any) -> List[gtir.Stmt]:
+        result: List[gtir.Stmt] = []
+        for stmt in body:
+            visited = self.visit(stmt, **kwargs)
+            result.extend(visited if isinstance(visited, list) else [visited])
+        return result
+
+    def _visit_if(
+        self, node: Union[gtir.FieldIfStmt, gtir.ScalarIfStmt], **kwargs: Any
+    ) -> Union[gtir.Stmt, List[gtir.Stmt]]:
+        cond = self.visit(node.cond, **kwargs)
+        true_branch = self.visit(node.true_branch, **kwargs)
+        false_branch = self.visit(node.false_branch, **kwargs) if node.false_branch else None
+        cond_value = _literal_value(cond)
+        if cond_value is not None:
+            # replaced by the statements of the taken branch, see `_visit_body`
+            taken = true_branch if cond_value else false_branch
+            return taken.body if taken else []
+        return node.copy(
+            update={"cond": cond, "true_branch": true_branch, "false_branch": false_branch}
+        )
+
+    visit_FieldIfStmt = _visit_if
+    visit_ScalarIfStmt = _visit_if
+
+    def visit_While(self, node: gtir.While, **kwargs: Any) -> Union[gtir.While, List[gtir.Stmt]]:
+        cond = self.visit(node.cond, **kwargs)
+        cond_value = _literal_value(cond)
+        if cond_value is not None and not cond_value:
+            return []
+        return node.copy(update={"cond": cond, "body": self._visit_body(node.body, **kwargs)})
+
+    def visit_HorizontalRestriction(
+        self, node: gtir.HorizontalRestriction, **kwargs: Any
+    ) -> Union[gtir.HorizontalRestriction, List[gtir.Stmt]]:
+        body = self._visit_body(node.body, **kwargs)
+        return node.copy(update={"body": body}) if body else []
+
+    def visit_BlockStmt(self, node: gtir.BlockStmt, **kwargs: Any) -> gtir.BlockStmt:
+        return node.copy(update={"body": self._visit_body(node.body, **kwargs)})
+
+    def visit_VerticalLoop(self, node: gtir.VerticalLoop, **kwargs: Any) -> gtir.VerticalLoop:
+        return node.copy(update={"body": self._visit_body(node.body, **kwargs)})
+
+    def visit_Stencil(self, node: gtir.Stencil, **kwargs: Any) -> gtir.Stencil:
+        vertical_loops: List[gtir.VerticalLoop] = []
+        removed_temporaries: List[gtir.FieldDecl] = []
+        for vertical_loop in self.visit(node.vertical_loops, **kwargs):
+            # loops left without statements are removed, as the OIR passes expect a body
+            if vertical_loop.body:
+                vertical_loops.append(vertical_loop)
+            else:
+                removed_temporaries.extend(vertical_loop.temporaries)
+        if vertical_loops and removed_temporaries:
+            # the temporaries of removed loops can still be accessed in the remaining ones
+            vertical_loops[-1] = vertical_loops[-1].copy(
+                update={"temporaries": [*vertical_loops[-1].temporaries, *removed_temporaries]}
+            )
+        return node.copy(update={"vertical_loops": vertical_loops})
+
+
+def fold_constants(node: gtir.Stencil) -> gtir.Stencil:
+    return _GTIRConstantFolding().visit(node)
@@ -15,6 +15,7 @@
 from typing import Callable, Dict, Optional, Sequence, Tuple
 
 from gtc import gtir
+from gtc.passes.gtir_constant_folding import fold_constants
 from gtc.passes.gtir_definitive_assignment_analysis import check as check_assignments
 from gtc.passes.gtir_dtype_resolver import resolve_dtype
 from gtc.passes.gtir_prune_unused_parameters import prune_unused_parameters
@@ -36,7 +37,15 @@ class GtirPipeline:
         self._cache: Dict[Tuple[PASS_T, ...], gtir.Stencil] = {}
 
     def steps(self) -> Sequence[PASS_T]:
-        return [check_assignments, prune_unused_parameters, resolve_dtype, upcast]
+        # parameters only accessed in branches removed by the constant folding are pruned again
+        return [
+            check_assignments,
+            prune_unused_parameters,
+            resolve_dtype,
+            upcast,
+            fold_constants,
+            prune_unused_parameters,
+        ]
 
     def apply(self, steps: Sequence[PASS_T]) -> gtir.Stencil:
         result = self.gtir
@@ -0,0 +1,267 @@
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import collections
+from dataclasses import dataclass
+from typing import Any, Callable, DefaultDict, Dict, Hashable, List, Optional, Set, Tuple
+
+from eve import NodeTranslator
+from eve.concepts import BaseNode
+from gtc import oir
+
+from .utils import collect_symbol_names, symbol_name_creator
+
+
+@dataclass(frozen=True)
+class _Occurrence:
+    key: Hashable
+    expr: oir.Expr
+    position: int
+    #: only evaluated in a masked body, a horizontal region or a while loop
+    conditional: bool
+    at_statement_entry: bool
+
+
+def _structure(node: Any) -> Hashable:
+    if isinstance(node, BaseNode):
+        return (
+            type(node).__name__,
+            tuple(
+                (name, _structure(value)) for name, value in node.iter_children() if name != "loc"
+            ),
+        )
+    if isinstance(node, (list, tuple)):
+        return tuple(_structure(value) for value in node)
+    return node
+
+
+def _read_names(node: BaseNode) -> Set[str]:
+    return (
+        node.iter_tree().if_isinstance(oir.FieldAccess, oir.ScalarAccess).getattr("name").to_set()
+    )
+
+
+def _written_names(node: BaseNode) -> Set[str]:
+    return node.iter_tree().if_isinstance(oir.AssignStmt).getattr("left").getattr("name").to_set()
+
+
+class _SubexpressionWalker(NodeTranslator):
+    """Visits a statement keeping track of the values read by each subexpression.
+
+    Two subexpressions get the same key if they are structurally equal and no symbol they read
+    was assigned in between. If `replace` is given, the subexpressions with the given key are
+    replaced by the given scalar access, otherwise all candidate subexpressions are collected.
+    """
+
+    def __init__(
+        self,
+        versions: DefaultDict[str, int],
+        *,
+        replace: Optional[Tuple[Hashable, oir.ScalarAccess]] = None,
+    ) -> None:
+        self.versions = versions
+        self.entry_versions = dict(versions)
+        self.replace = replace
+        self.occurrences: List[Tuple[Hashable, oir.Expr, bool, bool]] = []
+
+    def _key(self, node: oir.Expr) -> Tuple[Hashable, bool]:
+        reads = sorted((name, self.versions[name]) for name in _read_names(node))
+        at_entry = all(self.entry_versions.get(name, 0) == version for name, version in reads)
+        return (_structure(node), tuple(reads)), at_entry
+
+    def _visit_subexpression(self, node: oir.Expr, *, conditional: bool, **kwargs: Any) -> oir.Expr:
+        key, at_entry = self._key(node)
+        if self.replace is not None and key == self.replace[0]:
+            return oir.ScalarAccess(name=self.replace[1].name, dtype=self.replace[1].dtype)
+        node = self.generic_visit(node, conditional=conditional, **kwargs)
+        if _read_names(node):
+            self.occurrences.append((key, node, conditional, at_entry))
+        return node
+
+    visit_UnaryOp = _visit_subexpression
+    visit_BinaryOp = _visit_subexpression
+    visit_TernaryOp = _visit_subexpression
+    visit_Cast = _visit_subexpression
+    visit_NativeFuncCall = _visit_subexpression
+
+    def visit_AssignStmt(self, node: oir.AssignStmt, **kwargs: Any) -> oir.AssignStmt:
+        right = self.visit(node.right, **kwargs)
+        left = self.visit(node.left, **kwargs)
+        self.versions[node.left.name] += 1
+        return oir.AssignStmt(left=left, right=right, loc=node.loc)
+
+    def visit_MaskStmt(
+        self, node: oir.MaskStmt, *, conditional: bool, **kwargs: Any
+    ) -> oir.MaskStmt:
+        return oir.MaskStmt(
+            mask=self.visit(node.mask, conditional=conditional, **kwargs),
+            body=self.visit(node.body, conditional=True, **kwargs),
+            loc=node.loc,
+        )
+
+    def visit_HorizontalRestriction(
+        self, node: oir.HorizontalRestriction, **kwargs: Any
+    ) -> oir.HorizontalRestriction:
+        return oir.HorizontalRestriction(
+            mask=node.mask,
+            body=self.visit(node.body, **{**kwargs, "conditional": True}),
+            loc=node.loc,
+        )
+
+    def visit_While(self, node: oir.While, **kwargs: Any) -> oir.While:
+        # the condition and the body see the values of any previous iteration
+        for name in _written_names(node):
+            self.versions[name] += 1
+        kwargs["conditional"] = True
+        return oir.While(
+            cond=self.visit(node.cond, **kwargs), body=self.visit(node.body, **kwargs), loc=node.loc
+        )
+
+
+def _is_hoistable(occurrences: List[_Occurrence]) -> bool:
+    # Expressions that are only evaluated conditionally are not hoisted, since they would be
+    # evaluated where the condition does not hold: for expensive native function calls that is
+    # extra work, and may raise floating point errors the condition was guarding against.
+    return (
+        len(occurrences) >= 2
+        and occurrences[0].at_statement_entry
+        and any(not o.conditional for o in occurrences)
+    )
+
+
+class CommonSubexpressionElimination(NodeTranslator):
+    """Replaces repeated expressions in horizontal executions by local scalars.
+
+    Repeated side-effect-free subexpressions of each statement list are assigned once to a
+    new local scalar before their first use. Expressions that are always evaluated by the
+    statement list are shared with occurrences in nested masked bodies and horizontal regions,
+    while expressions repeated only in nested bodies are eliminated within each body. Larger
+    expressions are hoisted first, so that all subexpressions of a repeated expression are
+    computed once.
+    """
+
+    def _scan(self, stmts: List[oir.Stmt]) -> Dict[Hashable, List[_Occurrence]]:
+        occurrences: Dict[Hashable, List[_Occurrence]] = collections.defaultdict(list)
+        versions: DefaultDict[str, int] = collections.defaultdict(int)
+        for position, stmt in enumerate(stmts):
+            walker = _SubexpressionWalker(versions)
+            walker.visit(stmt, conditional=False)
+            for key, expr, conditional, at_entry in walker.occurrences:
+                occurrences[key].append(_Occurrence(key, expr, position, conditional, at_entry))
+        return occurrences
+
+    def _eliminate(
+        self,
+        stmts: List[oir.Stmt],
+        *,
+        declarations: List[oir.LocalScalar],
+        single_assignment_scalars: Set[str],
+        new_symbol_name: Callable[[str], str],
+    ) -> List[oir.Stmt]:
+        while True:
+            occurrences = self._scan(stmts)
+            hoistable = [
+                key_occurrences
+                for key_occurrences in occurrences.values()
+                if _is_hoistable(key_occurrences)
+            ]
+            if not hoistable:
+                break
+            first, *_ = max(
+                hoistable,
+                key=lambda o: (len(list(o[0].expr.iter_tree())), -o[0].position),
+            )
+            defining_stmt = stmts[first.position]
+            if (
+                not first.conditional
+                and isinstance(defining_stmt, oir.AssignStmt)
+                and isinstance(defining_stmt.left, oir.ScalarAccess)
+                and defining_stmt.left.name in single_assignment_scalars
+                and _structure(defining_stmt.right) == first.key[0]
+            ):
+                # reuse the local scalar that the expression is already assigned to
+                scalar = defining_stmt.left
+                replaced_positions = range(first.position + 1, len(stmts))
+                definition: List[oir.Stmt] = []
+            else:
+                scalar = oir.ScalarAccess(name=new_symbol_name("cse"), dtype=first.expr.dtype)
+                declarations.append(oir.LocalScalar(name=scalar.name, dtype=scalar.dtype))
+                single_assignment_scalars.add(scalar.name)
+                replaced_positions = range(first.position, len(stmts))
+                definition = [oir.AssignStmt(left=scalar, right=first.expr)]
+
+            # replay the preceding statements for the symbol versions
+            versions: DefaultDict[str, int] = collections.defaultdict(int)
+            for stmt in stmts[: replaced_positions.start]:
+                _SubexpressionWalker(versions).visit(stmt, conditional=False)
+            stmts = (
+                stmts[: first.position]
+                + definition
+                + stmts[first.position : replaced_positions.start]
+                + [
+                    _SubexpressionWalker(versions, replace=(first.key, scalar)).visit(
+                        stmt, conditional=False
+                    )
+                    for stmt in stmts[replaced_positions.start :]
+                ]
+            )
+
+        kwargs = dict(
+            declarations=declarations,
+            single_assignment_scalars=single_assignment_scalars,
+            new_symbol_name=new_symbol_name,
+        )
+        result: List[oir.Stmt] = []
+        for stmt in stmts:
+            if isinstance(stmt, oir.MaskStmt):
+                stmt = oir.MaskStmt(
+                    mask=stmt.mask, body=self._eliminate(stmt.body, **kwargs), loc=stmt.loc
+                )
+            elif isinstance(stmt, oir.HorizontalRestriction):
+                stmt = oir.HorizontalRestriction(
+                    mask=stmt.mask, body=self._eliminate(stmt.body, **kwargs), loc=stmt.loc
+                )
+            elif isinstance(stmt, oir.While):
+                stmt = oir.While(
+                    cond=stmt.cond, body=self._eliminate(stmt.body, **kwargs), loc=stmt.loc
+                )
+            result.append(stmt)
+        return result
+
+    def visit_HorizontalExecution(
+        self,
+        node: oir.HorizontalExecution,
+        *,
+        new_symbol_name: Callable[[str], str],
+        **kwargs: Any,
+    ) -> oir.HorizontalExecution:
+        assignment_counts = collections.Counter(
+            node.iter_tree().if_isinstance(oir.AssignStmt).getattr("left").getattr("name")
+        )
+        local_scalars = {decl.name for decl in node.declarations}
+        declarations = list(node.declarations)
+        body = self._eliminate(
+            node.body,
+            declarations=declarations,
+            single_assignment_scalars={
+                name for name in local_scalars if assignment_counts[name] == 1
+            },
+            new_symbol_name=new_symbol_name,
+        )
+        return oir.HorizontalExecution(body=body, declarations=declarations, loc=node.loc)
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
+        return self.generic_visit(
+            node, new_symbol_name=symbol_name_creator(collect_symbol_names(node)), **kwargs
+        )
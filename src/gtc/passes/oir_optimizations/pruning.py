@@ -12,7 +12,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Set, Tuple, Type
 
 from eve import NOTHING, NodeTranslator, iter_tree
 from gtc import oir
@@ -87,3 +87,143 @@ class UnreachableStmtPruning(NodeTranslator):
     ) -> Any:
         overlap = mask_overlap_with_extent(node.mask, block_extent)
         return NOTHING if overlap is None else node
+
+
+def _read_names(node: Any, access_type: Type[oir.Expr]) -> Set[str]:
+    """Names read by accesses of the given type, excluding the targets of assignments."""
+    targets = {id(left) for left in iter_tree(node).if_isinstance(oir.AssignStmt).getattr("left")}
+    return (
+        iter_tree(node)
+        .if_isinstance(access_type)
+        .filter(lambda access: id(access) not in targets)
+        .getattr("name")
+        .to_set()
+    )
+
+
+class DeadStorePruning(NodeTranslator):
+    """Removes assignments whose values are never read and the declarations they leave unused.
+
+    Local scalars are pruned using a backward liveness analysis of each horizontal execution
+    body. Assignments in masked bodies, horizontal regions and while loops do not kill liveness.
+    Temporaries written in a vertical loop are dead if neither this nor any later vertical loop
+    reads them. Pruning is repeated until nothing changes, since removed assignments may leave
+    others without readers.
+    """
+
+    def _prune(
+        self, stmts: List[oir.Stmt], live: Set[str], dead_fields: Set[str]
+    ) -> Tuple[List[oir.Stmt], Set[str]]:
+        """Prune a statement list given the scalars live at its end.
+
+        Returns the pruned statements and the scalars live at the start.
+        """
+        result: List[oir.Stmt] = []
+        for stmt in reversed(stmts):
+            if isinstance(stmt, oir.AssignStmt):
+                if stmt.left.name in dead_fields or (
+                    isinstance(stmt.left, oir.ScalarAccess) and stmt.left.name not in live
+                ):
+                    continue
+                if isinstance(stmt.left, oir.ScalarAccess):
+                    live = live - {stmt.left.name}
+                live = live | _read_names(stmt, oir.ScalarAccess)
+            elif isinstance(stmt, oir.MaskStmt):
+                body, body_live = self._prune(stmt.body, live, dead_fields)
+                if not body:
+                    continue
+                live = live | body_live | _read_names(stmt.mask, oir.ScalarAccess)
+                stmt = oir.MaskStmt(mask=stmt.mask, body=body, loc=stmt.loc)
+            elif isinstance(stmt, oir.HorizontalRestriction):
+                body, body_live = self._prune(stmt.body, live, dead_fields)
+                if not body:
+                    continue
+                live = live | body_live
+                stmt = oir.HorizontalRestriction(mask=stmt.mask, body=body, loc=stmt.loc)
+            elif isinstance(stmt, oir.While):
+                # values read by any later iteration are live throughout the loop
+                loop_live = live | _read_names(stmt.cond, oir.ScalarAccess)
+                while True:
+                    body, body_live = self._prune(stmt.body, loop_live, dead_fields)
+                    if body_live <= loop_live:
+                        break
+                    loop_live = loop_live | body_live
+                if not body:
+                    continue
+                live = loop_live
+                stmt = oir.While(cond=stmt.cond, body=body, loc=stmt.loc)
+            result.append(stmt)
+        return result[::-1], live
+
+    def visit_HorizontalExecution(
+        self, node: oir.HorizontalExecution, *, dead_fields: Set[str], **kwargs: Any
+    ) -> Any:
+        body, _ = self._prune(node.body, set(), dead_fields)
+        if not body:
+            return NOTHING
+        accessed_scalars = iter_tree(body).if_isinstance(oir.ScalarAccess).getattr("name").to_set()
+        return oir.HorizontalExecution(
+            body=body,
+            declarations=[decl for decl in node.declarations if decl.name in accessed_scalars],
+            loc=node.loc,
+        )
+
+    def visit_VerticalLoopSection(self, node: oir.VerticalLoopSection, **kwargs: Any) -> Any:
+        horizontal_executions = self.visit(node.horizontal_executions, **kwargs)
+        if not horizontal_executions:
+            return NOTHING
+        return oir.VerticalLoopSection(
+            interval=node.interval,
+            horizontal_executions=horizontal_executions,
+            loc=node.loc,
+        )
+
+    def visit_VerticalLoop(
+        self, node: oir.VerticalLoop, *, accessed_fields: Set[str], **kwargs: Any
+    ) -> Any:
+        sections = self.visit(node.sections, **kwargs)
+        if not sections:
+            return NOTHING
+        return oir.VerticalLoop(
+            loop_order=node.loop_order,
+            sections=sections,
+            caches=[cache for cache in node.caches if cache.name in accessed_fields],
+            loc=node.loc,
+        )
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
+        temporaries = {decl.name for decl in node.declarations}
+        vertical_loops = node.vertical_loops
+        num_stmts = None
+        while True:
+            accessed_fields = (
+                iter_tree(vertical_loops).if_isinstance(oir.FieldAccess).getattr("name").to_set()
+            )
+            later_reads: Set[str] = set()
+            pruned_loops = []
+            for vertical_loop in reversed(vertical_loops):
+                later_reads |= _read_names(vertical_loop, oir.FieldAccess)
+                pruned_loops.append(
+                    self.visit(
+                        vertical_loop,
+                        dead_fields=temporaries - later_reads,
+                        accessed_fields=accessed_fields,
+                        **kwargs,
+                    )
+                )
+            vertical_loops = [loop for loop in reversed(pruned_loops) if loop is not NOTHING]
+            pruned_num_stmts = len(iter_tree(vertical_loops).if_isinstance(oir.Stmt).to_list())
+            if pruned_num_stmts == num_stmts:
+                break
+            num_stmts = pruned_num_stmts
+
+        accessed_fields = (
+            iter_tree(vertical_loops).if_isinstance(oir.FieldAccess).getattr("name").to_set()
+        )
+        return oir.Stencil(
+            name=node.name,
+            params=node.params,
+            vertical_loops=vertical_loops,
+            declarations=[decl for decl in node.declarations if decl.name in accessed_fields],
+            loc=node.loc,
+        )
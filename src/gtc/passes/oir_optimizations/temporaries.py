@@ -13,12 +13,14 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import collections
-from typing import Any, Callable, Dict, Set, Union
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Set, Tuple, Union
 
 from eve import NodeTranslator, SymbolTableTrait
 from gtc import oir
+from gtc.definitions import Extent
 
-from .utils import AccessCollector, collect_symbol_names, symbol_name_creator
+from .utils import AccessCollector, collect_symbol_names, compute_extents, symbol_name_creator
 
 
 class TemporariesToScalarsBase(NodeTranslator):
@@ -162,3 +164,93 @@ class WriteBeforeReadTemporariesToScalars(TemporariesToScalarsBase):
             }
 
         return super().visit_Stencil(node, tmps_to_replace=write_before_read_tmps, **kwargs)
+
+
+class TemporaryStorageSharing(NodeTranslator):
+    """Lets temporaries with disjoint lifetimes share the same storage.
+
+    The lifetime of a temporary spans the vertical loops from its first to its last access.
+    Lifetimes are only compared at vertical loop granularity, since the horizontal executions
+    of a vertical loop may be executed level by level. Temporaries of equal dtype, dimensions
+    and data dimensions are assigned greedily, in order of first access, to the storage of a
+    temporary whose lifetime has already ended.
+
+    Since extents are accumulated backwards, sharing a storage extends the compute extents of
+    the horizontal executions writing the earlier temporaries by the extent of the later one.
+    A temporary thus only joins a storage if its extent is contained in the compute extents of
+    all horizontal executions writing that storage, leaving all compute extents unchanged.
+    Temporaries with caches are left untouched, as they do not necessarily require a full
+    storage.
+    """
+
+    @dataclass
+    class Storage:
+        name: str
+        #: index of the last vertical loop accessing the storage
+        end: int
+        #: intersection of the compute extents of the horizontal executions writing the storage
+        writer_extent: Extent
+
+    def visit_FieldAccess(
+        self, node: oir.FieldAccess, *, storage_map: Dict[str, str], **kwargs: Any
+    ) -> oir.FieldAccess:
+        node = self.generic_visit(node, storage_map=storage_map, **kwargs)
+        if node.name not in storage_map:
+            return node
+        return oir.FieldAccess(
+            name=storage_map[node.name],
+            offset=node.offset,
+            data_index=node.data_index,
+            dtype=node.dtype,
+            loc=node.loc,
+        )
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
+        fields_extents, block_extents = compute_extents(node)
+        cached = node.iter_tree().if_isinstance(oir.CacheDesc).getattr("name").to_set()
+        lifetimes: Dict[str, Tuple[int, int]] = {}
+        writer_extents: Dict[str, Extent] = {}
+        for index, vertical_loop in enumerate(node.vertical_loops):
+            for name in vertical_loop.iter_tree().if_isinstance(oir.FieldAccess).getattr("name"):
+                first, _ = lifetimes.get(name, (index, index))
+                lifetimes[name] = (first, index)
+            for horizontal_execution in vertical_loop.iter_tree().if_isinstance(
+                oir.HorizontalExecution
+            ):
+                block_extent = block_extents[id(horizontal_execution)]
+                for name in AccessCollector.apply(horizontal_execution).write_fields():
+                    writer_extents[name] = writer_extents.get(name, block_extent) & block_extent
+
+        storages: Dict[Hashable, List[TemporaryStorageSharing.Storage]] = collections.defaultdict(
+            list
+        )
+        storage_map: Dict[str, str] = {}
+        temporaries = sorted(
+            (
+                decl
+                for decl in node.declarations
+                if decl.name in lifetimes and decl.name not in cached
+            ),
+            key=lambda decl: lifetimes[decl.name],
+        )
+        for decl in temporaries:
+            first, last = lifetimes[decl.name]
+            extent = fields_extents.get(decl.name, Extent.zeros(ndims=2))
+            writer_extent = writer_extents.get(decl.name, extent)
+            key = (decl.dtype, decl.dimensions, decl.data_dims)
+            for storage in storages[key]:
+                if storage.end < first and extent <= storage.writer_extent:
+                    storage.end = last
+                    storage.writer_extent &= writer_extent
+                    storage_map[decl.name] = storage.name
+                    break
+            else:
+                storages[key].append(self.Storage(decl.name, last, writer_extent))
+
+        return oir.Stencil(
+            name=node.name,
+            params=node.params,
+            vertical_loops=self.visit(node.vertical_loops, storage_map=storage_map, **kwargs),
+            declarations=[decl for decl in node.declarations if decl.name not in storage_map],
+            loc=node.loc,
+        )
@@ -23,15 +23,23 @@ from gtc.passes.oir_optimizations.caches import (
     PruneKCacheFills,
     PruneKCacheFlushes,
 )
+from gtc.passes.oir_optimizations.common_subexpression_elimination import (
+    CommonSubexpressionElimination,
+)
 from gtc.passes.oir_optimizations.horizontal_execution_merging import (
     HorizontalExecutionMerging,
     OnTheFlyMerging,
 )
 from gtc.passes.oir_optimizations.inlining import MaskInlining
 from gtc.passes.oir_optimizations.mask_stmt_merging import MaskStmtMerging
-from gtc.passes.oir_optimizations.pruning import NoFieldAccessPruning, UnreachableStmtPruning
+from gtc.passes.oir_optimizations.pruning import (
+    DeadStorePruning,
+    NoFieldAccessPruning,
+    UnreachableStmtPruning,
+)
 from gtc.passes.oir_optimizations.temporaries import (
     LocalTemporariesToScalars,
+    TemporaryStorageSharing,
     WriteBeforeReadTemporariesToScalars,
 )
 from gtc.passes.oir_optimizations.vertical_loop_merging import AdjacentLoopMerging
@@ -74,12 +82,15 @@ class DefaultPipeline(OirPipeline):
             WriteBeforeReadTemporariesToScalars,
             MaskStmtMerging,
             MaskInlining,
+            CommonSubexpressionElimination,
+            DeadStorePruning,
             UnreachableStmtPruning,
             NoFieldAccessPruning,
             IJCacheDetection,
             KCacheDetection,
             PruneKCacheFills,
             PruneKCacheFlushes,
+            TemporaryStorageSharing,
         ]
 
     @property
@@ -0,0 +1,63 @@
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+from gt4py import gt_src_manager
+from gt4py import storage as gt_storage
+from gt4py import utils as gt_utils
+from gt4py.backend.bundle import build_bundle
+from gt4py.gtscript import PARALLEL, Field, computation, interval
+from gt4py.stencil_builder import StencilBuilder
+
+
+pytestmark = pytest.mark.skipif(
+    not gt_src_manager.has_gt_sources(), reason="GridTools sources are not available"
+)
+
+
+def add_one(in_field: Field[float], out_field: Field[float]):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        out_field = in_field + 1.0  # noqa: F841 # local variable assigned to but never used
+
+
+def scale(in_field: Field[float], out_field: Field[float], *, factor: float):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        out_field = factor * in_field  # noqa: F841 # local variable assigned to but never used
+
+
+@pytest.mark.parametrize("backend", ["gt:cpu_ifirst", "gt:cpu_kfirst"])
+def test_build_and_import_bundle(backend, tmp_path):
+    builders = [
+        StencilBuilder(definition, backend=backend).with_caching("nocaching", output_path=tmp_path)
+        for definition in (add_one, scale)
+    ]
+    loader_path = build_bundle(builders, name="stencils_bundle", output_path=tmp_path)
+    assert loader_path == tmp_path / "stencils_bundle.py"
+    # the stencils share a single extension module
+    (pyext_path,) = tmp_path.glob("**/*.so")
+    assert pyext_path.name.startswith("_stencils_bundle.")
+
+    stencils = gt_utils.make_module_from_file("stencils_bundle", loader_path)
+    data = np.random.default_rng(0).random((4, 5, 6))
+    in_field, out_field = (
+        gt_storage.from_array(data, backend=backend, default_origin=(0, 0, 0), dtype=float)
+        for _ in range(2)
+    )
+
+    stencils.add_one(in_field, out_field)
+    np.testing.assert_allclose(np.asarray(out_field), data + 1.0)
+    stencils.scale(in_field, out_field, factor=2.0)
+    np.testing.assert_allclose(np.asarray(out_field), 2.0 * data)
@@ -124,6 +124,51 @@ def test_stencil_without_effect(backend):
     stencil1(field_in)
 
 
+@pytest.mark.parametrize("backend", CPU_BACKENDS)
+def test_statically_false_conditionals(backend):
+    def only_conditional(a: gtscript.Field[np.float_], b: gtscript.Field[np.float_]):
+        from __externals__ import FLAG
+
+        with computation(PARALLEL), interval(...):
+            if FLAG:
+                b = a * 2.0
+
+    def partly_conditional(
+        a: gtscript.Field[np.float_],
+        b: gtscript.Field[np.float_],
+        c: gtscript.Field[np.float_],
+        *,
+        weight: float,
+    ):
+        from __externals__ import FLAG
+
+        with computation(PARALLEL), interval(...):
+            tmp = a + 1.0
+            if FLAG:
+                c = a * weight
+        with computation(PARALLEL), interval(...):
+            b = tmp
+
+    a, b, c = (
+        gt_storage.from_array(
+            np.full((3, 3, 3), value), dtype=np.float_, backend=backend, default_origin=(0, 0, 0)
+        )
+        for value in (1.0, 0.0, 5.0)
+    )
+
+    stencil = gtscript.stencil(backend, only_conditional, externals={"FLAG": False})
+    stencil(a, b)
+    b.device_to_host()
+    np.testing.assert_array_equal(np.asarray(b), 0.0)
+
+    stencil = gtscript.stencil(backend, partly_conditional, externals={"FLAG": False})
+    stencil(a, b, c, weight=2.0)
+    b.device_to_host()
+    c.device_to_host()
+    np.testing.assert_array_equal(np.asarray(b), 2.0)
+    np.testing.assert_array_equal(np.asarray(c), 5.0)
+
+
 @pytest.mark.parametrize("backend", CPU_BACKENDS)
 def test_stage_merger_induced_interval_block_reordering(backend):
     field_in = gt_storage.ones(
@@ -12,6 +12,10 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 import numpy as np
+import pytest
+
+from .stencil_definitions import EXTERNALS_REGISTRY as externals_registry
+from .stencil_definitions import REGISTRY as stencil_definitions
 
 
 def test_masked_vector_assignment():
@@ -35,3 +39,153 @@ def test_masked_vector_assignment():
     masked_vector_assignment(fld2D)
 
     assert np.allclose(fld2D, np.zeros((2, 3)))
+
+
+def test_tiled_execution():
+    from gt4py.gtscript import FORWARD, PARALLEL, Field, computation, interval, stencil
+    from gt4py.storage import from_array, zeros
+
+    BACKEND = "numpy"
+    dtype = np.float64
+
+    def diffusion_and_sum(in_field: Field[dtype], out_field: Field[dtype], coeff: float):
+        with computation(PARALLEL), interval(...):
+            lap = 4.0 * in_field - (
+                in_field[1, 0, 0] + in_field[-1, 0, 0] + in_field[0, 1, 0] + in_field[0, -1, 0]
+            )
+            out_field = in_field + coeff * (
+                4.0 * lap - (lap[1, 0, 0] + lap[-1, 0, 0] + lap[0, 1, 0] + lap[0, -1, 0])
+            )
+        with computation(FORWARD), interval(1, None):
+            out_field = out_field + out_field[0, 0, -1]
+
+    reference_stencil = stencil(BACKEND, diffusion_and_sum)
+    tiled_stencil = stencil(BACKEND, diffusion_and_sum, tiles=4)
+    assert hasattr(type(tiled_stencil).run.__globals__["computation"], "_run_tiled_")
+
+    rng = np.random.default_rng(0)
+    shape = (14, 13, 5)
+    in_field = from_array(rng.random(shape), dtype=dtype, backend=BACKEND, default_origin=(2, 2, 0))
+    reference_out = zeros(shape=shape, dtype=dtype, backend=BACKEND, default_origin=(2, 2, 0))
+    tiled_out = zeros(shape=shape, dtype=dtype, backend=BACKEND, default_origin=(2, 2, 0))
+
+    reference_stencil(in_field, reference_out, coeff=0.1)
+    tiled_stencil(in_field, tiled_out, coeff=0.1)
+
+    np.testing.assert_array_equal(np.asarray(tiled_out), np.asarray(reference_out))
+
+
+def test_temporary_arena():
+    from gt4py.gtscript import PARALLEL, Field, computation, interval, stencil
+    from gt4py.storage import ones, zeros
+
+    BACKEND = "numpy"
+    dtype = np.float64
+
+    @stencil(BACKEND)
+    def with_temporary(in_field: Field[dtype], out_field: Field[dtype]):
+        with computation(PARALLEL), interval(...):
+            tmp = 2.0 * in_field
+            out_field = tmp[1, 0, 0] + tmp[-1, 0, 0]  # noqa: F841 # assigned but never used
+
+    computation_module = type(with_temporary).run.__globals__["computation"]
+    in_field = ones(shape=(6, 5, 3), dtype=dtype, backend=BACKEND, default_origin=(1, 0, 0))
+    out_field = zeros(shape=(6, 5, 3), dtype=dtype, backend=BACKEND, default_origin=(1, 0, 0))
+
+    with_temporary(in_field, out_field)
+    (buffers,) = computation_module._arena_.free[(4, 5, 3)]
+    with_temporary(in_field, out_field)
+    (reused_buffers,) = computation_module._arena_.free[(4, 5, 3)]
+    assert reused_buffers is buffers
+    np.testing.assert_array_equal(np.asarray(out_field)[1:5], 4.0)
+
+    with_temporary.clear_temporaries()
+    assert not computation_module._arena_.free
+
+    # the temporaries are released when the computation raises
+    read_only_field = np.zeros((6, 5, 3), dtype=dtype)
+    read_only_field.flags.writeable = False
+    with pytest.raises(ValueError, match="read-only"):
+        computation_module.run(
+            in_field=np.asarray(in_field),
+            out_field=read_only_field,
+            _domain_=(4, 5, 3),
+            _origin_={"in_field": (1, 0, 0), "out_field": (1, 0, 0)},
+        )
+    assert len(computation_module._arena_.free[(4, 5, 3)]) == 1
+
+
+def _assert_same_as_default_options(name, **backend_opts):
+    from gt4py import gtscript
+    from gt4py.storage import from_array
+
+    BACKEND = "numpy"
+    stencil_definition = stencil_definitions[name]
+    externals = externals_registry[name]
+    reference_stencil = gtscript.stencil(BACKEND, stencil_definition, externals=externals)
+    stencil = gtscript.stencil(BACKEND, stencil_definition, externals=externals, **backend_opts)
+
+    rng = np.random.default_rng(0)
+    reference_args = {}
+    args_with_opts = {}
+    for arg_name, annotation in stencil_definition.__annotations__.items():
+        if isinstance(annotation, gtscript._FieldDescriptor):
+            shape = (23, 23, 23) + tuple(annotation.data_dims)
+            data = (rng.random(shape) + 0.5).astype(annotation.dtype)
+            for args in (reference_args, args_with_opts):
+                args[arg_name] = from_array(
+                    data,
+                    dtype=(annotation.dtype, annotation.data_dims)
+                    if annotation.data_dims
+                    else annotation.dtype,
+                    mask=gtscript.mask_from_axes(annotation.axes),
+                    backend=BACKEND,
+                    default_origin=(10, 10, 10),
+                )
+        else:
+            reference_args[arg_name] = args_with_opts[arg_name] = annotation(1.5)
+
+    reference_stencil(**reference_args, origin=(10, 10, 5), domain=(3, 3, 16))
+    stencil(**args_with_opts, origin=(10, 10, 5), domain=(3, 3, 16))
+
+    for arg_name, value in reference_args.items():
+        np.testing.assert_allclose(np.asarray(args_with_opts[arg_name]), np.asarray(value))
+
+
+@pytest.mark.parametrize("name", stencil_definitions)
+def test_inplace_ufuncs(name):
+    _assert_same_as_default_options(name, inplace_ufuncs=True)
+
+
+@pytest.mark.parametrize("density", [0.0, 1.0])
+@pytest.mark.parametrize("name", stencil_definitions)
+def test_sparse_masks(name, density):
+    _assert_same_as_default_options(name, sparse_mask_density=density)
+
+
+@pytest.mark.parametrize("tiles", [1, 3])
+def test_while_in_horizontal_region(tiles):
+    from gt4py.gtscript import PARALLEL, Field, I, computation, horizontal, interval, region
+    from gt4py.gtscript import stencil as gtscript_stencil
+    from gt4py.storage import from_array
+
+    BACKEND = "numpy"
+    dtype = np.float64
+
+    def halve_edge(field: Field[dtype]):
+        with computation(PARALLEL), interval(...):
+            field = field + 1.0
+            with horizontal(region[I[0], :]):
+                while field > 1.5:
+                    field = field * 0.5
+
+    stencil = gtscript_stencil(BACKEND, halve_edge, tiles=tiles)
+
+    data = np.random.default_rng(0).random((6, 7, 3)) + 1.0
+    field = from_array(data, dtype=dtype, backend=BACKEND, default_origin=(0, 0, 0))
+    stencil(field)
+
+    expected = data + 1.0
+    while (expected[0] > 1.5).any():
+        expected[0] = np.where(expected[0] > 1.5, expected[0] * 0.5, expected[0])
+    np.testing.assert_allclose(np.asarray(field), expected)
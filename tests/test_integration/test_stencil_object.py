@@ -14,13 +14,23 @@
 
 """Integration tests for StencilObjects."""
 
+import concurrent.futures
 from typing import Any, Dict
 
+import numpy as np
 import pytest
 
+from gt4py import config as gt_config
 from gt4py import gtscript
 from gt4py import storage as gt_storage
 from gt4py.gtscript import PARALLEL, Field, computation, interval
+from gt4py.stencil_object import (
+    StencilProgram,
+    _compute_cache_key,
+    _DomainOriginCache,
+    async_stencil_calls,
+    record_stencil_calls,
+)
 
 
 @pytest.mark.parametrize("backend", ["numpy"])
@@ -64,3 +74,303 @@ def test_stencil_object_cache(backend: str):
     assert len(stencil._domain_origin_cache) == 0
     cleaned_cache_time = runit(in_storage, out_storage, offset=1.0)
     assert cleaned_cache_time > fast_time
+
+
+@pytest.mark.parametrize("backend", ["numpy"])
+def test_stencil_object_cache_key(backend: str):
+    @gtscript.stencil(backend=backend)
+    def stencil(
+        in_field: Field[float],
+        out_field: Field[float],
+        unused_field: Field[float],
+        *,
+        offset: float,
+    ):
+        with computation(PARALLEL), interval(...):
+            out_field = (  # noqa: F841 # local variable 'out_field' is assigned to but never used
+                in_field + offset
+            )
+
+    shape = (4, 4, 4)
+    in_storage, out_storage = (
+        gt_storage.ones(backend=backend, default_origin=(0, 0, 0), shape=shape, dtype=float)
+        for _ in range(2)
+    )
+    field_args = dict(in_field=in_storage, out_field=out_storage, unused_field=None)
+    parameter_args = dict(offset=1.0)
+
+    key = stencil._compute_cache_key(field_args, parameter_args, None, (0, 0, 0))
+    assert key == stencil._compute_cache_key(field_args, parameter_args, None, (0, 0, 0))
+    assert key != stencil._compute_cache_key(field_args, parameter_args, (2, 2, 2), (0, 0, 0))
+    assert key != stencil._compute_cache_key(field_args, parameter_args, None, (1, 1, 0))
+    other_out_storage = gt_storage.ones(
+        backend=backend, default_origin=(1, 0, 0), shape=shape, dtype=float
+    )
+    assert key != stencil._compute_cache_key(
+        {**field_args, "out_field": other_out_storage}, parameter_args, None, (0, 0, 0)
+    )
+
+    # Fields which are not accessed do not take part in the key
+    assert key == stencil._compute_cache_key(
+        {**field_args, "unused_field": other_out_storage}, parameter_args, None, (0, 0, 0)
+    )
+
+    # Unhashable arguments are handled by the generic key function
+    dict_origin = {"_all_": (0, 0, 0)}
+    assert stencil._compute_cache_key(
+        field_args, parameter_args, [4, 4, 4], dict_origin
+    ) == _compute_cache_key(field_args, parameter_args, [4, 4, 4], dict_origin)
+
+
+@pytest.mark.parametrize("backend", ["numpy"])
+def test_stencil_object_cache_eviction(backend: str, monkeypatch):
+    @gtscript.stencil(backend=backend)
+    def stencil(in_field: Field[float], out_field: Field[float]):
+        with computation(PARALLEL), interval(...):
+            out_field = (  # noqa: F841 # local variable 'out_field' is assigned to but never used
+                in_field
+            )
+
+    monkeypatch.setitem(gt_config.cache_settings, "call_args_cache_size", 2)
+    stencil.clean_call_args_cache()
+
+    shape = (4, 4, 4)
+    in_storage = gt_storage.ones(
+        backend=backend, default_origin=(0, 0, 0), shape=shape, dtype=float
+    )
+    out_storage = gt_storage.ones(
+        backend=backend, default_origin=(0, 0, 0), shape=shape, dtype=float
+    )
+
+    for domain in [(1, 1, 1), (2, 2, 2), (1, 1, 1), (3, 3, 3), (2, 2, 2)]:
+        stencil(in_storage, out_storage, domain=domain)
+
+    # (2, 2, 2) is evicted by (3, 3, 3) since (1, 1, 1) was used more recently
+    cache_info = stencil.call_args_cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 4
+    assert cache_info.evictions == 2
+    assert cache_info.maxsize == 2
+    assert cache_info.currsize == len(stencil._domain_origin_cache) == 2
+
+    stencil.clean_call_args_cache()
+    assert stencil.call_args_cache_info() == (0, 0, 0, 2, 0)
+
+
+def test_domain_origin_cache_concurrent_access(monkeypatch):
+    monkeypatch.setitem(gt_config.cache_settings, "call_args_cache_size", 2)
+    cache = _DomainOriginCache()
+    calls_per_thread = 10000
+
+    def get_or_put(thread_index):
+        for i in range(calls_per_thread):
+            key = (thread_index + i) % 3
+            if cache.get(key) is None:
+                cache.put(key, ((1, 1, 1), {}))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        # results are retrieved to raise the exceptions of the threads
+        list(executor.map(get_or_put, range(4)))
+
+    cache_info = cache.info()
+    assert cache_info.hits + cache_info.misses == 4 * calls_per_thread
+    assert cache_info.currsize == 2
+
+
+@pytest.mark.parametrize("backend", ["numpy"])
+def test_stencil_object_call_fast_path(backend: str):
+    @gtscript.stencil(backend=backend)
+    def stencil(in_field: Field[float], out_field: Field[float], *, offset: float):
+        with computation(PARALLEL), interval(...):
+            out_field = (  # noqa: F841 # local variable 'out_field' is assigned to but never used
+                in_field + offset
+            )
+
+    shape = (4, 4, 4)
+    in_storage = gt_storage.ones(
+        backend=backend, default_origin=(0, 0, 0), shape=shape, dtype=float
+    )
+    out_storage = gt_storage.zeros(
+        backend=backend, default_origin=(0, 0, 0), shape=shape, dtype=float
+    )
+    stencil.clean_call_args_cache()
+
+    stencil(in_storage, out_storage, offset=1.0)
+    stencil(in_storage, out_storage, offset=2.0)
+    assert stencil.call_args_cache_info()[:2] == (1, 1)
+    assert (out_storage == 3.0).all()
+
+    # The generic call path shares the cache entries of the generated __call__
+    stencil._call_run(
+        field_args=dict(in_field=in_storage, out_field=out_storage),
+        parameter_args=dict(offset=3.0),
+        domain=None,
+        origin=None,
+    )
+    assert stencil.call_args_cache_info()[:2] == (2, 1)
+    assert (out_storage == 4.0).all()
+
+    # Unhashable origins take the generic path
+    stencil(in_storage, out_storage, offset=1.0, origin={"_all_": (1, 1, 0)}, domain=(3, 3, 4))
+    stencil(in_storage, out_storage, offset=1.0, origin={"_all_": (1, 1, 0)}, domain=(3, 3, 4))
+    assert stencil.call_args_cache_info()[:2] == (3, 2)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "gt:cpu_ifirst"])
+def test_stencil_program_replay(backend: str):
+    @gtscript.stencil(backend=backend)
+    def add_offset(in_field: Field[float], out_field: Field[float], *, offset: float):
+        with computation(PARALLEL), interval(...):
+            out_field = (  # noqa: F841 # local variable 'out_field' is assigned to but never used
+                in_field + offset
+            )
+
+    @gtscript.stencil(backend=backend)
+    def copy(in_field: Field[float], out_field: Field[float]):
+        with computation(PARALLEL), interval(...):
+            out_field = (  # noqa: F841 # local variable 'out_field' is assigned to but never used
+                in_field
+            )
+
+    shape = (4, 4, 4)
+    a_storage = gt_storage.zeros(
+        backend=backend, default_origin=(0, 0, 0), shape=shape, dtype=float
+    )
+    b_storage = gt_storage.zeros(
+        backend=backend, default_origin=(0, 0, 0), shape=shape, dtype=float
+    )
+    frozen_copy = copy.freeze(origin={"in_field": (0, 0, 0), "out_field": (0, 0, 0)}, domain=shape)
+
+    with record_stencil_calls() as timestep:
+        add_offset(a_storage, b_storage, offset=1.0)
+        frozen_copy(in_field=b_storage, out_field=a_storage)
+        with pytest.raises(RuntimeError, match="already"):
+            with record_stencil_calls():
+                pass
+
+    assert len(timestep) == 2
+    assert (a_storage == 1.0).all()
+
+    for _ in range(3):
+        timestep()
+    assert (a_storage == 4.0).all() and (b_storage == 4.0).all()
+
+    # Calls outside of the recording context are not recorded
+    add_offset(a_storage, b_storage, offset=1.0)
+    assert len(timestep) == 2
+
+
+def test_stencil_program_native_steps():
+    replayed = []
+
+    def run_computations(computations):
+        replayed.append(list(computations))
+
+    class Stencil:
+        def __init__(self, native):
+            self.native = native
+
+        def run(self, _domain_, _origin_, exec_info, *, value):
+            replayed.append(value)
+
+        def _bind_run(self, _domain_, _origin_, *, value):
+            return (value, run_computations) if self.native else None
+
+    program = StencilProgram()
+    for value, native in enumerate([True, True, False, True]):
+        program.record(Stencil(native), (1, 1, 1), {}, dict(value=value))
+
+    # consecutive native computations are run by a single call
+    assert len(program) == 4
+    program()
+    assert replayed == [[0, 1], 2, [3]]
+
+
+@pytest.mark.parametrize("backend", ["numpy"])
+def test_async_stencil_calls(backend: str):
+    @gtscript.stencil(backend=backend)
+    def add_offset(in_field: Field[float], out_field: Field[float], *, offset: float):
+        with computation(PARALLEL), interval(...):
+            out_field = (  # noqa: F841 # local variable 'out_field' is assigned to but never used
+                in_field + offset
+            )
+
+    shape = (16, 16, 16)
+    a, b, c, d = (
+        gt_storage.zeros(backend=backend, default_origin=(0, 0, 0), shape=shape, dtype=float)
+        for _ in range(4)
+    )
+    frozen_add_offset = add_offset.freeze(
+        origin={"in_field": (0, 0, 0), "out_field": (0, 0, 0)}, domain=shape
+    )
+
+    with async_stencil_calls(max_workers=4) as executor:
+        futures = [
+            add_offset(a, b, offset=1.0),
+            add_offset(c, d, offset=2.0),  # independent
+            add_offset(b, c, offset=3.0),  # reads b (RAW), writes c (WAR)
+            frozen_add_offset(in_field=c, out_field=a, offset=4.0),  # RAW on c, WAR on a
+        ]
+        assert all(isinstance(future, concurrent.futures.Future) for future in futures)
+        executor.wait()
+        assert all(future.done() for future in futures)
+
+    assert (b == 1.0).all()
+    assert (d == 2.0).all()
+    assert (c == 4.0).all()
+    assert (a == 8.0).all()
+
+    # Regular synchronous calls outside of the context
+    assert add_offset(a, b, offset=1.0) is None
+    assert (b == 9.0).all()
+
+    with pytest.raises(ValueError, match="exec_info"):
+        with async_stencil_calls():
+            add_offset(a, b, offset=1.0, exec_info={})
+
+
+@pytest.mark.parametrize("backend", ["numpy", "gt:cpu_ifirst"])
+def test_threaded_stencil_calls(backend: str):
+    @gtscript.stencil(backend=backend)
+    def smooth(in_field: Field[float], out_field: Field[float]):
+        with computation(PARALLEL), interval(...):
+            out_field = (  # noqa: F841 # local variable 'out_field' is assigned to but never used
+                in_field[-1, 0, 0] + in_field[1, 0, 0] + in_field[0, -1, 0] + in_field[0, 1, 0]
+            ) / 4.0
+
+    n_threads = 4
+    shape = (66, 66, 80)
+    rng = np.random.default_rng(0)
+    in_storages = [
+        gt_storage.from_array(
+            rng.random(shape), backend=backend, default_origin=(1, 1, 0), dtype=float
+        )
+        for _ in range(n_threads)
+    ]
+
+    def make_out_storages():
+        return [
+            gt_storage.zeros(backend=backend, default_origin=(1, 1, 0), shape=shape, dtype=float)
+            for _ in range(n_threads)
+        ]
+
+    def run_calls(in_storage, out_storage):
+        for _ in range(20):
+            smooth(in_storage, out_storage)
+
+    sequential_out_storages = make_out_storages()
+    for in_storage, out_storage in zip(in_storages, sequential_out_storages):
+        run_calls(in_storage, out_storage)
+
+    # the bindings release the GIL during the computation, so the calls run concurrently
+    threaded_out_storages = make_out_storages()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=n_threads) as pool:
+        futures = [
+            pool.submit(run_calls, in_storage, out_storage)
+            for in_storage, out_storage in zip(in_storages, threaded_out_storages)
+        ]
+        for future in futures:
+            future.result()
+
+    for sequential_out, threaded_out in zip(sequential_out_storages, threaded_out_storages):
+        np.testing.assert_array_equal(np.asarray(threaded_out), np.asarray(sequential_out))
@@ -201,6 +201,7 @@ def test_toolchain_profiling(backend_name: str, mode: int, rebuild: bool):
         if backend_name.startswith("gt") and not backend_name.endswith("numpy"):
             assert build_info["codegen_time"] > 0.0
             assert build_info["build_time"] > 0.0
+            assert build_info["compile_time"] > 0.0
     else:
         assert build_info["load_time"] > 0.0
 
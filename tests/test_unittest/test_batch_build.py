@@ -0,0 +1,81 @@
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Test building many stencils at once."""
+
+import concurrent.futures
+import os
+import threading
+
+import gt4py
+from gt4py.backend import pyext_builder
+from gt4py.batch_build import _ParallelBuildRunner
+from gt4py.gtscript import PARALLEL, Field, computation, interval, lazy_stencil
+from gt4py.stencil_builder import StencilBuilder
+from gt4py.stencil_object import StencilObject
+
+
+def copy_stencil_definition(out_f: Field[float], in_f: Field[float]):  # type: ignore
+    """Copy input into output."""
+    with computation(PARALLEL), interval(...):  # type: ignore
+        out_f = in_f  # type: ignore # noqa
+
+
+def scale_stencil_definition(out_f: Field[float], in_f: Field[float]):  # type: ignore
+    """Scale input into output."""
+    with computation(PARALLEL), interval(...):  # type: ignore
+        out_f = 2.0 * in_f  # type: ignore # noqa
+
+
+def test_build_all():
+    lazy = lazy_stencil(backend="numpy", definition=copy_stencil_definition)
+    builder = StencilBuilder(scale_stencil_definition, backend="numpy")
+    stencils = gt4py.build_all(
+        [lazy, builder, copy_stencil_definition], backend="numpy", name="copy_by_name"
+    )
+    assert all(isinstance(stencil, StencilObject) for stencil in stencils)
+    assert stencils[0] is lazy.implementation
+    assert [stencil.options["name"] for stencil in stencils] == [
+        "copy_stencil_definition",
+        "scale_stencil_definition",
+        "copy_by_name",
+    ]
+
+
+def test_parallel_build_runner_releases_lock():
+    lock = threading.Lock()
+
+    def acquire_and_release():
+        acquired = lock.acquire(timeout=10)
+        if acquired:
+            lock.release()
+        return acquired
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        runner = _ParallelBuildRunner(executor, lock)
+        with lock:
+            assert runner(acquire_and_release)
+            assert lock.locked()
+
+
+def test_run_build_in_worker_process():
+    lock = threading.Lock()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+        token = pyext_builder.build_runner.set(_ParallelBuildRunner(executor, lock))
+        try:
+            with lock:
+                assert pyext_builder.run_build(os.getpid) != os.getpid()
+        finally:
+            pyext_builder.build_runner.reset(token)
+    assert pyext_builder.run_build(os.getpid) == os.getpid()
@@ -12,9 +12,12 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import pathlib
+
 import pytest
 
 import gt4py
+from gt4py.backend import pyext_builder
 from gt4py.gtscript import PARALLEL, Field, computation, interval
 from gt4py.stencil_builder import StencilBuilder
 
@@ -33,6 +36,21 @@ def simple_stencil_same(field: Field[float]):  # type: ignore
         field += 1  # type: ignore
 
 
+def simple_stencil_decrement(field: Field[float]):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        field -= 1  # type: ignore
+
+
+def large_literal_stencil(field: Field[float]):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        field += 1234567890123  # type: ignore
+
+
+def other_large_literal_stencil(field: Field[float]):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        field += 1234567890124  # type: ignore
+
+
 def simple_stencil_with_doc(field: Field[float]):  # type: ignore
     """Increment the in/out field by one."""
     with computation(PARALLEL), interval(...):  # type: ignore
@@ -160,3 +178,47 @@ def test_nocaching_generate(builder, tmp_path):
     builder_g.backend.generate()
 
     assert_nocaching_gtcpp_source_file_tree_conforms_to_expectations(tmp_path / "foo_g", "foo")
+
+
+def test_compiled_objects_cache(builder, tmp_path, monkeypatch):
+    monkeypatch.setitem(gt4py.config.cache_settings, "root_path", str(tmp_path))
+    built_names = []
+
+    def fake_build(name, sources, build_path, target_path, **kwargs):
+        built_names.append(name)
+        file_path = pathlib.Path(target_path) / f"{name.rpartition('.')[2]}.so"
+        file_path.write_text(pathlib.Path(sources[0]).read_text())
+        return name, str(file_path)
+
+    monkeypatch.setattr(
+        pyext_builder, "run_build", lambda build_func, **kwargs: fake_build(**kwargs)
+    )
+
+    def build_extension(definition, name):
+        stencil_builder = builder(definition, "gt:cpu_kfirst").with_options(
+            name=name, module=__name__
+        )
+        backend = stencil_builder.backend
+        sources = backend.make_extension_sources(stencil_ir=stencil_builder.gtir)
+        return backend.build_extension_module(
+            {**sources["computation"], **sources["bindings"]}, {"verbose": False}
+        )
+
+    module_name, file_path = build_extension(simple_stencil, "foo")
+    other_module_name, other_file_path = build_extension(simple_stencil_same, "bar")
+
+    assert len(built_names) == 1
+    assert module_name == built_names[0]
+    # the extension module compiled for "foo" is copied into the package of "bar"
+    assert other_module_name.rpartition(".")[2] == module_name.rpartition(".")[2]
+    assert ".bar." in other_module_name
+    assert pathlib.Path(other_file_path).read_text() == pathlib.Path(file_path).read_text()
+    assert pathlib.Path(other_file_path).parent != pathlib.Path(file_path).parent
+
+    build_extension(simple_stencil_decrement, "baz")
+    assert len(built_names) == 2
+
+    # only the ids of nodes are normalized, not the numbers in the code
+    build_extension(large_literal_stencil, "large_literal")
+    build_extension(other_large_literal_stencil, "other_large_literal")
+    assert len(built_names) == 4
@@ -14,6 +14,7 @@
 
 """Unit tests for the command line interface (CLI)."""
 
+import pathlib
 import re
 import sys
 
@@ -21,6 +22,7 @@ import pytest
 from click.testing import CliRunner
 
 from gt4py import backend, cli
+from gt4py.backend import pyext_builder
 from gt4py.backend.base import CLIBackendMixin
 
 from ..definitions import ALL_BACKENDS
@@ -97,6 +99,7 @@ BACKEND_ROW_PATTERN_BY_NAME = {
     "gt:cpu_ifirst": r"^\s*gt:cpu_ifirst\s*c\+\+\s*python\s*Yes",
     "gt:cpu_kfirst": r"^\s*gt:cpu_kfirst\s*c\+\+\s*python\s*Yes",
     "gt:gpu": r"^\s*gt:gpu\s*cuda\s*python\s*Yes",
+    "numba": r"^\s*numba\s*python\s*python\s*Yes",
     "numpy": r"^\s*numpy\s*python\s*python\s*Yes",
     "nocli": r"^\s*nocli\s*\?\s*\?\s*No",
 }
@@ -265,3 +268,62 @@ def test_write_computation_src(tmp_path, simple_stencil):
     assert src.exists() and src.is_dir()
     assert header.exists() and header.read_text() == test_src[toplevel]["include"]["header.hpp"]
     assert main.exists() and main.read_text() == test_src[toplevel]["src"]["main.cpp"]
+
+
+def test_build(clirunner, simple_stencil):
+    """Build the stencils of a module into the cache."""
+    result = clirunner.invoke(
+        cli.gtpyc,
+        ["build", "--backend=numpy", "-j", "2", str(simple_stencil)],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    assert "Building 1 stencils" in result.output
+
+
+def test_gen_bundle(clirunner, simple_stencil, tmp_path, monkeypatch):
+    """Bundle the extension modules of all stencils, without compiling them."""
+    output_path = tmp_path / "test_gen_bundle"
+    built_sources = []
+
+    def fake_build(build_func, *, name, sources, target_path, **kwargs):
+        built_sources.extend(sources)
+        file_path = pathlib.Path(target_path) / f"{name.rpartition('.')[2]}.so"
+        file_path.touch()
+        return name, str(file_path)
+
+    monkeypatch.setattr(pyext_builder, "run_build", fake_build)
+    result = clirunner.invoke(
+        cli.gtpyc,
+        [
+            "gen",
+            f"--output-path={output_path}",
+            "--backend=gt:cpu_kfirst",
+            "--bundle",
+            str(simple_stencil),
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0, result.output
+
+    src_path = output_path / "stencil_bundle_src"
+    assert sorted(pathlib.Path(source).name for source in built_sources) == [
+        "bundle.cpp",
+        "init_1_entry.cpp",
+    ]
+    assert (src_path / "init_1" / "bindings.cpp").exists()
+    assert 'm.def_submodule("init_1")' in (src_path / "bundle.cpp").read_text()
+    assert (output_path / "_stencil_bundle.so").exists()
+    (stencil_module_path,) = output_path.glob("**/init_1.py")
+    assert ").init_1\n" in stencil_module_path.read_text()
+    assert "init_1 = getattr(" in (output_path / "stencil_bundle.py").read_text()
+
+
+def test_gen_bundle_python_backend(clirunner, simple_stencil, tmp_path):
+    """Only backends generating C++ extension modules can bundle stencils."""
+    result = clirunner.invoke(
+        cli.gtpyc,
+        ["gen", f"--output-path={tmp_path}", "--backend=numpy", "--bundle", str(simple_stencil)],
+    )
+    assert result.exit_code == 2
+    assert "can not bundle stencils" in result.output
@@ -15,7 +15,6 @@
 from pathlib import Path
 
 import pytest
-import setuptools
 
 from gt4py import (  # TODO(havogt) this is a dependency from gtc tests to gt4py, ok?
     config,
@@ -40,26 +39,13 @@ def build_gridtools_test(tmp_path: Path, code: str):
     opts = pyext_builder.get_gt_pyext_build_opts(uses_cuda=True)
     assert isinstance(opts["include_dirs"], list)
     opts["include_dirs"].append(config.GT2_INCLUDE_PATH)
-    ext_module = setuptools.Extension(
+    pyext_builder.build_pybind_cuda_ext(
         "test",
         [str(tmp_src.absolute())],
-        language="c++",
+        build_path=str(tmp_src.parent),
+        target_path=str(tmp_src.parent),
         **opts,
     )
-    args = [
-        "build_ext",
-        "--build-temp=" + str(tmp_src.parent),
-        "--build-lib=" + str(tmp_src.parent),
-        "--force",
-    ]
-    setuptools.setup(
-        name="test",
-        ext_modules=[
-            ext_module,
-        ],
-        script_args=args,
-        cmdclass={"build_ext": pyext_builder.CUDABuildExtension},
-    )
 
 
 def make_compilation_input_and_expected():
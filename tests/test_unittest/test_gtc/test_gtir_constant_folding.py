@@ -0,0 +1,156 @@
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pytest
+
+from gtc import gtir
+from gtc.common import ArithmeticOperator, BuiltInLiteral, DataType, LogicalOperator, NativeFunction
+from gtc.passes.gtir_constant_folding import _GTIRConstantFolding, fold_constants
+
+from .gtir_utils import (
+    BinaryOpFactory,
+    FieldAccessFactory,
+    FieldDeclFactory,
+    FieldIfStmtFactory,
+    LiteralFactory,
+    ParAssignStmtFactory,
+    ScalarIfStmtFactory,
+    StencilFactory,
+    VerticalLoopFactory,
+    WhileFactory,
+)
+
+
+TRUE = LiteralFactory(value=BuiltInLiteral.TRUE, dtype=DataType.BOOL)
+FALSE = LiteralFactory(value=BuiltInLiteral.FALSE, dtype=DataType.BOOL)
+
+
+def float64(value):
+    return LiteralFactory(value=value, dtype=DataType.FLOAT64)
+
+
+def test_fold_arithmetic():
+    testee = BinaryOpFactory(
+        op=ArithmeticOperator.DIV,
+        left=BinaryOpFactory(op=ArithmeticOperator.MUL, left=float64("2.0"), right=float64("9.81")),
+        right=float64("287.0"),
+    )
+    result = _GTIRConstantFolding().visit(testee)
+    assert isinstance(result, gtir.Literal)
+    assert result.dtype == DataType.FLOAT64
+    assert float(result.value) == 2.0 * 9.81 / 287.0
+
+
+def test_fold_float32_arithmetic():
+    testee = BinaryOpFactory(
+        op=ArithmeticOperator.ADD,
+        left=LiteralFactory(value="0.1", dtype=DataType.FLOAT32),
+        right=LiteralFactory(value="0.2", dtype=DataType.FLOAT32),
+    )
+    result = _GTIRConstantFolding().visit(testee)
+    assert result.dtype == DataType.FLOAT32
+    assert float(result.value) != 0.1 + 0.2
+
+
+def test_integer_overflow_not_folded():
+    int8 = LiteralFactory(value="100", dtype=DataType.INT8)
+    testee = BinaryOpFactory(op=ArithmeticOperator.ADD, left=int8, right=int8)
+    assert _GTIRConstantFolding().visit(testee) == testee
+
+
+@pytest.mark.parametrize(
+    ["func", "folded"], [(NativeFunction.SQRT, True), (NativeFunction.EXP, False)]
+)
+def test_fold_native_function_call(func, folded):
+    testee = gtir.NativeFuncCall(func=func, args=[float64("4.0")])
+    result = _GTIRConstantFolding().visit(testee)
+    assert isinstance(result, gtir.Literal) == folded
+
+
+@pytest.mark.parametrize(
+    ["op", "literal", "simplified"],
+    [
+        (ArithmeticOperator.MUL, "1.0", True),
+        (ArithmeticOperator.DIV, "1.0", True),
+        (ArithmeticOperator.SUB, "0.0", True),
+        (ArithmeticOperator.ADD, "-0.0", True),
+        (ArithmeticOperator.ADD, "0.0", False),
+        (ArithmeticOperator.MUL, "2.0", False),
+    ],
+)
+def test_arithmetic_identities(op, literal, simplified):
+    field = FieldAccessFactory(name="a", dtype=DataType.FLOAT64)
+    testee = BinaryOpFactory(op=op, left=field, right=float64(literal))
+    result = _GTIRConstantFolding().visit(testee)
+    assert (result == field) == simplified
+
+
+def test_logical_identities():
+    field = FieldAccessFactory(name="mask", dtype=DataType.BOOL)
+    assert (
+        _GTIRConstantFolding().visit(
+            BinaryOpFactory(op=LogicalOperator.AND, left=TRUE, right=field)
+        )
+        == field
+    )
+    assert (
+        _GTIRConstantFolding().visit(
+            BinaryOpFactory(op=LogicalOperator.AND, left=field, right=FALSE)
+        )
+        == FALSE
+    )
+    assert (
+        _GTIRConstantFolding().visit(BinaryOpFactory(op=LogicalOperator.OR, left=field, right=TRUE))
+        == TRUE
+    )
+
+
+def test_prune_statically_decided_branches():
+    testee = StencilFactory(
+        vertical_loops__0__body=[
+            ScalarIfStmtFactory(cond=TRUE, true_branch__body__0__left__name="taken"),
+            FieldIfStmtFactory(
+                cond=BinaryOpFactory(
+                    op=LogicalOperator.AND,
+                    left=FALSE,
+                    right=FieldAccessFactory(name="mask", dtype=DataType.BOOL),
+                ),
+                true_branch__body__0__left__name="not_taken",
+            ),
+            WhileFactory(cond=FALSE, body__0__left__name="not_executed"),
+            ParAssignStmtFactory(left__name="unconditional"),
+        ]
+    )
+    result = fold_constants(testee)
+    body = result.vertical_loops[0].body
+    assert [stmt.left.name for stmt in body] == ["taken", "unconditional"]
+
+
+def test_remove_vertical_loops_without_statements():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                temporaries=[FieldDeclFactory(name="tmp")],
+                body=[ScalarIfStmtFactory(cond=FALSE, true_branch__body__0__left__name="tmp")],
+            ),
+            VerticalLoopFactory(body__0__right__name="tmp"),
+        ]
+    )
+    result = fold_constants(testee)
+    (vertical_loop,) = result.vertical_loops
+    assert vertical_loop.body == testee.vertical_loops[1].body
+    assert [decl.name for decl in vertical_loop.temporaries] == ["tmp"]
+
+    result = fold_constants(StencilFactory(vertical_loops__0__body=[WhileFactory(cond=FALSE)]))
+    assert result.vertical_loops == []
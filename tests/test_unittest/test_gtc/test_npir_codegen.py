@@ -161,6 +161,24 @@ def test_field_slice(is_serial: bool) -> None:
         assert match.group("ku") == "K " + int_to_str(k_offset)
 
 
+def test_field_slice_origin() -> None:
+    field_decl = FieldDeclFactory(name="a", dimensions=(True, True, False))
+    temp_decl = TemporaryDeclFactory(name="b", offset=(2, 0))
+    result = NpirCodegen().visit(
+        VectorAssignFactory(
+            left=FieldSliceFactory(name="b"),
+            right=FieldSliceFactory(name="a", i_offset=-1, j_offset=1),
+        ),
+        ctx=NpirCodegen.BlockContext(),
+        symtable={"a": field_decl, "b": temp_decl},
+        is_serial=False,
+    )
+    assert (
+        result
+        == "b[i + 2:I + 2, j:J, k:K] = a[i + _a_i_ - 1:I + _a_i_ - 1, j + _a_j_ + 1:J + _a_j_ + 1, :]"
+    )
+
+
 def test_native_function() -> None:
     result = NpirCodegen().visit(
         NativeFuncCallFactory(
@@ -198,10 +216,65 @@ def test_vector_assign(left, is_serial: bool) -> None:
     assert right_str == f"right[i:I, j:J, {k_str_right}]"
 
 
+def test_vector_assign_inplace_ufuncs() -> None:
+    result = NpirCodegen().visit(
+        VectorAssignFactory(
+            left__name="out",
+            right=VectorArithmeticFactory(
+                left=VectorArithmeticFactory(
+                    left__name="a", right__name="b", op=common.ArithmeticOperator.MUL
+                ),
+                right=npir.VectorUnaryOp(
+                    op=common.UnaryOperator.NEG, expr=FieldSliceFactory(name="c")
+                ),
+                op=common.ArithmeticOperator.ADD,
+            ),
+        ),
+        ctx=NpirCodegen.BlockContext(),
+        inplace_ufuncs=True,
+        is_serial=False,
+    )
+    print(result)
+    assert result.split("\n") == [
+        "_s0_ = _ufunc_(_temporaries_, 0, np.multiply, np.float32, a[i:I, j:J, k:K], b[i:I, j:J, k:K])",
+        "_s1_ = _ufunc_(_temporaries_, 1, np.negative, np.float32, c[i:I, j:J, k:K])",
+        "np.add(_s0_, _s1_, out=out[i:I, j:J, k:K])",
+    ]
+
+
+def test_vector_assign_sparse_mask() -> None:
+    result = NpirCodegen().visit(
+        VectorAssignFactory(
+            left__name="out",
+            right=npir.VectorTernaryOp(
+                cond=FieldSliceFactory(name="mask", dtype=common.DataType.BOOL),
+                true_expr=VectorArithmeticFactory(left__name="a", right__name="b"),
+                false_expr=FieldSliceFactory(name="out"),
+            ),
+        ),
+        ctx=NpirCodegen.BlockContext(),
+        sparse_mask_density=0.1,
+        is_serial=False,
+    )
+    print(result)
+    assert result.split("\n") == [
+        "_target_ = out[i:I, j:J, k:K]",
+        "_mask_ = np.broadcast_to(mask[i:I, j:J, k:K], _target_.shape)",
+        "if np.count_nonzero(_mask_) <= 0.1 * _mask_.size:",
+        "    _idx_ = np.nonzero(_mask_)",
+        "    _target_[_idx_] = (_compress_(a[i:I, j:J, k:K], _mask_, _idx_) + "
+        "_compress_(b[i:I, j:J, k:K], _mask_, _idx_))",
+        "else:",
+        '    np.copyto(_target_, (a[i:I, j:J, k:K] + b[i:I, j:J, k:K]), where=_mask_, casting="unsafe")',
+    ]
+
+
 def test_field_definition() -> None:
     result = NpirCodegen().visit(FieldDeclFactory(name="a", dimensions=(True, True, False)))
     print(result)
-    assert result == "a = Field(a, _origin_['a'], (True, True, False))"
+    assert (
+        result == "a, (_a_i_, _a_j_, _a_k_) = _field_view_(a, _origin_['a'], (True, True, False))"
+    )
 
 
 def test_temp_definition() -> None:
@@ -209,7 +282,7 @@ def test_temp_definition() -> None:
         TemporaryDeclFactory(name="a", offset=(1, 2), padding=(3, 4), dtype=common.DataType.FLOAT32)
     )
     print(result)
-    assert result == "a = Field.empty((_dI_ + 3, _dJ_ + 4, _dK_), np.float32, (1, 2, 0))"
+    assert result == "a = _empty_(_temporaries_, 'a', (_dI_ + 3, _dJ_ + 4, _dK_), np.float32)"
 
 
 def test_vector_arithmetic() -> None:
@@ -285,6 +358,46 @@ def test_vertical_pass_par() -> None:
     assert match
 
 
+def test_vertical_pass_tiled(is_serial: bool) -> None:
+    result = NpirCodegen().visit(
+        VerticalPassFactory(
+            direction=common.LoopOrder.FORWARD if is_serial else common.LoopOrder.PARALLEL
+        ),
+        tiles=4,
+    )
+    print(result)
+    assert ("_run_tiled_(_horizontal_block_, j, J)" in result) is not is_serial
+
+
+def test_horizontal_block_tiled_with_region() -> None:
+    restricted = VectorAssignFactory(
+        left__name="b",
+        horizontal_mask=common.HorizontalMask(
+            i=common.HorizontalInterval.at_endpt(common.LevelMarker.START, 0),
+            j=common.HorizontalInterval.compute_domain(),
+        ),
+    )
+    result = NpirCodegen().visit(
+        HorizontalBlockFactory(
+            body=[
+                VectorAssignFactory(left__name="a"),
+                restricted,
+                VectorAssignFactory(left__name="c"),
+            ]
+        ),
+        is_serial=False,
+        is_tiled=True,
+    )
+    print(result)
+    lines = [line for line in result.split("\n") if line.strip()]
+    # The restricted statement runs on its region of the block, between the tiled statements
+    assert [line for line in lines if "_run_tiled_" in line] == [
+        "_run_tiled_(_horizontal_block_, j, J)"
+    ] * 2
+    restricted_line = next(line for line in lines if line.startswith("b["))
+    assert restricted_line.startswith("b[i:i + 1, j:J, k:K]")
+
+
 def test_computation() -> None:
     result = NpirCodegen().visit(
         ComputationFactory(
@@ -296,11 +409,13 @@ def test_computation() -> None:
     print(result)
     match = re.match(
         (
-            r"import numbers\n"
+            r"import collections\n"
+            r"import threading\n"
             r"from typing import Tuple\n+"
             r"import numpy as np\n"
             r"import scipy.special\n+"
-            r"class Field:\n"
+            r"from gt4py import config as gt_config\n+"
+            r"def _field_view_\(.*\n"
             r"(.*\n)+"
             r"def run\(\*, a, b, _domain_, _origin_\):\n"
             r"\n?"
@@ -381,3 +496,40 @@ def test_variable_read_outside_bounds(tmp_path) -> None:
         _domain_=a.shape,
         _origin_={"a": (0, 0, 0), "b": (0, 0, 0), "index": (0, 0, 0)},
     )
+
+
+def test_variable_read_uniform_offset(tmp_path) -> None:
+    """Variable K offsets equal in all columns are clipped once per pass and read with np.take."""
+    computation = ComputationFactory(
+        vertical_passes__0__body__0__body__0=VectorAssignFactory(
+            left__name="a",
+            right=FieldSliceFactory(
+                name="b",
+                k_offset=npir.VarKOffset(k=ParamAccessFactory(name="off")),
+            ),
+        ),
+        param_decls=[ScalarDeclFactory(name="off", dtype=common.DataType.INT32)],
+    )
+
+    result = NpirCodegen().visit(computation)
+    print(result)
+    assert "_clip_k_(b, lk + off + _b_k_)" in result
+    assert "np.take(b[" in result
+    mod_path = tmp_path / "npir_codegen_3.py"
+    mod_path.write_text(result)
+
+    sys.path.append(str(tmp_path))
+    import npir_codegen_3 as mod
+
+    a = np.empty((2, 2, 5))
+    b = np.empty_like(a)
+    b[...] = np.arange(5)
+
+    mod.run(
+        a=a,
+        b=b,
+        off=2,
+        _domain_=a.shape,
+        _origin_={"a": (0, 0, 0), "b": (0, 0, 0)},
+    )
+    assert (a == np.minimum(np.arange(5) + 2, 4)).all()
@@ -0,0 +1,97 @@
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+from gtc import common
+from gtc.numpy.serial_loop_fission import SerialLoopFission
+from tests.test_unittest.test_gtc.npir_utils import (
+    ComputationFactory,
+    FieldSliceFactory,
+    HorizontalBlockFactory,
+    VectorArithmeticFactory,
+    VectorAssignFactory,
+    VerticalPassFactory,
+)
+
+
+def _forward_pass(*stmts):
+    return VerticalPassFactory(
+        body=[HorizontalBlockFactory(body=list(stmts))], direction=common.LoopOrder.FORWARD
+    )
+
+
+def test_level_local_statements_are_hoisted() -> None:
+    computation = ComputationFactory(
+        vertical_passes=[
+            _forward_pass(
+                VectorAssignFactory(
+                    left=FieldSliceFactory(name="tmp"),
+                    right=VectorArithmeticFactory(
+                        left=FieldSliceFactory(name="a"), right=FieldSliceFactory(name="b")
+                    ),
+                ),
+                VectorAssignFactory(
+                    left=FieldSliceFactory(name="out"),
+                    right=VectorArithmeticFactory(
+                        left=FieldSliceFactory(name="tmp"),
+                        right=FieldSliceFactory(name="out", k_offset=-1),
+                    ),
+                ),
+            )
+        ]
+    )
+    computation = SerialLoopFission().visit(computation)
+
+    parallel_pass, serial_pass = computation.vertical_passes
+    assert parallel_pass.direction == common.LoopOrder.PARALLEL
+    assert [stmt.left.name for stmt in parallel_pass.body[0].body] == ["tmp"]
+    assert serial_pass.direction == common.LoopOrder.FORWARD
+    assert [stmt.left.name for stmt in serial_pass.body[0].body] == ["out"]
+
+
+def test_carried_dependencies_are_not_hoisted() -> None:
+    computation = ComputationFactory(
+        vertical_passes=[
+            _forward_pass(
+                VectorAssignFactory(
+                    left=FieldSliceFactory(name="out"),
+                    right=VectorArithmeticFactory(
+                        left=FieldSliceFactory(name="in"),
+                        right=FieldSliceFactory(name="out", k_offset=-1),
+                    ),
+                ),
+                # reads a value computed in the serial loop
+                VectorAssignFactory(
+                    left=FieldSliceFactory(name="tmp"), right=FieldSliceFactory(name="out")
+                ),
+                # overwrites a field read before in the serial loop
+                VectorAssignFactory(
+                    left=FieldSliceFactory(name="in"), right=FieldSliceFactory(name="a")
+                ),
+            )
+        ]
+    )
+    computation = SerialLoopFission().visit(computation)
+
+    (serial_pass,) = computation.vertical_passes
+    assert serial_pass.direction == common.LoopOrder.FORWARD
+    assert [stmt.left.name for stmt in serial_pass.body[0].body] == ["out", "tmp", "in"]
+
+
+def test_parallel_passes_are_unchanged() -> None:
+    computation = SerialLoopFission().visit(ComputationFactory())
+
+    (parallel_pass,) = computation.vertical_passes
+    assert parallel_pass.direction == common.LoopOrder.PARALLEL
+    assert len(parallel_pass.body[0].body) == 1
@@ -0,0 +1,97 @@
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import re
+
+from gtc.common import LoopOrder
+from gtc.numba.numba_codegen import NumbaCodegen
+
+from .oir_utils import (
+    AssignStmtFactory,
+    HorizontalExecutionFactory,
+    StencilFactory,
+    VerticalLoopFactory,
+)
+
+
+def test_parallel_loop_nest():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+            left__name="out", right__name="inp"
+        )
+    )
+    result = NumbaCodegen.apply(testee)
+    assert "@numba.njit(parallel=True, cache=True)" in result
+    assert re.search(
+        r"for i in numba\.prange\(0, _dI_\):\s*"
+        r"for j in range\(0, _dJ_\):\s*"
+        r"for k in range\(0, _dK_\):\s*"
+        r"out\[i \+ _out_i_, j \+ _out_j_, k \+ _out_k_\] = inp\[i \+ _inp_i_, j \+ _inp_j_, k \+ _inp_k_\]",
+        result,
+    )
+
+
+def test_serial_loop_with_independent_columns():
+    testee = StencilFactory(
+        vertical_loops__0=VerticalLoopFactory(
+            loop_order=LoopOrder.FORWARD,
+            sections__0__horizontal_executions=[
+                HorizontalExecutionFactory(
+                    body__0=AssignStmtFactory(
+                        left__name="tmp", right__name="tmp", right__offset__k=-1
+                    )
+                ),
+                HorizontalExecutionFactory(
+                    body__0=AssignStmtFactory(left__name="out", right__name="tmp")
+                ),
+            ],
+        )
+    )
+    result = NumbaCodegen.apply(testee, parallel=False)
+    assert "@numba.njit(parallel=False, cache=True)" in result
+    # the vertical loop is moved inside the column loops and iterates over both statements
+    assert re.search(
+        r"for i in numba\.prange\(0, _dI_\):\s*"
+        r"for j in range\(0, _dJ_\):\s*"
+        r"for k in range\(0, _dK_\):\s*"
+        r"tmp\[[^\n]*\n\s*out\[",
+        result,
+    )
+
+
+def test_serial_loop_with_horizontal_dependency():
+    testee = StencilFactory(
+        vertical_loops__0=VerticalLoopFactory(
+            loop_order=LoopOrder.BACKWARD,
+            sections__0__horizontal_executions=[
+                HorizontalExecutionFactory(
+                    body__0=AssignStmtFactory(left__name="tmp", right__name="inp")
+                ),
+                HorizontalExecutionFactory(
+                    body__0=AssignStmtFactory(
+                        left__name="out", right__name="tmp", right__offset__i=1
+                    )
+                ),
+            ],
+        )
+    )
+    result = NumbaCodegen.apply(testee)
+    assert re.search(
+        r"for k in range\(_dK_ - 1, 0 - 1, -1\):\s*"
+        r"for i in numba\.prange\(0, _dI_ \+ 1\):\s*"
+        r"for j in range\(0, _dJ_\):\s*"
+        r"tmp\[[^\n]*\n\s*"
+        r"for i in numba\.prange\(0, _dI_\):",
+        result,
+    )
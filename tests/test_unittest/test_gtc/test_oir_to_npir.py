@@ -26,6 +26,7 @@ from .oir_utils import (
     FieldAccessFactory,
     FieldDeclFactory,
     HorizontalExecutionFactory,
+    HorizontalRestrictionFactory,
     LocalScalarFactory,
     MaskStmtFactory,
     NativeFuncCallFactory,
@@ -33,6 +34,7 @@ from .oir_utils import (
     StencilFactory,
     VerticalLoopFactory,
     VerticalLoopSectionFactory,
+    WhileFactory,
 )
 
 
@@ -97,6 +99,20 @@ def test_mask_propagation() -> None:
     assert assign_stmts[0].right.cond == OirToNpir().visit(mask_stmt.mask)
 
 
+def test_while_in_horizontal_restriction() -> None:
+    restriction = HorizontalRestrictionFactory(
+        mask=common.HorizontalMask(
+            i=common.HorizontalInterval.at_endpt(common.LevelMarker.START, 0),
+            j=common.HorizontalInterval.full(),
+        ),
+        body=[WhileFactory()],
+    )
+    (while_stmt,) = OirToNpir().visit(restriction, extent=Extent.zeros(ndims=2))
+    assert isinstance(while_stmt, npir.While)
+    assert while_stmt.horizontal_mask is not None
+    assert while_stmt.body[0].horizontal_mask == while_stmt.horizontal_mask
+
+
 def make_block_and_transform(**kwargs) -> npir.HorizontalBlock:
     oir_stencil = StencilFactory(
         vertical_loops__0__sections__0__horizontal_executions=[HorizontalExecutionFactory(**kwargs)]
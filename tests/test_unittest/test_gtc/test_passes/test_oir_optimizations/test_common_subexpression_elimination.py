@@ -0,0 +1,180 @@
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from gtc import common, oir
+from gtc.passes.oir_optimizations.common_subexpression_elimination import (
+    CommonSubexpressionElimination,
+)
+
+from ...oir_utils import (
+    AssignStmtFactory,
+    BinaryOpFactory,
+    FieldAccessFactory,
+    HorizontalExecutionFactory,
+    LocalScalarFactory,
+    MaskStmtFactory,
+    NativeFuncCallFactory,
+    ScalarAccessFactory,
+    StencilFactory,
+)
+
+
+def _horizontal_execution(stencil: oir.Stencil) -> oir.HorizontalExecution:
+    return stencil.vertical_loops[0].sections[0].horizontal_executions[0]
+
+
+def test_repeated_expression():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(
+                left__name="out1", right=BinaryOpFactory(left__name="a", right__name="b")
+            ),
+            AssignStmtFactory(
+                left__name="out2", right=BinaryOpFactory(left__name="a", right__name="b")
+            ),
+        ]
+    )
+    transformed = _horizontal_execution(CommonSubexpressionElimination().visit(testee))
+    assert len(transformed.declarations) == 1
+    scalar = transformed.declarations[0].name
+    assert len(transformed.body) == 3
+    assert transformed.body[0].left.name == scalar
+    assert isinstance(transformed.body[0].right, oir.BinaryOp)
+    for stmt in transformed.body[1:]:
+        assert isinstance(stmt.right, oir.ScalarAccess)
+        assert stmt.right.name == scalar
+
+
+def test_nested_repeated_expressions():
+    def expr():
+        return BinaryOpFactory(
+            op=common.ArithmeticOperator.MUL,
+            left=BinaryOpFactory(left__name="a", right__name="b"),
+            right=BinaryOpFactory(left__name="a", right__name="b"),
+        )
+
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(left__name="out1", right=expr()),
+            AssignStmtFactory(left__name="out2", right=expr()),
+        ]
+    )
+    transformed = _horizontal_execution(CommonSubexpressionElimination().visit(testee))
+    assert len(transformed.declarations) == 2
+    product, total = transformed.body[:2]
+    assert isinstance(product.right, oir.BinaryOp)
+    assert isinstance(total.right.left, oir.ScalarAccess)
+    assert total.right.left.name == total.right.right.name == product.left.name
+
+
+def test_not_eliminated_after_write():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(
+                left__name="out1", right=BinaryOpFactory(left__name="a", right__name="b")
+            ),
+            AssignStmtFactory(left__name="a", right__name="c"),
+            AssignStmtFactory(
+                left__name="out2", right=BinaryOpFactory(left__name="a", right__name="b")
+            ),
+        ]
+    )
+    transformed = _horizontal_execution(CommonSubexpressionElimination().visit(testee))
+    assert not transformed.declarations
+    assert len(transformed.body) == 3
+
+
+def test_reuse_assigned_scalar():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0=HorizontalExecutionFactory(
+            body=[
+                AssignStmtFactory(
+                    left=ScalarAccessFactory(name="tmp"),
+                    right=BinaryOpFactory(left__name="a", right__name="b"),
+                ),
+                AssignStmtFactory(
+                    left__name="out", right=BinaryOpFactory(left__name="a", right__name="b")
+                ),
+            ],
+            declarations=[LocalScalarFactory(name="tmp")],
+        )
+    )
+    transformed = _horizontal_execution(CommonSubexpressionElimination().visit(testee))
+    assert [decl.name for decl in transformed.declarations] == ["tmp"]
+    assert len(transformed.body) == 2
+    assert isinstance(transformed.body[1].right, oir.ScalarAccess)
+    assert transformed.body[1].right.name == "tmp"
+
+
+def _masked_exp(mask, out):
+    return MaskStmtFactory(
+        mask=FieldAccessFactory(name=mask, dtype=common.DataType.BOOL),
+        body=[
+            AssignStmtFactory(
+                left__name=out,
+                right=NativeFuncCallFactory(func=common.NativeFunction.EXP, args__0__name="a"),
+            )
+        ],
+    )
+
+
+def test_native_function_call_in_masks_not_hoisted():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            _masked_exp("mask1", "out1"),
+            _masked_exp("mask2", "out2"),
+        ]
+    )
+    transformed = _horizontal_execution(CommonSubexpressionElimination().visit(testee))
+    assert not transformed.declarations
+    assert transformed == _horizontal_execution(testee)
+
+
+def test_native_function_call_shared_with_masks():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            _masked_exp("mask1", "out1"),
+            AssignStmtFactory(
+                left__name="out2",
+                right=NativeFuncCallFactory(func=common.NativeFunction.EXP, args__0__name="a"),
+            ),
+        ]
+    )
+    transformed = _horizontal_execution(CommonSubexpressionElimination().visit(testee))
+    assert len(transformed.body) == 3
+    assert isinstance(transformed.body[0].right, oir.NativeFuncCall)
+    assert transformed.body[1].body[0].right.name == transformed.body[0].left.name
+    assert transformed.body[2].right.name == transformed.body[0].left.name
+
+
+def test_cheap_expression_in_masks_not_hoisted():
+    def masked_sum(mask, out):
+        return MaskStmtFactory(
+            mask=FieldAccessFactory(name=mask, dtype=common.DataType.BOOL),
+            body=[
+                AssignStmtFactory(
+                    left__name=out, right=BinaryOpFactory(left__name="a", right__name="b")
+                )
+            ],
+        )
+
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            masked_sum("mask1", "out1"),
+            masked_sum("mask2", "out2"),
+        ]
+    )
+    transformed = _horizontal_execution(CommonSubexpressionElimination().visit(testee))
+    assert not transformed.declarations
+    assert len(transformed.body) == 2
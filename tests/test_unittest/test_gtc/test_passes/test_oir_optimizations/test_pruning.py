@@ -13,7 +13,11 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from gtc.common import HorizontalInterval, HorizontalMask, LevelMarker
-from gtc.passes.oir_optimizations.pruning import NoFieldAccessPruning, UnreachableStmtPruning
+from gtc.passes.oir_optimizations.pruning import (
+    DeadStorePruning,
+    NoFieldAccessPruning,
+    UnreachableStmtPruning,
+)
 
 from ...oir_utils import (
     AssignStmtFactory,
@@ -22,8 +26,10 @@ from ...oir_utils import (
     HorizontalRestrictionFactory,
     LiteralFactory,
     LocalScalarFactory,
+    MaskStmtFactory,
     ScalarAccessFactory,
     StencilFactory,
+    TemporaryFactory,
     VerticalLoopFactory,
 )
 
@@ -144,3 +150,55 @@ def test_unreachable_stmt_pruning():
 
     stencil = UnreachableStmtPruning().visit(testee)
     assert len(stencil.vertical_loops[0].sections[0].horizontal_executions[1].body) == 2
+
+
+def test_dead_store_pruning_local_scalars():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0=HorizontalExecutionFactory(
+            body=[
+                AssignStmtFactory(left=ScalarAccessFactory(name="dead"), right__name="in"),
+                AssignStmtFactory(left=ScalarAccessFactory(name="tmp"), right__name="in"),
+                AssignStmtFactory(left=ScalarAccessFactory(name="tmp"), right__name="in2"),
+                MaskStmtFactory(
+                    body=[AssignStmtFactory(left=ScalarAccessFactory(name="tmp"), right__name="in")]
+                ),
+                AssignStmtFactory(left__name="out", right=ScalarAccessFactory(name="tmp")),
+            ],
+            declarations=[LocalScalarFactory(name="dead"), LocalScalarFactory(name="tmp")],
+        )
+    )
+    transformed = DeadStorePruning().visit(testee)
+    horizontal_execution = transformed.vertical_loops[0].sections[0].horizontal_executions[0]
+    assert [decl.name for decl in horizontal_execution.declarations] == ["tmp"]
+    assert len(horizontal_execution.body) == 3
+    assert horizontal_execution.body[0].right.name == "in2"
+
+
+def test_dead_store_pruning_temporaries():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions=[
+                    HorizontalExecutionFactory(
+                        body=[AssignStmtFactory(left__name="tmp", right__name="in")]
+                    ),
+                    HorizontalExecutionFactory(
+                        body=[AssignStmtFactory(left__name="out", right__name="tmp")]
+                    ),
+                    HorizontalExecutionFactory(
+                        body=[AssignStmtFactory(left__name="tmp2", right__name="in")]
+                    ),
+                ]
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body__0=AssignStmtFactory(
+                    left__name="tmp", right__name="tmp2"
+                )
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp"), TemporaryFactory(name="tmp2")],
+    )
+    transformed = DeadStorePruning().visit(testee)
+    assert len(transformed.vertical_loops) == 1
+    assert len(transformed.vertical_loops[0].sections[0].horizontal_executions) == 2
+    assert [decl.name for decl in transformed.declarations] == ["tmp"]
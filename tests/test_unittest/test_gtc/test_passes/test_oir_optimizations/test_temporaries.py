@@ -15,14 +15,17 @@
 from gtc import oir
 from gtc.passes.oir_optimizations.temporaries import (
     LocalTemporariesToScalars,
+    TemporaryStorageSharing,
     WriteBeforeReadTemporariesToScalars,
 )
 
 from ...oir_utils import (
     AssignStmtFactory,
     HorizontalExecutionFactory,
+    IJCacheFactory,
     StencilFactory,
     TemporaryFactory,
+    VerticalLoopFactory,
 )
 
 
@@ -98,3 +101,83 @@ def test_write_before_read_temporaries_to_scalars():
     assert not isinstance(hexec1.body[0].right, oir.ScalarAccess)
     assert isinstance(hexec1.body[1].left, oir.ScalarAccess)
     assert isinstance(hexec1.body[2].right, oir.ScalarAccess)
+
+
+def _two_lifetimes_stencil(**kwargs):
+    return StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions=[
+                    HorizontalExecutionFactory(body=[AssignStmtFactory(left__name="tmp1")]),
+                    HorizontalExecutionFactory(body=[AssignStmtFactory(right__name="tmp1")]),
+                ],
+                **kwargs,
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions=[
+                    HorizontalExecutionFactory(body=[AssignStmtFactory(left__name="tmp2")]),
+                    HorizontalExecutionFactory(body=[AssignStmtFactory(right__name="tmp2")]),
+                ]
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp1"), TemporaryFactory(name="tmp2")],
+    )
+
+
+def test_temporary_storage_sharing():
+    transformed = TemporaryStorageSharing().visit(_two_lifetimes_stencil())
+    assert [decl.name for decl in transformed.declarations] == ["tmp1"]
+    accessed_fields = transformed.iter_tree().if_isinstance(oir.FieldAccess).getattr("name")
+    assert "tmp2" not in accessed_fields.to_set()
+
+
+def test_temporary_storage_sharing_overlapping_lifetimes():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="tmp1"),
+                    AssignStmtFactory(left__name="tmp2"),
+                ]
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(right__name="tmp1"),
+                    AssignStmtFactory(right__name="tmp2"),
+                ]
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp1"), TemporaryFactory(name="tmp2")],
+    )
+    transformed = TemporaryStorageSharing().visit(testee)
+    assert len(transformed.declarations) == 2
+
+
+def test_temporary_storage_sharing_skips_cached():
+    testee = _two_lifetimes_stencil(caches=[IJCacheFactory(name="tmp1")])
+    transformed = TemporaryStorageSharing().visit(testee)
+    assert len(transformed.declarations) == 2
+
+
+def test_temporary_storage_sharing_keeps_compute_extents():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions=[
+                    HorizontalExecutionFactory(body=[AssignStmtFactory(left__name="tmp1")]),
+                    HorizontalExecutionFactory(body=[AssignStmtFactory(right__name="tmp1")]),
+                ]
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions=[
+                    HorizontalExecutionFactory(body=[AssignStmtFactory(left__name="tmp2")]),
+                    HorizontalExecutionFactory(
+                        body=[AssignStmtFactory(right__name="tmp2", right__offset__i=1)]
+                    ),
+                ]
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp1"), TemporaryFactory(name="tmp2")],
+    )
+    transformed = TemporaryStorageSharing().visit(testee)
+    assert len(transformed.declarations) == 2
@@ -0,0 +1,161 @@
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2022, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import concurrent.futures
+import os
+import subprocess
+import threading
+import time
+
+import pytest
+
+from gt4py import config as gt_config
+from gt4py import utils as gt_utils
+from gt4py.backend import bundle, pyext_builder
+
+
+BINDINGS_TEMPLATE = """
+#include <pybind11/pybind11.h>
+
+PYBIND11_MODULE({name}, m) {{
+    m.def("answer", []() {{ return {value}; }});
+}}
+"""
+
+
+def build_module(tmp_path, name, value, **kwargs):
+    source_path = tmp_path / f"{name}.cpp"
+    source_path.write_text(BINDINGS_TEMPLATE.format(name=name, value=value))
+    return pyext_builder.build_pybind_ext(
+        f"test_pkg.{name}",
+        [str(source_path)],
+        str(tmp_path / f"{name}_BUILD"),
+        str(tmp_path / "test_pkg"),
+        extra_compile_args=["-std=c++14"],
+        **kwargs,
+    )
+
+
+def test_build_pybind_ext(tmp_path):
+    module_name, file_path = build_module(tmp_path, "answer_ext", 42, clean=True)
+    assert module_name == "test_pkg.answer_ext"
+    assert not (tmp_path / "answer_ext_BUILD").exists()
+    assert gt_utils.make_module_from_file(module_name, file_path).answer() == 42
+
+
+def test_build_pybind_ext_concurrently(tmp_path):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(build_module, tmp_path, f"answer_ext_{value}", value)
+            for value in (1, 2)
+        ]
+        results = [future.result() for future in futures]
+    for value, (module_name, file_path) in zip((1, 2), results):
+        assert gt_utils.make_module_from_file(module_name, file_path).answer() == value
+    # no temporary files are left behind
+    assert len(list((tmp_path / "test_pkg").iterdir())) == 2
+
+
+def test_build_pybind_ext_with_precompiled_header(tmp_path):
+    include_dir = tmp_path / "include"
+    include_dir.mkdir()
+    header_path = include_dir / "answer.h"
+    header_path.write_text("#pragma once\nconstexpr int default_answer = 42;\n")
+    pch_dir = tmp_path / "precompiled_headers"
+    pch_opts = dict(
+        include_dirs=[str(include_dir)],
+        precompiled_includes=["pybind11/pybind11.h", "answer.h"],
+        precompiled_header_dir=str(pch_dir),
+    )
+
+    module_name, file_path = build_module(tmp_path, "pch_ext", "default_answer", **pch_opts)
+    assert gt_utils.make_module_from_file(module_name, file_path).answer() == 42
+    (pch_path,) = pch_dir.glob("*/*.gch")
+    pch_mtime = pch_path.stat().st_mtime
+
+    # reused by other extension modules
+    build_module(tmp_path, "other_pch_ext", "default_answer", **pch_opts)
+    assert pch_path.stat().st_mtime == pch_mtime
+
+    # rebuilt when one of the headers changes
+    os.utime(header_path, (pch_mtime + 10, pch_mtime + 10))
+    build_module(tmp_path, "updated_pch_ext", "default_answer", **pch_opts)
+    assert pch_path.stat().st_mtime > pch_mtime
+
+
+def test_build_pybind_ext_error(tmp_path):
+    source_path = tmp_path / "broken.cpp"
+    source_path.write_text("not c++")
+    with pytest.raises(RuntimeError, match="broken.cpp"):
+        pyext_builder.build_pybind_ext(
+            "broken", [str(source_path)], str(tmp_path / "build"), str(tmp_path)
+        )
+
+
+def test_run_commands_parallel_jobs(monkeypatch):
+    monkeypatch.setitem(gt_config.build_settings, "parallel_jobs", 2)
+    running = []
+    max_running = 0
+    lock = threading.Lock()
+
+    def fake_run(command, **kwargs):
+        nonlocal max_running
+        with lock:
+            running.append(command)
+            max_running = max(max_running, len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(command)
+        return subprocess.CompletedProcess(command, int(command[0] == "fail"), "output")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    pyext_builder._run_commands([["compile", str(i)] for i in range(6)], verbose=False)
+    assert max_running == 2
+
+    with pytest.raises(RuntimeError, match="fail 1\noutput"):
+        pyext_builder._run_commands([["compile", "0"], ["fail", "1"]], verbose=False)
+
+
+def test_build_bundled_bindings(tmp_path):
+    sources = []
+    entries = {}
+    for name, value in (("first", 1), ("second", 2)):
+        # the bindings sources of all stencils have the same file name
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "bindings.cpp").write_text(
+            BINDINGS_TEMPLATE.format(name=f"_{name}", value=value)
+        )
+        entries[name] = bundle._entry_function(name)
+        entry_path = tmp_path / f"{name}_entry.cpp"
+        entry_path.write_text(
+            bundle.ENTRY_TEMPLATE.render(
+                stencil_name=name,
+                entry_function=entries[name],
+                bindings_path=f"{name}/bindings.cpp",
+            )
+        )
+        sources.append(str(entry_path))
+    bundle_path = tmp_path / "bundle.cpp"
+    bundle_path.write_text(bundle.BUNDLE_TEMPLATE.render(module_name="_bundle", entries=entries))
+
+    module_name, file_path = pyext_builder.build_pybind_ext(
+        "test_pkg._bundle",
+        [*sources, str(bundle_path)],
+        str(tmp_path / "bundle_BUILD"),
+        str(tmp_path / "test_pkg"),
+        extra_compile_args=["-std=c++14"],
+    )
+    module = gt_utils.make_module_from_file(module_name, file_path)
+    assert module.first.answer() == 1
+    assert module.second.answer() == 2